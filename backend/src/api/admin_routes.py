@@ -0,0 +1,55 @@
+# backend/src/api/admin_routes.py
+
+import asyncio
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from ..config.settings import settings
+from ..ml.transliteration_inference import engine
+from ..schemas.admin import ProfileCaptureStatus, ProfileRequest, ProfileResponse
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    # without a configured token the admin API doesn't exist
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token.encode("utf-8"), settings.ADMIN_TOKEN.encode("utf-8")
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+def _response(statuses) -> ProfileResponse:
+    return ProfileResponse(processes=[ProfileCaptureStatus(**s) for s in statuses])
+
+
+@router.post("/profile", response_model=ProfileResponse)
+async def start_profile(req: ProfileRequest) -> ProfileResponse:
+    """
+    Capture torch.profiler traces of the next `requests` model decodes
+    (only those for `target_lang`, if set) into PROFILE_DIR, one Chrome
+    trace and op summary per decode. Cache hits never reach the model and
+    aren't profiled. Posting again re-arms; `requests: 0` disarms.
+    """
+    count = min(max(req.requests, 0), settings.PROFILE_MAX_REQUESTS)
+    # waits for each worker process to go idle
+    statuses = await asyncio.get_running_loop().run_in_executor(
+        None, engine.arm_profiler, count, req.target_lang
+    )
+    return _response(statuses)
+
+
+@router.get("/profile", response_model=ProfileResponse)
+async def profile_status() -> ProfileResponse:
+    """Decodes left to profile and the traces written so far, per process."""
+    statuses = await asyncio.get_running_loop().run_in_executor(
+        None, engine.profiler_status
+    )
+    return _response(statuses)
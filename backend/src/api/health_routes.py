@@ -1,10 +1,25 @@
 # backend/src/api/health_routes.py
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from ..services.model_readiness import model_readiness
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
 async def health_check():
+    """Liveness: the process is up and serving requests."""
     return {"status": "ok", "message": "Backend is running"}
+
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    Readiness: 200 once every PRELOAD_LANGS model is loaded and warmed up,
+    503 until then (or if one failed). The body has each language's
+    state and its load / warmup duration.
+    """
+    status = model_readiness.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
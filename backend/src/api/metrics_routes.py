@@ -0,0 +1,36 @@
+# backend/src/api/metrics_routes.py
+
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..ml.batch_scheduler import scheduler
+from ..ml.transliteration_inference import engine
+from ..utils.metrics import MetricsRegistry, metrics, queue_depth
+
+router = APIRouter(tags=["metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _collect() -> str:
+    snapshot = metrics.snapshot()
+    # with INFERENCE_WORKERS > 0 caches and models live in the workers
+    for worker_snapshot in engine.worker_metrics():
+        MetricsRegistry.merge(snapshot, worker_snapshot)
+    return MetricsRegistry.render(snapshot)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus text exposition of request, stage, batch, queue and cache metrics."""
+    # queue depth is sampled at scrape time rather than on every job;
+    # read on the event loop, which owns the scheduler's pending buckets
+    stats = scheduler.stats()
+    queue_depth.set(stats["pending_words"], state="batching")
+    queue_depth.set(stats["executor"]["queued"], state="queued")
+    queue_depth.set(stats["executor"]["running"], state="running")
+
+    body = await asyncio.get_running_loop().run_in_executor(None, _collect)
+    return PlainTextResponse(body, media_type=CONTENT_TYPE)
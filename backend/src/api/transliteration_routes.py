@@ -1,13 +1,166 @@
 # backend/src/api/transliteration_routes.py
 
-from fastapi import APIRouter
+import asyncio
+from typing import Optional
 
-from ..schemas.transliteration import TransliterationRequest, TransliterationResponse
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from ..config.settings import settings
+from ..schemas.transliteration import (
+    Suggestion,
+    SuggestResponse,
+    TransliterationRequest,
+    TransliterationResponse,
+)
+from ..schemas.typing_session import TypingMessage
+from ..ml.batch_scheduler import scheduler
+from ..ml.bounded_executor import ExecutorOverloaded
+from ..ml.english_classifier import english_classifier
+from ..ml.lexicon import lexicons
+from ..ml.prefix_index import prefix_indexes
+from ..ml.transliteration_inference import engine
+from ..services.bulk_transliteration import BulkTransliterationPipeline
 from ..services.transliteration_service import transliteration_service
+from ..services.typing_session import TypingSession
 
 router = APIRouter(prefix="/transliterate", tags=["transliteration"])
 
 
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body is produced while the request body is
+    still being read. The stock class listens for client disconnects on
+    `receive` (ASGI spec < 2.4), which would swallow upload chunks; here the
+    request stream is the only reader and it sees the disconnect itself.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
 @router.post("", response_model=TransliterationResponse)
 async def transliterate(req: TransliterationRequest) -> TransliterationResponse:
-    return transliteration_service.transliterate(req)
+    try:
+        return await transliteration_service.transliterate_async(req)
+    except ExecutorOverloaded as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        )
+
+
+@router.post("/stream")
+async def transliterate_stream(
+    request: Request, target_lang: str, mode: str = "native"
+) -> StreamingResponse:
+    """
+    Bulk transliteration of a (chunked) upload, one line at a time.
+
+    Body: plain text, or NDJSON (Content-Type: application/x-ndjson) with
+    one {"text": ..., "id": ...} object or JSON string per line.
+    Response: NDJSON, one BulkLineResult / BulkLineError per input line,
+    in order, streamed while the upload is still being read.
+    """
+    content_type = request.headers.get("content-type", "")
+    ndjson = "ndjson" in content_type or "jsonl" in content_type
+    pipeline = BulkTransliterationPipeline(target_lang, mode, ndjson)
+    return _DuplexStreamingResponse(
+        pipeline.run(request.stream()), media_type="application/x-ndjson"
+    )
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest(
+    prefix: str = Query(..., min_length=1, max_length=64),
+    target_lang: str = Query(...),
+    limit: int = Query(5, ge=1),
+) -> SuggestResponse:
+    """
+    Keyboard autocomplete: the most common words starting with a roman
+    prefix, with their native spelling. Served from the prefix index,
+    without running the model; empty for languages without one.
+    """
+    limit = min(limit, settings.SUGGEST_MAX_RESULTS)
+    found = prefix_indexes.complete(prefix, target_lang, limit) or []
+    return SuggestResponse(
+        prefix=prefix,
+        target_lang=target_lang,
+        suggestions=[
+            Suggestion(roman=roman, native=native, score=score)
+            for roman, native, score in found
+        ],
+    )
+
+
+@router.get("/stats")
+async def transliteration_stats():
+    """Engine counters (models, caches, lexicon) and inference queue depth/wait."""
+    # blocks on the worker processes, if any
+    engine_stats = await asyncio.get_running_loop().run_in_executor(None, engine.stats)
+    return {
+        **engine_stats,
+        "lexicon": lexicons.stats(),
+        "english_classifier": english_classifier.stats(),
+        "prefix_index": prefix_indexes.stats(),
+        "scheduler": scheduler.stats(),
+    }
+
+
+@router.get("/workers/health")
+async def worker_health():
+    """Ping every idle inference worker; dead or hung workers are replaced."""
+    return await asyncio.get_running_loop().run_in_executor(None, engine.worker_health)
+
+
+@router.websocket("/ws")
+async def transliteration_session(websocket: WebSocket):
+    """
+    Incremental typing session.
+
+    The client sends TypingMessage JSON (full `text` or an `edit`) on every
+    keystroke; the server answers with a TypingDiff that only covers the
+    tokens that changed. A new message cancels the work still in flight
+    for the previous one, so only the latest keystroke gets a reply.
+    """
+    await websocket.accept()
+    session = TypingSession()
+    pending: Optional[asyncio.Task] = None
+
+    async def run(msg: TypingMessage, text: str) -> None:
+        try:
+            diff = await session.transliterate(msg, text)
+        except ExecutorOverloaded as e:
+            await websocket.send_json(
+                {"type": "error", "seq": msg.seq, "status": 503, "detail": str(e)}
+            )
+            return
+        await websocket.send_json(diff.model_dump())
+
+    try:
+        while True:
+            raw = await websocket.receive_json()
+            try:
+                msg = TypingMessage.model_validate(raw)
+            except ValidationError as e:
+                await websocket.send_json({"type": "error", "detail": e.errors()})
+                continue
+
+            if pending is not None and not pending.done():
+                pending.cancel()
+            text = session.apply(msg)
+            pending = asyncio.create_task(run(msg, text))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
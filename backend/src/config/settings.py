@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Union
+from typing import Dict, List, Union
 
 
 class Settings(BaseSettings):
@@ -20,6 +20,84 @@ class Settings(BaseSettings):
     # 👇 point to project-root/data/models
     MODEL_DIR: str = "../data/models"
 
+    # 🔹 Serving precision: "fp32", "int8" (dynamic quantization) or "bf16"
+    INFERENCE_PRECISION: str = "fp32"
+    INFERENCE_PRECISION_BY_LANG: Dict[str, str] = {}  # e.g. {"hi": "int8"}
+
+    # 🔹 Inference backend: "torch" or "onnx" (onnxruntime, see ml/export_onnx.py)
+    INFERENCE_BACKEND: str = "torch"
+
+    # 🔹 Load {lang}_greedy.ts (TorchScript, see ml/export_torchscript.py) if present
+    USE_COMPILED_MODELS: bool = True
+
+    # 🔹 Memory-map fp32 checkpoints so uvicorn workers share weight pages;
+    #    a compiled {lang}_greedy.ts reuses the mapped weights
+    #    (int8/bf16 conversion and CUDA still make private copies)
+    MODEL_MMAP: bool = True
+
+    # 🔹 Resident models per worker: LRU-evict languages beyond this many
+    #    weight bytes (0 = unlimited); pinned languages are never evicted
+    MODEL_MEMORY_BUDGET_BYTES: int = 0
+    PINNED_LANGS: List[str] = []
+    # failed loads back off exponentially: base, 2x base, ... up to max
+    MODEL_LOAD_RETRY_BASE_S: float = 1.0
+    MODEL_LOAD_RETRY_MAX_S: float = 60.0
+
+    # 🔹 Startup: load these languages in parallel and run warmup decodes;
+    #    /api/ready reports 503 until all of them are done
+    PRELOAD_LANGS: List[str] = []
+    PRELOAD_THREADS: int = 4
+    WARMUP_BATCH_SIZES: List[int] = [1, 8, 32]
+
+    # 🔹 Decode in separate worker processes (0 = in the API process)
+    INFERENCE_WORKERS: int = 0
+    INFERENCE_WORKER_THREADS: int = 1  # torch intra-op threads per worker
+
+    # 🔹 Cross-request micro-batching in front of the transliteration engine
+    BATCH_WINDOW_MS: float = 5.0  # how long to wait for more words
+    BATCH_MAX_SIZE: int = 64  # flush early once a language has this many
+
+    # 🔹 Dedicated inference threads; batches beyond the queue depth are
+    #    rejected with 503 instead of waiting
+    INFERENCE_THREADS: int = 4
+    INFERENCE_QUEUE_DEPTH: int = 32
+
+    # 🔹 Streaming bulk transliteration (/transliterate/stream)
+    BULK_BATCH_LINES: int = 64  # lines decoded together
+    BULK_BATCH_WORDS: int = 512  # ...or fewer lines once this many words
+    BULK_PREFETCH_BATCHES: int = 2  # batches read ahead while one decodes
+    BULK_MAX_LINE_CHARS: int = 64 * 1024
+
+    # 🔹 Exact-match lexicon ({lang}_lexicon.bin, see ml/scripts/build_lexicon.py)
+    #    answers known words before the model runs (greedy decoding only)
+    USE_LEXICON: bool = True
+
+    # 🔹 MIX mode: English vs romanized-Indic classifier (english_classifier.bin,
+    #    see ml/scripts/build_english_classifier.py); falls back to heuristics
+    USE_ENGLISH_CLASSIFIER: bool = True
+
+    # 🔹 Prefix autocomplete ({lang}_prefix.bin): max suggestions per query
+    SUGGEST_MAX_RESULTS: int = 10
+
+    # 🔹 Word-level LRU result cache in front of the engine (0 disables)
+    RESULT_CACHE_MAX_ENTRIES: int = 100_000
+    RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # 🔹 Optional on-disk result cache shared by all processes (SQLite, WAL);
+    #    survives restarts and deploys. None disables it
+    PERSISTENT_CACHE_PATH: Union[str, None] = None  # e.g. "../data/cache/results.db"
+    PERSISTENT_CACHE_MAX_ENTRIES: int = 2_000_000
+
+    # 🔹 Beam search: upper bound for TransliterationRequest.beam_width
+    MAX_BEAM_WIDTH: int = 8
+
+    # 🔹 Observability: Server-Timing header with per-stage durations, and
+    #    the token for /api/admin endpoints (None disables them)
+    SERVER_TIMING: bool = True
+    ADMIN_TOKEN: Union[str, None] = None
+    PROFILE_DIR: str = "../data/profiles"  # torch.profiler traces
+    PROFILE_MAX_REQUESTS: int = 50
+
     # 🔹 Gemini integration
     GEMINI_API_KEY: Union[str, None] = None
     CHAT_PROVIDER: str = "gemini"
@@ -1,6 +1,10 @@
 # backend/src/main.py
 
-from fastapi import FastAPI
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config.settings import settings
@@ -11,10 +15,25 @@ from .api.language_routes import router as language_router
 from .api.tts_routes import router as tts_router
 from .api.stt_routes import router as stt_router
 from .api.chat_routes import router as chat_router
+from .api.admin_routes import router as admin_router
+from .api.metrics_routes import router as metrics_router
+from .services.model_readiness import model_readiness
+from .utils import request_timing
+from .utils.metrics import http_request_seconds
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # preload in the background: /api/health answers right away, while
+    # /api/ready stays 503 until the models are loaded and warm
+    preload = asyncio.create_task(model_readiness.preload())
+    yield
+    if not preload.done():
+        preload.cancel()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.APP_NAME)
+    app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
     origins = settings.BACKEND_CORS_ORIGINS
 
@@ -28,12 +47,35 @@ def create_app() -> FastAPI:
         expose_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def record_latency(request: Request, call_next):
+        started = time.perf_counter()
+        with request_timing.collect() as timings:
+            response = await call_next(request)
+        elapsed = time.perf_counter() - started
+        # label by the matched endpoint's name, never the raw path, so the
+        # number of label sets stays bounded
+        route = request.scope.get("route")
+        http_request_seconds.observe(
+            elapsed,
+            method=request.method,
+            route=getattr(route, "name", "unmatched"),
+            status=response.status_code,
+        )
+        if settings.SERVER_TIMING:
+            response.headers["Server-Timing"] = request_timing.server_timing(
+                timings, total=elapsed
+            )
+        return response
+
     app.include_router(health_router, prefix=settings.API_PREFIX)
     app.include_router(transliteration_router, prefix=settings.API_PREFIX)
     app.include_router(language_router, prefix=settings.API_PREFIX)
     app.include_router(tts_router, prefix=settings.API_PREFIX)
     app.include_router(stt_router, prefix=settings.API_PREFIX)
     app.include_router(chat_router, prefix=settings.API_PREFIX)
+    app.include_router(metrics_router, prefix=settings.API_PREFIX)
+    app.include_router(admin_router, prefix=settings.API_PREFIX)
 
     @app.get("/")
     async def root():
@@ -0,0 +1,167 @@
+# backend/src/ml/batch_scheduler.py
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..config.settings import settings
+from ..utils import metrics, request_timing
+from ..utils.request_timing import Timings
+from .bounded_executor import BoundedExecutor
+from .transliteration_inference import TransliterationEngine, engine
+
+# (target language, beam width); beam width 1 means greedy decoding
+BatchKey = Tuple[str, int]
+# word, its future, and the stage timings of the request that asked for it
+Pending = Tuple[str, asyncio.Future, Optional[Timings]]
+
+
+class MicroBatchScheduler:
+    """
+    Collects words from concurrent requests and decodes them together.
+
+    Words are bucketed by (target language, beam width). A bucket is
+    flushed either when the batching window expires or when it reaches the
+    maximum batch size; each flush runs one batched decode on the bounded
+    inference executor and resolves the future of every word that took
+    part. When that executor's queue is full, new requests fail fast with
+    ExecutorOverloaded instead of piling up.
+    """
+
+    def __init__(
+        self,
+        engine: TransliterationEngine,
+        window_ms: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        executor: Optional[BoundedExecutor] = None,
+    ) -> None:
+        self.engine = engine
+        self.executor = executor or BoundedExecutor(
+            # enough threads to keep every worker process busy, if any
+            max_workers=max(settings.INFERENCE_THREADS, settings.INFERENCE_WORKERS),
+            max_queue=settings.INFERENCE_QUEUE_DEPTH,
+        )
+        self.window = (
+            window_ms if window_ms is not None else settings.BATCH_WINDOW_MS
+        ) / 1000.0
+        self.max_batch_size = max(
+            1, max_batch_size if max_batch_size is not None else settings.BATCH_MAX_SIZE
+        )
+        self._pending: Dict[BatchKey, List[Pending]] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        self._running: Set[asyncio.Task] = set()
+
+    # ------------ PUBLIC API ------------
+
+    async def transliterate_batch(
+        self, words: List[str], lang: str
+    ) -> Optional[List[str]]:
+        """
+        Async counterpart of TransliterationEngine.transliterate_batch.
+        Returns None when no model is available for `lang`.
+        """
+        return await self._gather(words, (lang, 1))
+
+    async def transliterate_beam(
+        self, words: List[str], lang: str, beam_width: int
+    ) -> Optional[List[List[Tuple[str, float]]]]:
+        """
+        Async counterpart of TransliterationEngine.transliterate_beam.
+        Only words asking for the same beam width share a batch.
+        """
+        return await self._gather(words, (lang, beam_width))
+
+    async def _gather(self, words: List[str], key: BatchKey) -> Optional[List[Any]]:
+        if not words:
+            return []
+        self.executor.check_capacity()
+
+        loop = asyncio.get_running_loop()
+        futures = [self._submit(loop, word, key) for word in words]
+        results = await asyncio.gather(*futures)
+
+        if any(r is None for r in results):
+            return None
+        return list(results)
+
+    # ------------ BATCHING ------------
+
+    def _submit(
+        self, loop: asyncio.AbstractEventLoop, word: str, key: BatchKey
+    ) -> asyncio.Future:
+        fut = loop.create_future()
+        bucket = self._pending.setdefault(key, [])
+        bucket.append((word, fut, request_timing.current()))
+
+        if len(bucket) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        return fut
+
+    def _flush(self, key: BatchKey) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(key, [])
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(key, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    def _decode(
+        self, words: List[str], key: BatchKey
+    ) -> Tuple[Optional[List[Any]], Timings]:
+        # runs on an executor thread, outside every request's context:
+        # collect the batch's stage timings here and hand them back
+        lang, beam_width = key
+        with request_timing.collect() as timings:
+            if beam_width > 1:
+                outputs = self.engine.transliterate_beam(words, lang, beam_width)
+            else:
+                outputs = self.engine.transliterate_batch(words, lang)
+        return outputs, timings
+
+    async def _run_batch(self, key: BatchKey, batch: List[Pending]) -> None:
+        # requests that were cancelled while waiting don't need decoding
+        live = [entry for entry in batch if not entry[1].done()]
+        if not live:
+            return
+
+        words = list(dict.fromkeys(word for word, _, _ in live))
+        metrics.batch_size.observe(len(words), source="scheduler")
+        try:
+            # every word here comes from a request admitted by _gather
+            outputs, timings = await self.executor.run(
+                self._decode, words, key, admitted=True
+            )
+        except Exception as e:
+            for _, fut, _ in live:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        # every request in the batch waited for all of it
+        sinks = {id(sink): sink for _, _, sink in live if sink is not None}
+        for sink in sinks.values():
+            request_timing.add_all(timings, into=sink)
+
+        by_word = dict(zip(words, outputs)) if outputs is not None else {}
+        for word, fut, _ in live:
+            if not fut.done():
+                fut.set_result(by_word.get(word))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending_words": sum(len(b) for b in self._pending.values()),
+            "running_batches": len(self._running),
+            "executor": self.executor.stats(),
+        }
+
+
+# global singleton scheduler in front of the engine
+scheduler = MicroBatchScheduler(engine)
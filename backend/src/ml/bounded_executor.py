@@ -0,0 +1,115 @@
+# backend/src/ml/bounded_executor.py
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class ExecutorOverloaded(RuntimeError):
+    """Raised instead of queueing work once the inference queue is full."""
+
+
+class BoundedExecutor:
+    """
+    Dedicated thread pool for inference with a hard cap on queued work.
+
+    At most `max_workers` jobs run at once and at most `max_queue` more
+    wait for a thread; new requests beyond that are rejected right away
+    with ExecutorOverloaded, so overload turns into fast errors instead of
+    an ever-growing backlog. Queue depth and time spent waiting for a thread
+    are tracked for /stats.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="inference"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self.submitted = 0
+        self.rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._waits = 0
+
+    @property
+    def full(self) -> bool:
+        with self._lock:
+            return self._queued + self._running >= self.max_workers + self.max_queue
+
+    def check_capacity(self) -> None:
+        """Fail fast before doing any work for a request that can't be queued."""
+        if self.full:
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorOverloaded(self._overload_message())
+
+    def _overload_message(self) -> str:
+        return (
+            f"Inference queue full ({self.max_queue} waiting, "
+            f"{self.max_workers} running)"
+        )
+
+    async def run(
+        self, fn: Callable[..., Any], *args: Any, admitted: bool = False
+    ) -> Any:
+        """
+        Run fn(*args) on the pool from the event loop, or raise
+        ExecutorOverloaded. `admitted` work belongs to a request that
+        already passed check_capacity() and always queues: a request split
+        into several batches must not fail on its own later batches.
+        """
+        with self._lock:
+            full = self._queued + self._running >= self.max_workers + self.max_queue
+            if full and not admitted:
+                self.rejected += 1
+                raise ExecutorOverloaded(self._overload_message())
+            self._queued += 1
+            self.submitted += 1
+        enqueued = time.perf_counter()
+
+        def job() -> Any:
+            waited = time.perf_counter() - enqueued
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._waits += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        def release_if_cancelled(cfut: "Future[Any]") -> None:
+            # a job cancelled before it started never frees its queue slot
+            if cfut.cancelled():
+                with self._lock:
+                    self._queued -= 1
+
+        cfut = self._pool.submit(job)
+        cfut.add_done_callback(release_if_cancelled)
+        return await asyncio.wrap_future(cfut)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "queue_wait_ms_avg": (
+                    self._wait_total / self._waits * 1000 if self._waits else 0.0
+                ),
+                "queue_wait_ms_max": self._wait_max * 1000,
+            }
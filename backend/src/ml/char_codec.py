@@ -0,0 +1,158 @@
+# backend/src/ml/char_codec.py
+
+"""
+Character <-> id codec shared by training (ml/scripts) and serving.
+
+Only depends on numpy so the training scripts, the torch engine and the
+ONNX backend all encode text exactly the same way:
+[<sos>, chars..., <eos>], at most `max_len` ids, unknown chars -> <unk>.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+PAD_TOKEN = "<pad>"
+SOS_TOKEN = "<sos>"
+EOS_TOKEN = "<eos>"
+UNK_TOKEN = "<unk>"
+
+IdRows = Union[np.ndarray, Sequence[Sequence[int]]]
+
+
+class CharCodec:
+    def __init__(
+        self,
+        char2idx: Mapping[str, int],
+        idx2char: Optional[Mapping[int, str]] = None,
+        max_len: int = 40,
+    ) -> None:
+        self.char2idx: Dict[str, int] = dict(char2idx)
+        self.idx2char: Dict[int, str] = (
+            {int(k): v for k, v in idx2char.items()}
+            if idx2char is not None
+            else {i: c for c, i in self.char2idx.items()}
+        )
+        self.max_len = max_len
+
+        self.pad_idx = self.char2idx.get(PAD_TOKEN, 0)
+        self.sos_idx = self.char2idx.get(SOS_TOKEN, 1)
+        self.eos_idx = self.char2idx.get(EOS_TOKEN, 2)
+        self.unk_idx = self.char2idx.get(UNK_TOKEN, 3)
+
+        # code point -> id; anything outside the table or unset is <unk>
+        singles = {c: i for c, i in self.char2idx.items() if len(c) == 1}
+        self._singles = singles
+        size = max((ord(c) for c in singles), default=0) + 1
+        self._encode_table = np.full(size, self.unk_idx, dtype=np.int64)
+        for ch, idx in singles.items():
+            self._encode_table[ord(ch)] = idx
+
+        # id -> text; <pad>/<sos> decode to nothing, unknown ids too
+        size = max(self.idx2char, default=0) + 1
+        self._decode_table: List[str] = [""] * size
+        for idx, ch in self.idx2char.items():
+            if idx not in (self.pad_idx, self.sos_idx):
+                self._decode_table[idx] = ch
+
+    @classmethod
+    def from_files(
+        cls,
+        char2idx_path: Path,
+        idx2char_path: Optional[Path] = None,
+        max_len: int = 40,
+    ) -> "CharCodec":
+        with Path(char2idx_path).open("r", encoding="utf-8") as f:
+            char2idx = json.load(f)
+        idx2char = None
+        if idx2char_path is not None:
+            with Path(idx2char_path).open("r", encoding="utf-8") as f:
+                idx2char = json.load(f)
+        return cls(char2idx, idx2char, max_len)
+
+    def __len__(self) -> int:
+        return len(self.char2idx)
+
+    # ------------ ENCODING ------------
+
+    def lengths(self, texts: Sequence[str]) -> np.ndarray:
+        """Encoded length of each text, <sos> and <eos> included."""
+        n_chars = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+        return np.minimum(n_chars, self.max_len - 2) + 2
+
+    def encode(self, text: str) -> List[int]:
+        # one short text: a dict lookup per char beats numpy's setup cost
+        get, unk = self._singles.get, self.unk_idx
+        chars = [get(ch, unk) for ch in text[: self.max_len - 2]]
+        return [self.sos_idx, *chars, self.eos_idx]
+
+    def encode_batch(
+        self,
+        texts: Sequence[str],
+        width: Optional[int] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode all `texts` in one pass into a (batch, width) int array padded
+        with <pad>. `width` defaults to the longest encoded text. Pass `out`
+        (any int array of that shape, e.g. `tensor.numpy()` of a CPU tensor)
+        to fill preallocated memory instead of allocating.
+        Returns (ids, lengths).
+        """
+        lengths = self.lengths(texts)
+        batch = len(texts)
+        if width is None:
+            width = int(lengths.max()) if batch else 0
+        if batch and width < int(lengths.max()):
+            raise ValueError(f"width {width} is shorter than the longest text")
+
+        if out is None:
+            out = np.empty((batch, width), dtype=np.int64)
+        elif out.shape != (batch, width):
+            raise ValueError(f"out has shape {out.shape}, expected {(batch, width)}")
+        out.fill(self.pad_idx)
+        if not batch:
+            return out, lengths
+
+        n_chars = lengths - 2
+        joined = "".join(t[:n] for t, n in zip(texts, n_chars.tolist()))
+        code_points = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        table = self._encode_table
+        in_table = code_points < len(table)
+        char_ids = np.where(
+            in_table,
+            table[np.where(in_table, code_points, 0)],
+            self.unk_idx,
+        )
+
+        rows = np.repeat(np.arange(batch), n_chars)
+        starts = np.cumsum(n_chars) - n_chars
+        cols = np.arange(len(char_ids)) - np.repeat(starts, n_chars) + 1
+        out[:, 0] = self.sos_idx
+        out[rows, cols] = char_ids
+        out[np.arange(batch), lengths - 1] = self.eos_idx
+        return out, lengths
+
+    # ------------ DECODING ------------
+
+    def decode(self, ids: Sequence[int]) -> str:
+        return self.decode_batch([ids])[0]
+
+    def decode_batch(self, rows: IdRows) -> List[str]:
+        """
+        Turn id rows back into text, stopping at the first <eos>. Rows may
+        be a 2-D array (e.g. decoder output) or ragged lists.
+        """
+        table = self._decode_table
+        size = len(table)
+        texts: List[str] = []
+        for row in rows:
+            ids = row.tolist() if isinstance(row, np.ndarray) else list(row)
+            if self.eos_idx in ids:
+                ids = ids[: ids.index(self.eos_idx)]
+            texts.append("".join(table[i] for i in ids if 0 <= i < size))
+        return texts
@@ -0,0 +1,224 @@
+# backend/src/ml/english_classifier.py
+
+"""
+English vs romanized-Indic token classifier for MIX mode.
+
+Two memory-mapped parts, built offline by ml/scripts/build_english_classifier.py:
+- a Bloom filter over a large English lexicon
+- a hashed character-trigram table of log(P_english / P_romanized_indic),
+  trained on an English word list and Aksharantar's roman side
+
+A token is kept as English when the Bloom filter knows it, unless the
+target language's lexicon also knows it as a romanized word (e.g. "main",
+"to"). In that case, and for words the filter has never seen, the
+trigram score decides. Each decision is a few hash probes, no model call.
+
+File layout (native byte order):
+
+    magic       8 bytes   b"TKENG\\x00\\x01\\x00"
+    header      uint64[3]  bloom_bits, bloom_hashes, n_buckets
+                float64    threshold (mean trigram score to keep a word)
+    table       float32[n_buckets]
+    bloom       bloom_bits / 8 bytes
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..config.settings import settings
+
+MAGIC = b"TKENG\x00\x01\x00"
+_HEADER = len(MAGIC) + 8 * 4
+_SEED = 0x9747B28C
+
+DEFAULT_BUCKETS = 1 << 18
+DEFAULT_FP_RATE = 0.01
+
+
+def _key(word: str) -> bytes:
+    return word.lower().encode("utf-8")
+
+
+def _bloom_positions(data: bytes, bits: int, hashes: int) -> List[int]:
+    # double hashing: position i = h1 + i * h2
+    h1 = zlib.crc32(data)
+    h2 = zlib.crc32(data, _SEED) | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+def trigram_buckets(word: str, n_buckets: int) -> List[int]:
+    """Hashed character trigrams of ^word$ (word boundaries included)."""
+    padded = f"^{word.lower()}$".encode("utf-8")
+    return [zlib.crc32(padded[i : i + 3]) % n_buckets for i in range(len(padded) - 2)]
+
+
+def train_trigram_table(
+    english: Iterable[str],
+    romanized: Iterable[str],
+    n_buckets: int = DEFAULT_BUCKETS,
+    alpha: float = 0.5,
+) -> np.ndarray:
+    """Per-bucket log(P_english / P_romanized) with add-alpha smoothing."""
+    counts = np.zeros((2, n_buckets), dtype=np.float64)
+    for row, words in enumerate((english, romanized)):
+        chunk: List[int] = []
+        for word in words:
+            chunk.extend(trigram_buckets(word, n_buckets))
+            if len(chunk) >= 1 << 20:
+                counts[row] += np.bincount(chunk, minlength=n_buckets)
+                chunk = []
+        counts[row] += np.bincount(chunk, minlength=n_buckets)
+    probs = (counts + alpha) / (counts.sum(axis=1, keepdims=True) + alpha * n_buckets)
+    return np.log(probs[0] / probs[1]).astype(np.float32)
+
+
+def best_threshold(scored: Iterable[Tuple[float, bool]]) -> float:
+    """Threshold on the mean trigram score with the best accuracy."""
+    pairs = sorted(scored)
+    n_english = sum(is_en for _, is_en in pairs)
+    # everything above the cut is called English; start with the cut below all
+    correct = best = n_english
+    best_cut = pairs[0][0] - 1.0 if pairs else 0.0
+    for i, (score, is_en) in enumerate(pairs):
+        correct += -1 if is_en else 1
+        nxt = pairs[i + 1][0] if i + 1 < len(pairs) else score + 1.0
+        if correct > best and nxt > score:
+            best, best_cut = correct, (score + nxt) / 2
+    return best_cut
+
+
+def write_english_classifier(
+    english_words: Iterable[str],
+    table: np.ndarray,
+    threshold: float,
+    path: Path,
+    fp_rate: float = DEFAULT_FP_RATE,
+) -> int:
+    """
+    Write the Bloom filter over `english_words` plus the trigram `table`.
+    Returns the number of distinct words in the filter.
+    """
+    words = sorted({_key(w) for w in english_words if w.strip()})
+    n = max(1, len(words))
+    bits = max(64, math.ceil(-n * math.log(fp_rate) / math.log(2) ** 2))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, round(bits / n * math.log(2)))
+
+    bloom = np.zeros(bits // 8, dtype=np.uint8)
+    for word in words:
+        for pos in _bloom_positions(word, bits, hashes):
+            bloom[pos >> 3] |= 1 << (pos & 7)
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(MAGIC)
+        f.write(np.array([bits, hashes, len(table)], dtype=np.uint64).tobytes())
+        f.write(np.array([threshold], dtype=np.float64).tobytes())
+        f.write(np.asarray(table, dtype=np.float32).tobytes())
+        f.write(bloom.tobytes())
+    os.replace(tmp, path)
+    return len(words)
+
+
+class EnglishClassifier:
+    """Read-only view of one classifier file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not an English classifier file")
+
+        view = memoryview(self._mm)
+        self.bloom_bits, self.bloom_hashes, self.n_buckets = view[
+            len(MAGIC) : len(MAGIC) + 24
+        ].cast("Q")
+        self.threshold = view[len(MAGIC) + 24 : _HEADER].cast("d")[0]
+        table_end = _HEADER + 4 * self.n_buckets
+        self._table = view[_HEADER:table_end].cast("f")
+        self._bloom_start = table_end
+
+    def in_lexicon(self, word: str) -> bool:
+        mm, start = self._mm, self._bloom_start
+        return all(
+            mm[start + (pos >> 3)] & (1 << (pos & 7))
+            for pos in _bloom_positions(_key(word), self.bloom_bits, self.bloom_hashes)
+        )
+
+    def score(self, word: str) -> float:
+        """Mean trigram log-odds; > 0 leans English, < 0 romanized Indic."""
+        table = self._table
+        buckets = trigram_buckets(word, self.n_buckets)
+        return sum(table[b] for b in buckets) / len(buckets)
+
+    def is_english(self, word: str, romanized_known: bool = False) -> bool:
+        """
+        `romanized_known`: the word is also a known romanized spelling in
+        the target language, so lexicon membership alone can't decide.
+        """
+        if not romanized_known and self.in_lexicon(word):
+            return True
+        return self.score(word) > self.threshold
+
+    def close(self) -> None:
+        self._table.release()
+        self._mm.close()
+
+
+class EnglishClassifierHolder:
+    """Lazily opens english_classifier.bin from the model directory."""
+
+    def __init__(self, model_dir: Path, enabled: bool = True) -> None:
+        self.path = Path(model_dir) / "english_classifier.bin"
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._classifier: Optional[EnglishClassifier] = None
+        self._loaded = False
+        self.kept = 0
+        self.transliterated = 0
+
+    def get(self) -> Optional[EnglishClassifier]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                try:
+                    if self.path.exists():
+                        self._classifier = EnglishClassifier(self.path)
+                except (OSError, ValueError) as e:
+                    print(f"[EnglishClassifier] Could not open {self.path}: {e}")
+            return self._classifier
+
+    def record(self, kept: bool) -> None:
+        with self._lock:
+            if kept:
+                self.kept += 1
+            else:
+                self.transliterated += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "loaded": self._classifier is not None,
+                "kept": self.kept,
+                "transliterated": self.transliterated,
+            }
+
+
+english_classifier = EnglishClassifierHolder(
+    Path(settings.MODEL_DIR), enabled=settings.USE_ENGLISH_CLASSIFIER
+)
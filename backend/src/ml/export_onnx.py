@@ -0,0 +1,163 @@
+# backend/src/ml/export_onnx.py
+
+"""
+Export a language's checkpoint for the ONNX Runtime backend
+(INFERENCE_BACKEND="onnx", see onnx_inference.py).
+
+Writes two graphs next to {lang}_model.pt:
+- {lang}_encoder.onnx : src -> encoder outputs, initial hidden/cell and the
+                        encoder side of attention
+- {lang}_decoder.onnx : one decoder step
+The decode loop itself stays in Python so greedy and beam search can
+share the same step graph.
+
+Needs the optional `onnx` and `onnxruntime` packages (commented out in
+requirements.txt), which the torch-only backend does not use:
+    pip install onnx onnxruntime
+
+Usage (from backend/):
+    python -m src.ml.export_onnx --lang hi te
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import List
+
+import onnx
+import torch
+import torch.nn as nn
+
+from .onnx_inference import load_onnx_model, onnx_paths
+from .transliteration_inference import LoadedTranslitModel, TransliterationEngine
+
+CHECK_WORDS = ["namaste", "bharat", "a", "hyderabad", "kaise", "ho"]
+OPSET = 17
+
+
+class EncoderGraph(nn.Module):
+    def __init__(self, model: LoadedTranslitModel):
+        super().__init__()
+        self.encoder = model.model.encoder
+        self.attention = model.model.decoder.attention
+
+    def forward(self, src: torch.Tensor):
+        encoder_outputs, hidden, cell = self.encoder(src)
+        encoder_proj = self.attention.project_encoder(encoder_outputs)
+        return encoder_outputs, hidden, cell, encoder_proj
+
+
+class DecoderStepGraph(nn.Module):
+    def __init__(self, model: LoadedTranslitModel):
+        super().__init__()
+        self.decoder = model.model.decoder
+
+    def forward(self, input, hidden, cell, encoder_outputs, mask, encoder_proj):
+        return self.decoder(input, hidden, cell, encoder_outputs, mask, encoder_proj)
+
+
+def _add_metadata(path, model: LoadedTranslitModel) -> None:
+    proto = onnx.load(str(path))
+    entry = proto.metadata_props.add()
+    entry.key, entry.value = "checksum", model.checksum
+    onnx.save(proto, str(path))
+
+
+def export_lang(engine: TransliterationEngine, lang: str) -> bool:
+    model = engine.build_lang_model(lang, precision="fp32", backend="torch")
+    if model is None:
+        print(f"❌ No model files for '{lang}' in {engine.model_dir}")
+        return False
+
+    encoder_path, decoder_path = onnx_paths(engine.model_dir, lang)
+    src, _ = model._encode_batch(["namaste", "ho"])
+    with torch.no_grad():
+        encoder_outputs, hidden, cell, _, encoder_proj = model._encode_source(src, None)
+    mask = torch.ones(src.shape, dtype=torch.bool)
+    input_token = torch.full((src.size(0),), model.sos_idx, dtype=torch.long)
+
+    # the TorchScript-based exporter keeps nn.LSTM as one ONNX LSTM node
+    # with a dynamic sequence axis; the dynamo exporter unrolls it
+    torch.onnx.export(
+        EncoderGraph(model).eval(),
+        (src,),
+        str(encoder_path),
+        input_names=["src"],
+        output_names=["encoder_outputs", "hidden", "cell", "encoder_proj"],
+        dynamic_axes={
+            "src": {0: "batch", 1: "src_len"},
+            "encoder_outputs": {0: "batch", 1: "src_len"},
+            "hidden": {1: "batch"},
+            "cell": {1: "batch"},
+            "encoder_proj": {0: "batch", 1: "src_len"},
+        },
+        opset_version=OPSET,
+        dynamo=False,
+    )
+    torch.onnx.export(
+        DecoderStepGraph(model).eval(),
+        (input_token, hidden, cell, encoder_outputs, mask, encoder_proj),
+        str(decoder_path),
+        input_names=[
+            "input",
+            "hidden",
+            "cell",
+            "encoder_outputs",
+            "mask",
+            "encoder_proj",
+        ],
+        output_names=["prediction", "hidden_out", "cell_out"],
+        dynamic_axes={
+            "input": {0: "batch"},
+            "hidden": {1: "batch"},
+            "cell": {1: "batch"},
+            "encoder_outputs": {0: "batch", 1: "src_len"},
+            "mask": {0: "batch", 1: "src_len"},
+            "encoder_proj": {0: "batch", 1: "src_len"},
+            "prediction": {0: "batch"},
+            "hidden_out": {1: "batch"},
+            "cell_out": {1: "batch"},
+        },
+        opset_version=OPSET,
+        dynamo=False,
+    )
+    for path in (encoder_path, decoder_path):
+        _add_metadata(path, model)
+
+    # the exported graphs must reproduce the eager model
+    onnx_model = load_onnx_model(
+        engine.model_dir,
+        lang,
+        *engine._get_paths_for_lang(lang)[1:],
+        checksum=model.checksum,
+        fixed_length=model.fixed_length,
+    )
+    if onnx_model is None:
+        return False
+    with torch.no_grad():
+        expected = model.transliterate_batch(CHECK_WORDS)
+    got = onnx_model.transliterate_batch(CHECK_WORDS)
+    if got != expected:
+        print(f"❌ {lang}: ONNX output differs from eager: {got} != {expected}")
+        for path in (encoder_path, decoder_path):
+            path.unlink()
+        return False
+
+    print(f"✅ {lang}: wrote {encoder_path.name}, {decoder_path.name}")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export ONNX encoder/decoder graphs")
+    parser.add_argument("--lang", nargs="+", required=True)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    engine = TransliterationEngine(args.model_dir)
+    failed: List[str] = [lang for lang in args.lang if not export_lang(engine, lang)]
+    if failed:
+        raise SystemExit(f"Export failed for: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# backend/src/ml/export_torchscript.py
+
+"""
+Compile the encoder + full greedy decode loop of a language into a single
+TorchScript artifact, written next to the checkpoint as {lang}_greedy.ts.
+
+The engine picks it up automatically (USE_COMPILED_MODELS) and falls back
+to eager decoding when it is missing or was exported from other weights.
+
+Usage (from backend/):
+    python -m src.ml.export_torchscript --lang hi te
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import List
+
+import torch
+
+from .transliteration_inference import TransliterationEngine
+
+# sanity inputs: compiled and eager decoding must agree on these
+CHECK_WORDS = ["namaste", "bharat", "a", "hyderabad", "kaise", "ho"]
+
+
+def export_lang(engine: TransliterationEngine, lang: str) -> bool:
+    model = engine.build_lang_model(lang, precision="fp32")
+    if model is None:
+        print(f"❌ No model files for '{lang}' in {engine.model_dir}")
+        return False
+
+    scripted = torch.jit.script(model.greedy_search)
+    out_path = engine.get_compiled_path(lang)
+
+    with torch.no_grad():
+        src, src_lengths = model._encode_batch(CHECK_WORDS)
+        eager_ids = model.greedy_search(src, src_lengths)
+        compiled_ids = scripted(src, src_lengths)
+    if not torch.equal(eager_ids, compiled_ids):
+        print(f"❌ {lang}: compiled output differs from eager, not writing")
+        return False
+
+    torch.jit.save(
+        scripted,
+        str(out_path),
+        _extra_files={"meta.json": json.dumps(model.compiled_meta())},
+    )
+    print(f"✅ {lang}: wrote {out_path}")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export TorchScript decoders")
+    parser.add_argument("--lang", nargs="+", required=True)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    engine = TransliterationEngine(args.model_dir)
+    failed: List[str] = [lang for lang in args.lang if not export_lang(engine, lang)]
+    if failed:
+        raise SystemExit(f"Export failed for: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# backend/src/ml/lexicon.py
+
+"""
+Exact-match (roman -> native) lexicon, stored as a memory-mapped sorted
+string table so every uvicorn/inference worker shares the same pages.
+
+File layout (native byte order, i.e. little-endian on x86/ARM), written by `write_lexicon`:
+
+    magic      8 bytes   b"TKLEX\\x00\\x01\\x00"
+    count      uint64    number of entries n
+    key_off    uint64[n + 1]   offsets into the key blob
+    val_off    uint64[n + 1]   offsets into the value blob
+    keys       utf-8, concatenated, sorted bytewise
+    values     utf-8, concatenated, in key order
+
+Lookups binary-search the key offsets; nothing is parsed up front, so
+opening a multi-million entry table is O(1).
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config.settings import settings
+from ..utils import metrics
+
+MAGIC = b"TKLEX\x00\x01\x00"
+_HEADER = len(MAGIC) + 8
+
+
+def normalize_key(word: str) -> str:
+    return word.strip().lower()
+
+
+def write_lexicon(entries: Iterable[Tuple[str, str]], path: Path) -> int:
+    """
+    Write (roman, native) pairs as a lexicon file; keys are normalised and
+    must be unique. Written to a temp file and renamed, so readers never
+    see a partial table. Returns the number of entries.
+    """
+    pairs = sorted(
+        (normalize_key(k).encode("utf-8"), v.encode("utf-8")) for k, v in entries
+    )
+    keys = [k for k, _ in pairs]
+    if any(a == b for a, b in zip(keys, keys[1:])):
+        raise ValueError("lexicon keys must be unique after normalisation")
+    values = [v for _, v in pairs]
+
+    def offsets(blobs: List[bytes]) -> np.ndarray:
+        out = np.zeros(len(blobs) + 1, dtype=np.uint64)
+        np.cumsum([len(b) for b in blobs], out=out[1:])
+        return out
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(MAGIC)
+        f.write(np.array([len(pairs)], dtype=np.uint64).tobytes())
+        f.write(offsets(keys).tobytes())
+        f.write(offsets(values).tobytes())
+        f.write(b"".join(keys))
+        f.write(b"".join(values))
+    os.replace(tmp, path)
+    return len(pairs)
+
+
+class _Keys(Sequence[bytes]):
+    """Lazy sequence view over the key blob, for bisect."""
+
+    def __init__(self, lexicon: "Lexicon") -> None:
+        self._lex = lexicon
+
+    def __len__(self) -> int:
+        return len(self._lex)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        return self._lex.key_bytes(i)
+
+
+class Lexicon:
+    """Read-only view of one lexicon file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a lexicon file")
+
+        # native-order views of the offset arrays: indexing a memoryview
+        # yields plain ints, which keeps each bisect probe cheap
+        view = memoryview(self._mm)
+        n = view[len(MAGIC) : _HEADER].cast("Q")[0]
+        self._n = n
+        self._key_off = view[_HEADER : _HEADER + 8 * (n + 1)].cast("Q")
+        self._val_off = view[_HEADER + 8 * (n + 1) : _HEADER + 16 * (n + 1)].cast("Q")
+        self._keys_start = _HEADER + 16 * (n + 1)
+        self._vals_start = self._keys_start + self._key_off[n]
+        self._keys = _Keys(self)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def key_bytes(self, i: int) -> bytes:
+        base = self._keys_start
+        return self._mm[base + self._key_off[i] : base + self._key_off[i + 1]]
+
+    def value(self, i: int) -> str:
+        base = self._vals_start
+        return self._mm[base + self._val_off[i] : base + self._val_off[i + 1]].decode(
+            "utf-8"
+        )
+
+    def get(self, word: str) -> Optional[str]:
+        key = normalize_key(word).encode("utf-8")
+        i = bisect_left(self._keys, key)
+        if i < self._n and self.key_bytes(i) == key:
+            return self.value(i)
+        return None
+
+    def lookup(self, words: Sequence[str]) -> List[Optional[str]]:
+        return [self.get(w) for w in words]
+
+    def close(self) -> None:
+        # the offset views keep the buffer exported; release them first
+        self._key_off.release()
+        self._val_off.release()
+        self._mm.close()
+
+
+class LexiconRegistry:
+    """
+    Lazily opens {lang}_lexicon.bin from the model directory, once per
+    language, and counts hits/misses. A missing file means "no lexicon"
+    for that language.
+    """
+
+    def __init__(self, model_dir: Path, enabled: bool = True) -> None:
+        self.model_dir = Path(model_dir)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._lexicons: Dict[str, Optional[Lexicon]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, lang: str) -> Path:
+        return self.model_dir / f"{lang}_lexicon.bin"
+
+    def get(self, lang: str) -> Optional[Lexicon]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            if lang not in self._lexicons:
+                path = self.path(lang)
+                try:
+                    self._lexicons[lang] = Lexicon(path) if path.exists() else None
+                except (OSError, ValueError) as e:
+                    print(f"[Lexicon] Could not open {path}: {e}")
+                    self._lexicons[lang] = None
+            return self._lexicons[lang]
+
+    def lookup(self, words: Sequence[str], lang: str) -> List[Optional[str]]:
+        """Native form per word, or None where the lexicon has no entry."""
+        lexicon = self.get(lang)
+        if lexicon is None:
+            return [None] * len(words)
+        found = lexicon.lookup(words)
+        hits = sum(v is not None for v in found)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(words) - hits
+        metrics.cache_lookups.inc(hits, cache="lexicon", result="hit")
+        metrics.cache_lookups.inc(len(words) - hits, cache="lexicon", result="miss")
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "loaded": {
+                    lang: len(lex)
+                    for lang, lex in self._lexicons.items()
+                    if lex is not None
+                },
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
+
+
+lexicons = LexiconRegistry(Path(settings.MODEL_DIR), enabled=settings.USE_LEXICON)
@@ -0,0 +1,95 @@
+# backend/src/ml/model_residency.py
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class ModelResidency:
+    """
+    Thread-safe, memory-budgeted LRU of loaded language models.
+
+    Each model reports its own weight footprint (`footprint_bytes()`).
+    When the resident total exceeds `max_bytes`, least recently used
+    languages are dropped until it fits again. Pinned languages are never
+    evicted, and the language just added always stays, even if it alone is
+    over budget. A budget of 0 means unlimited.
+    """
+
+    def __init__(self, max_bytes: int, pinned: Iterable[str] = ()) -> None:
+        self.max_bytes = max_bytes
+        self.pinned = set(pinned)
+        self._models: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.evictions: Dict[str, int] = {}
+
+    def get(self, lang: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._models.get(lang)
+            if entry is None:
+                return None
+            self._models.move_to_end(lang)
+            return entry[0]
+
+    def put(self, lang: str, model: Any) -> List[str]:
+        """Make `model` resident; returns the languages evicted for it."""
+        size = model.footprint_bytes()
+        with self._lock:
+            old = self._models.pop(lang, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._models[lang] = (model, size)
+            self._bytes += size
+            return self._evict_over_budget(keep=lang)
+
+    def _evict_over_budget(self, keep: str) -> List[str]:
+        evicted: List[str] = []
+        if self.max_bytes <= 0:
+            return evicted
+        # oldest first
+        for lang in list(self._models):
+            if self._bytes <= self.max_bytes:
+                break
+            if lang == keep or lang in self.pinned:
+                continue
+            _, size = self._models.pop(lang)
+            self._bytes -= size
+            self.evictions[lang] = self.evictions.get(lang, 0) + 1
+            evicted.append(lang)
+        return evicted
+
+    def __contains__(self, lang: str) -> bool:
+        with self._lock:
+            return lang in self._models
+
+    def languages(self) -> List[str]:
+        with self._lock:
+            return list(self._models)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "pinned": sorted(self.pinned),
+                # least recently used first
+                "models": {
+                    lang: {
+                        "bytes": size,
+                        "pinned": lang in self.pinned,
+                        "backend": model.backend,
+                        "precision": model.precision,
+                    }
+                    for lang, (model, size) in self._models.items()
+                },
+                "evictions": dict(self.evictions),
+                "total_evictions": sum(self.evictions.values()),
+            }
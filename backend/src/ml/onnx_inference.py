@@ -0,0 +1,318 @@
+# backend/src/ml/onnx_inference.py
+
+"""
+ONNX Runtime backend for the seq2seq transliterator.
+
+Runs {lang}_encoder.onnx and {lang}_decoder.onnx (written by
+export_onnx.py) on CPU with numpy only; greedy and beam decoding mirror
+LoadedTranslitModel in transliteration_inference.py step for step.
+Needs the optional `onnxruntime` package (see requirements.txt).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils import metrics, request_timing
+from .char_codec import CharCodec
+
+# Make onnxruntime optional so the torch backend runs without the package
+try:
+    import onnxruntime as ort  # type: ignore
+except ImportError:
+    ort = None
+
+
+def _read_meta(session) -> Dict[str, str]:
+    return dict(session.get_modelmeta().custom_metadata_map)
+
+
+def _log_softmax(x: np.ndarray) -> np.ndarray:
+    x = x - x.max(axis=-1, keepdims=True)
+    return x - np.log(np.exp(x).sum(axis=-1, keepdims=True))
+
+
+class OnnxTranslitModel:
+    def __init__(
+        self,
+        lang: str,
+        encoder_path: Path,
+        decoder_path: Path,
+        char2idx_path: Path,
+        idx2char_path: Path,
+        checksum: str,
+        max_len: int = 40,
+        fixed_length: bool = False,
+    ):
+        if ort is None:
+            raise RuntimeError("onnxruntime is not installed")
+
+        self.lang = lang
+        self.backend = "onnx"
+        self.max_len = max_len
+        self.fixed_length = fixed_length
+
+        self.codec = CharCodec.from_files(char2idx_path, idx2char_path, max_len)
+        self.sos_idx = self.codec.sos_idx
+        self.eos_idx = self.codec.eos_idx
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        providers = ["CPUExecutionProvider"]
+        self.encoder = ort.InferenceSession(
+            str(encoder_path), options, providers=providers
+        )
+        self.decoder = ort.InferenceSession(
+            str(decoder_path), options, providers=providers
+        )
+
+        # both graphs must come from the checkpoint the engine would load
+        for session, path in (
+            (self.encoder, encoder_path),
+            (self.decoder, decoder_path),
+        ):
+            exported_from = _read_meta(session).get("checksum")
+            if exported_from != checksum:
+                raise ValueError(
+                    f"{path.name} was exported from another checkpoint, re-export it"
+                )
+
+        self.checksum = checksum
+        self.precision = "fp32"
+        self.version = f"{self.checksum}:onnx"
+        # initializers (the weights) make up nearly all of each graph file
+        self._footprint = encoder_path.stat().st_size + decoder_path.stat().st_size
+
+    def footprint_bytes(self) -> int:
+        return self._footprint
+
+    def _encode_ids(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        with request_timing.stage("encode"):
+            return self.codec.encode_batch(
+                texts, width=self.max_len if self.fixed_length else None
+            )
+
+    def _encode_source(self, src: np.ndarray, lengths: np.ndarray):
+        """
+        Run the encoder graph. Variable-length batches are encoded one
+        length group at a time, so no row ever reads padding (the ONNX
+        graph has no packed sequences); outputs are zero past each row's
+        length, like pad_packed_sequence.
+        Returns (encoder_outputs, hidden, cell, mask, encoder_proj).
+        """
+        width = src.shape[1]
+
+        if self.fixed_length:
+            outputs, hidden, cell, proj = self.encoder.run(None, {"src": src})
+            mask = np.ones(src.shape, dtype=bool)
+            return outputs, hidden, cell, mask, proj
+
+        mask = np.arange(width)[None, :] < lengths[:, None]
+        outputs = proj = hidden = cell = None
+        for length in np.unique(lengths):
+            idx = np.nonzero(lengths == length)[0]
+            g_out, g_hidden, g_cell, g_proj = self.encoder.run(
+                None, {"src": src[idx, :length]}
+            )
+            if outputs is None:
+                batch = len(src)
+                outputs = np.zeros((batch, width, g_out.shape[2]), dtype=g_out.dtype)
+                proj = np.zeros((batch, width, g_proj.shape[2]), dtype=g_proj.dtype)
+                hidden = np.zeros((1, batch, g_hidden.shape[2]), dtype=g_hidden.dtype)
+                cell = np.zeros_like(hidden)
+            outputs[idx, :length] = g_out
+            proj[idx, :length] = g_proj
+            hidden[:, idx] = g_hidden
+            cell[:, idx] = g_cell
+        return outputs, hidden, cell, mask, proj
+
+    def _decoder_step(self, input_token, hidden, cell, encoder_outputs, mask, proj):
+        return self.decoder.run(
+            None,
+            {
+                "input": input_token,
+                "hidden": hidden,
+                "cell": cell,
+                "encoder_outputs": encoder_outputs,
+                "mask": mask,
+                "encoder_proj": proj,
+            },
+        )
+
+    def _trim_eos(self, ids: List[int]) -> List[int]:
+        if self.eos_idx in ids:
+            return ids[: ids.index(self.eos_idx)]
+        return ids
+
+    def _greedy_decode(self, src: np.ndarray, lengths: np.ndarray) -> List[List[int]]:
+        encoder_outputs, hidden, cell, mask, proj = self._encode_source(src, lengths)
+
+        batch_size = len(src)
+        input_token = np.full(batch_size, self.sos_idx, dtype=np.int64)
+        finished = np.zeros(batch_size, dtype=bool)
+        steps: List[np.ndarray] = []
+
+        for _ in range(self.max_len):
+            output, hidden, cell = self._decoder_step(
+                input_token, hidden, cell, encoder_outputs, mask, proj
+            )
+            next_ids = output.argmax(axis=-1)
+            next_ids[finished] = self.eos_idx
+            steps.append(next_ids)
+            finished |= next_ids == self.eos_idx
+            if finished.all():
+                break
+            input_token = next_ids
+
+        decoded = np.stack(steps, axis=1).tolist()
+        return [self._trim_eos(row) for row in decoded]
+
+    def transliterate_batch(self, words: List[str]) -> List[str]:
+        if not words:
+            return []
+
+        unique_words = list(dict.fromkeys(words))
+        src, lengths = self._encode_ids(unique_words)
+        with request_timing.stage("decode"):
+            decoded_ids = self._greedy_decode(src, lengths)
+            texts = self.codec.decode_batch(decoded_ids)
+
+        # +1 for the <eos> step (or the max_len cutoff)
+        metrics.decoder_steps.observe_many(
+            [len(row) + 1 for row in decoded_ids], lang=self.lang
+        )
+        by_word = dict(zip(unique_words, texts))
+        return [by_word[w] for w in words]
+
+    def transliterate(self, text: str) -> str:
+        return self.transliterate_batch([text])[0]
+
+    def _beam_decode(
+        self, src: np.ndarray, lengths: np.ndarray, beam_width: int
+    ) -> List[List[Tuple[List[int], float]]]:
+        batch_size = len(src)
+        k = beam_width
+        encoder_outputs, hidden, cell, mask, proj = self._encode_source(src, lengths)
+
+        # (batch, ...) -> (batch * k, ...), beams of a word are contiguous
+        encoder_outputs = np.repeat(encoder_outputs, k, axis=0)
+        proj = np.repeat(proj, k, axis=0)
+        mask = np.repeat(mask, k, axis=0)
+        hidden = np.repeat(hidden, k, axis=1)
+        cell = np.repeat(cell, k, axis=1)
+
+        scores = np.full((batch_size, k), -np.inf, dtype=np.float32)
+        scores[:, 0] = 0.0
+        finished = np.zeros((batch_size, k), dtype=bool)
+        tokens = np.empty((batch_size, k, 0), dtype=np.int64)
+        input_token = np.full(batch_size * k, self.sos_idx, dtype=np.int64)
+        row_offsets = (np.arange(batch_size) * k)[:, None]
+
+        for _ in range(self.max_len):
+            output, hidden, cell = self._decoder_step(
+                input_token, hidden, cell, encoder_outputs, mask, proj
+            )
+            log_probs = _log_softmax(output)
+            vocab_size = log_probs.shape[-1]
+            log_probs = log_probs.reshape(batch_size, k, vocab_size)
+
+            # finished beams can only extend with <eos> at no cost
+            eos_only = np.full_like(log_probs, -np.inf)
+            eos_only[..., self.eos_idx] = 0.0
+            log_probs = np.where(finished[..., None], eos_only, log_probs)
+
+            candidates = (scores[..., None] + log_probs).reshape(batch_size, -1)
+            flat_idx = np.argsort(-candidates, axis=1, kind="stable")[:, :k]
+            scores = np.take_along_axis(candidates, flat_idx, axis=1)
+            beam_idx = flat_idx // vocab_size
+            token_idx = flat_idx % vocab_size
+
+            tokens = np.concatenate(
+                (
+                    np.take_along_axis(tokens, beam_idx[..., None], axis=1),
+                    token_idx[..., None],
+                ),
+                axis=2,
+            )
+            finished = np.take_along_axis(finished, beam_idx, axis=1) | (
+                token_idx == self.eos_idx
+            )
+            if finished.all():
+                break
+
+            reorder = (beam_idx + row_offsets).reshape(-1)
+            hidden = hidden[:, reorder]
+            cell = cell[:, reorder]
+            input_token = token_idx.reshape(-1)
+
+        results: List[List[Tuple[List[int], float]]] = []
+        for row_tokens, row_scores in zip(tokens.tolist(), scores.tolist()):
+            results.append(
+                [
+                    (self._trim_eos(ids), score)
+                    for ids, score in zip(row_tokens, row_scores)
+                ]
+            )
+        return results
+
+    def transliterate_beam(
+        self, words: List[str], beam_width: int
+    ) -> List[List[Tuple[str, float]]]:
+        if not words:
+            return []
+
+        unique_words = list(dict.fromkeys(words))
+        src, lengths = self._encode_ids(unique_words)
+        with request_timing.stage("decode"):
+            decoded = self._beam_decode(src, lengths, max(1, beam_width))
+
+        by_word: Dict[str, List[Tuple[str, float]]] = {}
+        for word, beams in zip(unique_words, decoded):
+            seen = set()
+            candidates: List[Tuple[str, float]] = []
+            for ids, score in beams:
+                text = self.codec.decode(ids)
+                if text in seen or score == float("-inf"):
+                    continue
+                seen.add(text)
+                candidates.append((text, score))
+            by_word[word] = candidates
+        return [by_word[w] for w in words]
+
+
+def onnx_paths(model_dir: Path, lang: str) -> Tuple[Path, Path]:
+    return model_dir / f"{lang}_encoder.onnx", model_dir / f"{lang}_decoder.onnx"
+
+
+def onnx_available(model_dir: Path, lang: str) -> bool:
+    return ort is not None and all(p.exists() for p in onnx_paths(model_dir, lang))
+
+
+def load_onnx_model(
+    model_dir: Path,
+    lang: str,
+    char2idx_path: Path,
+    idx2char_path: Path,
+    checksum: str,
+    fixed_length: bool,
+) -> Optional[OnnxTranslitModel]:
+    """Build the ONNX model for `lang`, or None (with a log line) if unusable."""
+    if not onnx_available(model_dir, lang):
+        return None
+    encoder_path, decoder_path = onnx_paths(model_dir, lang)
+    try:
+        return OnnxTranslitModel(
+            lang=lang,
+            encoder_path=encoder_path,
+            decoder_path=decoder_path,
+            char2idx_path=char2idx_path,
+            idx2char_path=idx2char_path,
+            checksum=checksum,
+            fixed_length=fixed_length,
+        )
+    except Exception as e:
+        print(f"[OnnxTranslitModel] Cannot use ONNX model for {lang}: {e}")
+        return None
@@ -0,0 +1,215 @@
+# backend/src/ml/persistent_cache.py
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# hits only refresh last_used when it is older than this; keeps reads
+# from turning into a write per lookup
+TOUCH_INTERVAL_S = 60
+# row count is re-checked for eviction after this many inserts
+EVICT_CHECK_EVERY = 1000
+# evicting trims the table to this fraction of max_entries
+EVICT_TO = 0.9
+# SQLite caps bound parameters per statement (999 on older builds)
+_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    lang TEXT NOT NULL,
+    version TEXT NOT NULL,
+    word TEXT NOT NULL,
+    beam INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (lang, version, word, beam)
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+class PersistentResultCache:
+    """
+    On-disk word-level result cache shared by every process on the box.
+
+    SQLite in WAL mode: any number of API/worker processes read
+    concurrently while one writes, and entries survive restarts and
+    deploys. Keys include the model version (weights checksum +
+    precision), so results from a changed model file never match; rows
+    of other versions are purged when a language is loaded. The table
+    is capped at `max_entries`, evicting least recently used rows.
+
+    Every failure (locked database, disk full, corrupt file) is logged
+    and treated as a miss: this cache must never fail a request.
+    """
+
+    def __init__(self, path: Path, max_entries: int, timeout_s: float = 0.5) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.timeout_s = timeout_s
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._inserts_since_check = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=self.timeout_s,
+                check_same_thread=False,
+                isolation_level=None,  # explicit transactions below
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            # WAL + NORMAL: no fsync per commit, still crash-consistent
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _failed(self, op: str, error: Exception) -> None:
+        self.errors += 1
+        print(f"[PersistentCache] {op} failed: {error}")
+
+    def get_many(
+        self, lang: str, version: str, words: Sequence[str], beam_width: int
+    ) -> Dict[str, Any]:
+        """Cached results for whichever of `words` are stored."""
+        found: Dict[str, Any] = {}
+        if not words:
+            return found
+        now = int(time.time())
+        with self._lock:
+            try:
+                conn = self._connect()
+                stale: List[str] = []
+                for i in range(0, len(words), _CHUNK):
+                    chunk = list(words[i : i + _CHUNK])
+                    rows = conn.execute(
+                        "SELECT word, value, last_used FROM results "
+                        "WHERE lang = ? AND version = ? AND beam = ? "
+                        f"AND word IN ({','.join('?' * len(chunk))})",
+                        (lang, version, beam_width, *chunk),
+                    ).fetchall()
+                    for word, value, last_used in rows:
+                        found[word] = self._decode(value)
+                        if now - last_used > TOUCH_INTERVAL_S:
+                            stale.append(word)
+                if stale:
+                    conn.executemany(
+                        "UPDATE results SET last_used = ? "
+                        "WHERE lang = ? AND version = ? AND word = ? AND beam = ?",
+                        [(now, lang, version, w, beam_width) for w in stale],
+                    )
+            except (sqlite3.Error, OSError) as e:
+                self._failed("read", e)
+            self.hits += len(found)
+            self.misses += len(words) - len(found)
+        return found
+
+    def put_many(
+        self, lang: str, version: str, results: Dict[str, Any], beam_width: int
+    ) -> None:
+        if not results:
+            return
+        now = int(time.time())
+        rows = [
+            (
+                lang,
+                version,
+                word,
+                beam_width,
+                json.dumps(value, ensure_ascii=False),
+                now,
+            )
+            for word, value in results.items()
+        ]
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO results "
+                        "(lang, version, word, beam, value, last_used) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._inserts_since_check += len(rows)
+                    if self._inserts_since_check >= EVICT_CHECK_EVERY:
+                        self._inserts_since_check = 0
+                        self._evict(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                self.writes += len(rows)
+            except (sqlite3.Error, OSError) as e:
+                self._failed("write", e)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        if count <= self.max_entries:
+            return
+        excess = count - int(self.max_entries * EVICT_TO)
+        conn.execute(
+            "DELETE FROM results WHERE rowid IN "
+            "(SELECT rowid FROM results ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self.evictions += excess
+
+    def purge_stale(self, lang: str, version: str) -> None:
+        """Drop `lang` rows written by any other model version."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                cur = conn.execute(
+                    "DELETE FROM results WHERE lang = ? AND version != ?",
+                    (lang, version),
+                )
+                if cur.rowcount:
+                    print(
+                        f"[PersistentCache] Dropped {cur.rowcount} {lang} entries "
+                        f"from older model versions"
+                    )
+            except (sqlite3.Error, OSError) as e:
+                self._failed("purge", e)
+
+    @staticmethod
+    def _decode(value: str) -> Any:
+        # beam results round-trip through JSON as lists; restore the tuples
+        result = json.loads(value)
+        if isinstance(result, list):
+            return [tuple(cand) for cand in result]
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": str(self.path),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,135 @@
+# backend/src/ml/precision_parity.py
+
+"""
+Parity check for reduced-precision serving modes.
+
+Transliterates the processed Aksharantar val set with the fp32 model and
+with each requested precision, then reports exact-match accuracy and CER
+against the gold targets, the deltas vs fp32, and how often the reduced
+precision output is identical to fp32.
+
+Usage (from backend/):
+    python -m src.ml.precision_parity --lang hi --precision int8 bf16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .transliteration_inference import PRECISIONS, TransliterationEngine
+
+
+def levenshtein(a: str, b: str) -> int:
+    if a == b:
+        return 0
+    if len(a) == 0:
+        return len(b)
+    if len(b) == 0:
+        return len(a)
+
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+        prev = cur
+    return prev[-1]
+
+
+def load_val_pairs(path: Path, max_samples: Optional[int]) -> List[Tuple[str, str]]:
+    """(en, native) pairs from data/processed/aksharantar_<lang>_val.jsonl"""
+    pairs: List[Tuple[str, str]] = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            obj = json.loads(line)
+            src, tgt = obj.get("en"), obj.get("native")
+            if src and tgt:
+                pairs.append((str(src).strip(), str(tgt).strip()))
+            if max_samples is not None and len(pairs) >= max_samples:
+                break
+    return pairs
+
+
+def run_precision(
+    engine: TransliterationEngine,
+    lang: str,
+    precision: str,
+    srcs: List[str],
+    batch_size: int,
+) -> Tuple[List[str], float]:
+    model = engine.build_lang_model(lang, precision=precision)
+    if model is None:
+        raise FileNotFoundError(f"No model files for '{lang}' in {engine.model_dir}")
+
+    start = time.perf_counter()
+    preds: List[str] = []
+    for i in range(0, len(srcs), batch_size):
+        preds.extend(model.transliterate_batch(srcs[i : i + batch_size]))
+    return preds, time.perf_counter() - start
+
+
+def score(preds: List[str], golds: List[str]) -> Dict[str, float]:
+    exact = sum(p == g for p, g in zip(preds, golds))
+    cer = sum(levenshtein(p, g) / max(len(g), 1) for p, g in zip(preds, golds))
+    n = max(len(golds), 1)
+    return {"exact_match": exact / n, "cer": cer / n}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check int8/bf16 parity vs fp32")
+    parser.add_argument("--lang", required=True)
+    parser.add_argument(
+        "--precision",
+        nargs="+",
+        default=["int8", "bf16"],
+        choices=[p for p in PRECISIONS if p != "fp32"],
+    )
+    parser.add_argument("--val", type=Path, default=None, help="val JSONL path")
+    parser.add_argument("--model-dir", default=None)
+    parser.add_argument("--max-samples", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    val_path = args.val or Path(f"../data/processed/aksharantar_{args.lang}_val.jsonl")
+    pairs = load_val_pairs(val_path, args.max_samples)
+    if not pairs:
+        print(f"No val pairs found in {val_path}")
+        return
+    srcs = [s for s, _ in pairs]
+    golds = [t for _, t in pairs]
+    print(f"Loaded {len(pairs)} val pairs from {val_path}")
+
+    engine = TransliterationEngine(args.model_dir)
+    base_preds, base_time = run_precision(
+        engine, args.lang, "fp32", srcs, args.batch_size
+    )
+    base = score(base_preds, golds)
+    print(
+        f"\nfp32 : exact={base['exact_match']:.4f} cer={base['cer']:.4f} "
+        f"time={base_time:.2f}s"
+    )
+
+    for precision in args.precision:
+        preds, elapsed = run_precision(
+            engine, args.lang, precision, srcs, args.batch_size
+        )
+        res = score(preds, golds)
+        same = sum(p == b for p, b in zip(preds, base_preds)) / len(preds)
+        print(
+            f"{precision:<5}: exact={res['exact_match']:.4f} "
+            f"({res['exact_match'] - base['exact_match']:+.4f}) "
+            f"cer={res['cer']:.4f} ({res['cer'] - base['cer']:+.4f}) "
+            f"same_as_fp32={same:.4f} time={elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
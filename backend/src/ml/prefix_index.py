@@ -0,0 +1,281 @@
+# backend/src/ml/prefix_index.py
+
+"""
+Prefix autocomplete index: roman prefix -> top-N (roman, native) words.
+
+Entries live in a memory-mapped sorted array, so every worker shares the
+same pages. A prefix maps to a contiguous key range found by binary
+search. Small ranges (<= scan_limit entries) are ranked on the fly. For
+larger ranges the build precomputes the top_k entries, so every query
+touches at most scan_limit entries whatever the prefix.
+
+File layout (native byte order), written by `write_prefix_index`:
+
+    magic       8 bytes   b"TKPFX\\x00\\x01\\x00"
+    header      uint64[4]  n, n_hot, top_k, scan_limit
+    key_off     uint64[n + 1]
+    val_off     uint64[n + 1]
+    hot_off     uint64[n_hot + 1]
+    score       uint32[n]           popularity of each entry
+    hot_top     uint32[n_hot * top_k]  entry ids, padded with 0xFFFFFFFF
+    keys, values, hot prefixes      utf-8 blobs, keys/prefixes sorted bytewise
+"""
+
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config.settings import settings
+from .lexicon import normalize_key
+
+MAGIC = b"TKPFX\x00\x01\x00"
+_HEADER = len(MAGIC) + 8 * 4
+_NO_ENTRY = 0xFFFFFFFF
+
+DEFAULT_TOP_K = 10
+DEFAULT_SCAN_LIMIT = 128
+
+# (roman, native, score)
+Suggestion = Tuple[str, str, int]
+
+
+def _rank(score: int, key: bytes) -> Tuple[int, int, bytes]:
+    # most popular first, then shorter words, then alphabetical
+    return (-score, len(key), key)
+
+
+def _offsets(blobs: Sequence[bytes]) -> np.ndarray:
+    out = np.zeros(len(blobs) + 1, dtype=np.uint64)
+    np.cumsum([len(b) for b in blobs], out=out[1:])
+    return out
+
+
+def write_prefix_index(
+    entries: Iterable[Tuple[str, str, int]],
+    path: Path,
+    top_k: int = DEFAULT_TOP_K,
+    scan_limit: int = DEFAULT_SCAN_LIMIT,
+) -> int:
+    """
+    Write (roman, native, score) entries as a prefix index; roman keys are
+    normalised and must be unique. Returns the number of entries.
+    """
+    rows = sorted(
+        (normalize_key(k).encode("utf-8"), v.encode("utf-8"), int(s))
+        for k, v, s in entries
+    )
+    keys = [k for k, _, _ in rows]
+    if any(a == b for a, b in zip(keys, keys[1:])):
+        raise ValueError("prefix index keys must be unique after normalisation")
+    values = [v for _, v, _ in rows]
+    scores = [s for _, _, s in rows]
+    rank = [_rank(s, k) for k, s in zip(keys, scores)]
+
+    hot: Dict[bytes, List[int]] = {}
+
+    def top(lo: int, hi: int, depth: int) -> List[int]:
+        # top_k entries of keys[lo:hi], which all share keys[lo][:depth]
+        if hi - lo <= scan_limit:
+            return heapq.nsmallest(top_k, range(lo, hi), key=rank.__getitem__)
+        cands: List[int] = []
+        i = lo
+        if len(keys[i]) == depth:  # the prefix itself is a word
+            cands.append(i)
+            i += 1
+        while i < hi:
+            j = bisect_left(keys, keys[i][: depth + 1] + b"\xff", i, hi)
+            cands.extend(top(i, j, depth + 1))
+            i = j
+        best = heapq.nsmallest(top_k, cands, key=rank.__getitem__)
+        if depth > 0:
+            hot[keys[lo][:depth]] = best
+        return best
+
+    if keys:
+        top(0, len(keys), 0)
+
+    hot_keys = sorted(hot)
+    hot_top = np.full((len(hot_keys), top_k), _NO_ENTRY, dtype=np.uint32)
+    for row, prefix in enumerate(hot_keys):
+        hot_top[row, : len(hot[prefix])] = hot[prefix]
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    header = [len(keys), len(hot_keys), top_k, scan_limit]
+    with tmp.open("wb") as f:
+        f.write(MAGIC)
+        f.write(np.array(header, dtype=np.uint64).tobytes())
+        f.write(_offsets(keys).tobytes())
+        f.write(_offsets(values).tobytes())
+        f.write(_offsets(hot_keys).tobytes())
+        f.write(np.array(scores, dtype=np.uint32).tobytes())
+        f.write(hot_top.tobytes())
+        f.write(b"".join(keys))
+        f.write(b"".join(values))
+        f.write(b"".join(hot_keys))
+    os.replace(tmp, path)
+    return len(keys)
+
+
+class _Blob(Sequence[bytes]):
+    """Sequence view over one offsets + blob pair, for bisect."""
+
+    def __init__(self, mm: mmap.mmap, offsets: memoryview, start: int) -> None:
+        self._mm = mm
+        self._off = offsets
+        self._start = start
+        self._n = len(offsets) - 1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i):  # type: ignore[override]
+        return self._mm[self._start + self._off[i] : self._start + self._off[i + 1]]
+
+    @property
+    def size(self) -> int:
+        return self._off[self._n]
+
+
+class PrefixIndex:
+    """Read-only view of one prefix index file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a prefix index file")
+
+        view = memoryview(self._mm)
+        n, n_hot, self.top_k, self.scan_limit = view[len(MAGIC) : _HEADER].cast("Q")
+        pos = _HEADER
+
+        def take(count: int, fmt: str, width: int) -> memoryview:
+            nonlocal pos
+            out = view[pos : pos + count * width].cast(fmt)
+            pos += count * width
+            return out
+
+        key_off = take(n + 1, "Q", 8)
+        val_off = take(n + 1, "Q", 8)
+        hot_off = take(n_hot + 1, "Q", 8)
+        self._score = take(n, "I", 4)
+        self._hot_top = take(n_hot * self.top_k, "I", 4)
+        self._views = [key_off, val_off, hot_off, self._score, self._hot_top]
+
+        self._keys = _Blob(self._mm, key_off, pos)
+        self._values = _Blob(self._mm, val_off, pos + self._keys.size)
+        self._hot = _Blob(self._mm, hot_off, pos + self._keys.size + self._values.size)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _entry(self, i: int) -> Suggestion:
+        return (
+            self._keys[i].decode("utf-8"),
+            self._values[i].decode("utf-8"),
+            self._score[i],
+        )
+
+    def complete(self, prefix: str, limit: int = DEFAULT_TOP_K) -> List[Suggestion]:
+        """Top `limit` words starting with `prefix`, most popular first."""
+        key = normalize_key(prefix).encode("utf-8")
+        if not key or limit <= 0:
+            return []
+        keys = self._keys
+        lo = bisect_left(keys, key)
+        # no utf-8 byte is 0xff, so this is the first key past the prefix
+        hi = bisect_left(keys, key + b"\xff", lo)
+
+        if hi - lo <= self.scan_limit:
+            score = self._score
+            ids = heapq.nsmallest(
+                limit, range(lo, hi), key=lambda i: _rank(score[i], keys[i])
+            )
+        else:
+            row = bisect_left(self._hot, key)
+            if row == len(self._hot) or self._hot[row] != key:
+                raise ValueError(f"{self.path} has no top list for {prefix!r}")
+            base = row * self.top_k
+            ids = [
+                i
+                for i in self._hot_top[base : base + min(limit, self.top_k)]
+                if i != _NO_ENTRY
+            ]
+        return [self._entry(i) for i in ids]
+
+    def close(self) -> None:
+        # the array views keep the buffer exported; release them first
+        for view in self._views:
+            view.release()
+        self._mm.close()
+
+
+class PrefixIndexRegistry:
+    """
+    Lazily opens {lang}_prefix.bin from the model directory, once per
+    language; a missing file means "no suggestions" for that language.
+    """
+
+    def __init__(self, model_dir: Path) -> None:
+        self.model_dir = Path(model_dir)
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, Optional[PrefixIndex]] = {}
+        self.queries = 0
+        self._query_s = 0.0
+
+    def path(self, lang: str) -> Path:
+        return self.model_dir / f"{lang}_prefix.bin"
+
+    def get(self, lang: str) -> Optional[PrefixIndex]:
+        with self._lock:
+            if lang not in self._indexes:
+                path = self.path(lang)
+                try:
+                    self._indexes[lang] = PrefixIndex(path) if path.exists() else None
+                except (OSError, ValueError) as e:
+                    print(f"[PrefixIndex] Could not open {path}: {e}")
+                    self._indexes[lang] = None
+            return self._indexes[lang]
+
+    def complete(
+        self, prefix: str, lang: str, limit: int
+    ) -> Optional[List[Suggestion]]:
+        """Suggestions for `prefix`, or None if `lang` has no index."""
+        index = self.get(lang)
+        if index is None:
+            return None
+        started = time.perf_counter()
+        result = index.complete(prefix, limit)
+        with self._lock:
+            self.queries += 1
+            self._query_s += time.perf_counter() - started
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": {
+                    lang: len(index)
+                    for lang, index in self._indexes.items()
+                    if index is not None
+                },
+                "queries": self.queries,
+                "query_us_avg": (
+                    self._query_s / self.queries * 1e6 if self.queries else 0.0
+                ),
+            }
+
+
+prefix_indexes = PrefixIndexRegistry(Path(settings.MODEL_DIR))
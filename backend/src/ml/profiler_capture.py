@@ -0,0 +1,108 @@
+# backend/src/ml/profiler_capture.py
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import torch
+from torch.profiler import ProfilerActivity, profile
+
+from ..config.settings import settings
+
+# traces listed by status(); older ones stay on disk
+RECENT_TRACES = 20
+
+
+class ProfilerCapture:
+    """
+    On-demand torch.profiler traces of upcoming model decodes.
+
+    `arm(count, lang)` profiles the next `count` decodes that reach the
+    model (cache hits never do), optionally only those for `lang`. Each
+    writes a Chrome trace (open in chrome://tracing or Perfetto) plus a
+    text table of the top ops to `out_dir`. With micro-batching, one
+    decode can cover words from several requests.
+
+    The profiler can't run twice at once, so while one decode is being
+    profiled, concurrent ones run unprofiled and don't use up the count.
+    """
+
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = Path(out_dir)
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._lang: Optional[str] = None
+        self._active = False
+        self._seq = 0
+        self.traces: List[str] = []
+
+    def arm(self, count: int, lang: Optional[str] = None) -> Dict[str, Any]:
+        """Profile the next `count` decodes (0 disarms)."""
+        with self._lock:
+            self._remaining = max(0, count)
+            self._lang = lang
+        return self.status()
+
+    def _claim(self, lang: str) -> bool:
+        with self._lock:
+            if self._remaining <= 0 or self._active:
+                return False
+            if self._lang is not None and lang != self._lang:
+                return False
+            self._remaining -= 1
+            self._active = True
+            self._seq += 1
+            return True
+
+    @contextmanager
+    def capture(self, lang: str) -> Iterator[None]:
+        """Profile the block if a capture is armed for `lang`; no-op otherwise."""
+        if not self._claim(lang):
+            yield
+            return
+        try:
+            activities = [ProfilerActivity.CPU]
+            if torch.cuda.is_available():
+                activities.append(ProfilerActivity.CUDA)
+            with profile(activities=activities, record_shapes=True) as prof:
+                yield
+            self._export(prof, lang)
+        finally:
+            with self._lock:
+                self._active = False
+
+    def _export(self, prof: profile, lang: str) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = self.out_dir / f"{stamp}_{lang}_{os.getpid()}_{self._seq}"
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            prof.export_chrome_trace(str(base.with_suffix(".json")))
+            table = prof.key_averages().table(
+                sort_by="self_cpu_time_total", row_limit=30
+            )
+            base.with_suffix(".txt").write_text(table, encoding="utf-8")
+        except OSError as e:
+            print(f"[Profiler] Could not write trace {base}: {e}")
+            return
+        print(f"[Profiler] Wrote {base}.json")
+        with self._lock:
+            self.traces = (self.traces + [f"{base}.json"])[-RECENT_TRACES:]
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "remaining": self._remaining,
+                "target_lang": self._lang,
+                "active": self._active,
+                "out_dir": str(self.out_dir),
+                "traces": list(self.traces),
+            }
+
+
+profiler_capture = ProfilerCapture(Path(settings.PROFILE_DIR))
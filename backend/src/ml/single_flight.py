@@ -0,0 +1,112 @@
+# backend/src/ml/single_flight.py
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LoadBackoffError(RuntimeError):
+    """Raised while a key is backing off after a failed load."""
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Failure:
+    def __init__(self) -> None:
+        self.count = 0
+        self.retry_at = 0.0
+        self.last_error = ""
+
+
+class SingleFlight:
+    """
+    Run at most one load per key at a time; concurrent callers for the same
+    key block until that load finishes and share its result (or error).
+
+    A load that raises puts its key into exponential backoff: until
+    `retry_at`, callers fail fast with LoadBackoffError instead of hitting
+    the disk again. The next load after the backoff window is a normal
+    retry; a success clears the failure record.
+    """
+
+    def __init__(self, retry_base_s: float, retry_max_s: float) -> None:
+        self.retry_base_s = retry_base_s
+        self.retry_max_s = retry_max_s
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._failures: Dict[Hashable, _Failure] = {}
+        self.loads = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                failure = self._failures.get(key)
+                if failure is not None and time.monotonic() < failure.retry_at:
+                    raise LoadBackoffError(
+                        f"Loading {key!r} failed {failure.count}x "
+                        f"({failure.last_error}); retrying in "
+                        f"{failure.retry_at - time.monotonic():.1f}s"
+                    )
+                flight = _Flight()
+                self._flights[key] = flight
+                self.loads += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = load()
+        except BaseException as e:
+            flight.error = e
+            self._record_failure(key, e)
+            raise
+        else:
+            with self._lock:
+                self._failures.pop(key, None)
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result
+
+    def _record_failure(self, key: Hashable, error: BaseException) -> None:
+        with self._lock:
+            failure = self._failures.setdefault(key, _Failure())
+            failure.count += 1
+            delay = min(
+                self.retry_base_s * (2 ** (failure.count - 1)), self.retry_max_s
+            )
+            failure.retry_at = time.monotonic() + delay
+            failure.last_error = f"{type(error).__name__}: {error}"
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "loads": self.loads,
+                "shared_waits": self.shared,
+                "in_flight": sorted(map(str, self._flights)),
+                "failures": {
+                    str(key): {
+                        "count": f.count,
+                        "retry_in_s": max(0.0, round(f.retry_at - now, 3)),
+                        "last_error": f.last_error,
+                    }
+                    for key, f in self._failures.items()
+                },
+            }
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Tuple, Union
 
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
+from torch.nn.utils.rnn import pack_padded_sequence, pad_packed_sequence
 
 from ..config.settings import settings  # uses MODEL_DIR from your settings
+from ..utils import metrics, request_timing
+from ..utils.process_memory import process_memory
+from .char_codec import CharCodec
+from .onnx_inference import OnnxTranslitModel, load_onnx_model
+from .model_residency import ModelResidency
+from .persistent_cache import PersistentResultCache
+from .profiler_capture import profiler_capture
+from .result_cache import ResultCache
+from .single_flight import SingleFlight
+from .worker_pool import InferenceWorkerPool
 
 
 # --- Model architecture (must match training) -------------------------------
@@ -26,9 +41,19 @@ class Encoder(nn.Module):
             bidirectional=True,
         )
 
-    def forward(self, src: torch.Tensor):
+    def forward(self, src: torch.Tensor, src_lengths: Optional[torch.Tensor] = None):
         embedded = self.embedding(src)  # (batch, src_len, emb_dim)
-        outputs, (hidden, cell) = self.rnn(embedded)
+        if src_lengths is None:
+            outputs, (hidden, cell) = self.rnn(embedded)
+        else:
+            # pack so the LSTM (both directions) never reads padding
+            packed = pack_padded_sequence(
+                embedded, src_lengths.cpu(), batch_first=True, enforce_sorted=False
+            )
+            packed_outputs, (hidden, cell) = self.rnn(packed)
+            outputs, _ = pad_packed_sequence(
+                packed_outputs, batch_first=True, total_length=src.size(1)
+            )
         # hidden, cell: (2, batch, hid_dim)
         hidden = hidden[0] + hidden[1]  # (batch, hid_dim)
         cell = cell[0] + cell[1]  # (batch, hid_dim)
@@ -40,23 +65,48 @@ class Encoder(nn.Module):
 class Attention(nn.Module):
     def __init__(self, hid_dim: int):
         super().__init__()
+        self.hid_dim = hid_dim
         self.attn = nn.Linear(hid_dim * 3, hid_dim)
         self.v = nn.Linear(hid_dim, 1, bias=False)
 
-    def forward(self, hidden: torch.Tensor, encoder_outputs: torch.Tensor):
+    def project_encoder(self, encoder_outputs: torch.Tensor) -> torch.Tensor:
+        """
+        Encoder half of self.attn (plus its bias). It only depends on the
+        encoder outputs, so decoding computes it once per sequence instead
+        of once per step.
+        encoder_outputs: (batch, src_len, hid_dim*2) -> (batch, src_len, hid_dim)
+        """
+        weight = self.attn.weight[:, self.hid_dim :]
+        return F.linear(encoder_outputs, weight, self.attn.bias)
+
+    def forward(
+        self,
+        hidden: torch.Tensor,
+        encoder_outputs: torch.Tensor,
+        mask: Optional[torch.Tensor] = None,
+        encoder_proj: Optional[torch.Tensor] = None,
+    ):
         # hidden: (1, batch, hid_dim)
         # encoder_outputs: (batch, src_len, hid_dim*2)
+        # mask: (batch, src_len), True for real (non-pad) positions
+        # encoder_proj: project_encoder(encoder_outputs), if precomputed
         hidden = hidden[-1]  # (batch, hid_dim)
-        batch_size = encoder_outputs.size(0)
-        src_len = encoder_outputs.size(1)
-
-        hidden_expanded = hidden.unsqueeze(1).repeat(
-            1, src_len, 1
-        )  # (batch, src_len, hid_dim)
-        energy = torch.tanh(
-            self.attn(torch.cat((hidden_expanded, encoder_outputs), dim=2))
-        )
+
+        if encoder_proj is not None:
+            # W [h; e] + b == W_h h + (W_e e + b); only W_h h changes per step
+            hidden_proj = F.linear(hidden, self.attn.weight[:, : self.hid_dim])
+            energy = torch.tanh(encoder_proj + hidden_proj.unsqueeze(1))
+        else:
+            src_len = encoder_outputs.size(1)
+            hidden_expanded = hidden.unsqueeze(1).repeat(
+                1, src_len, 1
+            )  # (batch, src_len, hid_dim)
+            energy = torch.tanh(
+                self.attn(torch.cat((hidden_expanded, encoder_outputs), dim=2))
+            )
         attention = self.v(energy).squeeze(2)  # (batch, src_len)
+        if mask is not None:
+            attention = attention.masked_fill(~mask, -1e10)
         return torch.softmax(attention, dim=1)
 
 
@@ -76,12 +126,16 @@ class Decoder(nn.Module):
         hidden: torch.Tensor,
         cell: torch.Tensor,
         encoder_outputs: torch.Tensor,
+        mask: Optional[torch.Tensor] = None,
+        encoder_proj: Optional[torch.Tensor] = None,
     ):
         # input: (batch,)
         input = input.unsqueeze(1)  # (batch, 1)
         embedded = self.embedding(input)  # (batch, 1, emb_dim)
 
-        attn_weights = self.attention(hidden, encoder_outputs)  # (batch, src_len)
+        attn_weights = self.attention(
+            hidden, encoder_outputs, mask, encoder_proj
+        )  # (batch, src_len)
         attn_weights = attn_weights.unsqueeze(1)  # (batch, 1, src_len)
         context = torch.bmm(attn_weights, encoder_outputs)  # (batch, 1, hid_dim*2)
 
@@ -101,13 +155,71 @@ class Decoder(nn.Module):
         return prediction, hidden, cell
 
 
-# --- Loaded model wrapper ---------------------------------------------------
+PRECISIONS = ("fp32", "int8", "bf16")
+
+
+def file_checksum(path: Path) -> str:
+    """sha256 of a file; identifies the exact weights a result came from."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tensor_bytes(obj: Any) -> int:
+    """
+    Bytes held by the tensors in a state_dict value. Dynamically quantized
+    modules keep their packed weights in ScriptObjects, whose state is
+    unpacked recursively.
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.numel() * obj.element_size()
+    if isinstance(obj, (tuple, list)):
+        return sum(tensor_bytes(x) for x in obj)
+    if isinstance(obj, torch.ScriptObject):
+        try:
+            return tensor_bytes(obj.__getstate__())
+        except Exception:
+            return 0
+    return 0
+
+
+def share_weights(scripted: torch.jit.ScriptModule, eager: nn.Module) -> bool:
+    """
+    Point a TorchScript module's parameters and buffers at the tensors of
+    the eager module it was scripted from, so the two hold one copy of the
+    weights (the memory-mapped one with MODEL_MMAP). Returns False, leaving
+    `scripted` untouched, if their state doesn't line up.
+    """
+    tensors = dict(eager.named_parameters())
+    tensors.update(eager.named_buffers())
+    current = scripted.state_dict()
+    if set(tensors) != set(current) or any(
+        t.shape != current[name].shape or t.dtype != current[name].dtype
+        for name, t in tensors.items()
+    ):
+        return False
 
+    modules = dict(scripted.named_modules())
+    for name, tensor in tensors.items():
+        path, _, attr = name.rpartition(".")
+        setattr(modules[path], attr, tensor)
+    # scripted RNNs read their weights from this list, not the attributes
+    for module in modules.values():
+        names = getattr(module, "_flat_weights_names", None)
+        if names is not None:
+            module._flat_weights = [getattr(module, n) for n in names]
+    return True
 
-PAD_TOKEN = "<pad>"
-SOS_TOKEN = "<sos>"
-EOS_TOKEN = "<eos>"
-UNK_TOKEN = "<unk>"
+
+def length_mask(lengths: torch.Tensor, max_len: int) -> torch.Tensor:
+    """(batch,) lengths -> (batch, max_len) bool mask, True for real positions."""
+    positions = torch.arange(max_len, device=lengths.device)
+    return positions.unsqueeze(0) < lengths.unsqueeze(1)
+
+
+# --- Loaded model wrapper ---------------------------------------------------
 
 
 class LoadedTranslitModel:
@@ -121,26 +233,26 @@ class LoadedTranslitModel:
         emb_dim: int = 128,
         hid_dim: int = 256,
         max_len: int = 40,
+        fixed_length: bool = False,
+        precision: str = "fp32",
+        compiled_path: Optional[Path] = None,
+        mmap: bool = False,
     ):
         self.lang = lang
+        self.backend = "torch"
         self.device = device
         self.max_len = max_len
+        # pad every input to max_len without masks, like checkpoints
+        # trained before variable-length batches expect
+        self.fixed_length = fixed_length
 
-        # load vocab
-        with char2idx_path.open("r", encoding="utf-8") as f:
-            self.char2idx: Dict[str, int] = json.load(f)
-
-        with idx2char_path.open("r", encoding="utf-8") as f:
-            raw_idx2char = json.load(f)
-            # keys might be strings in json, convert to int
-            self.idx2char: Dict[int, str] = {int(k): v for k, v in raw_idx2char.items()}
+        # load vocab (same codec as the training scripts)
+        self.codec = CharCodec.from_files(char2idx_path, idx2char_path, max_len)
+        self.pad_idx = self.codec.pad_idx
+        self.sos_idx = self.codec.sos_idx
+        self.eos_idx = self.codec.eos_idx
 
-        self.pad_idx = self.char2idx.get(PAD_TOKEN, 0)
-        self.sos_idx = self.char2idx.get(SOS_TOKEN, 1)
-        self.eos_idx = self.char2idx.get(EOS_TOKEN, 2)
-        self.unk_idx = self.char2idx.get(UNK_TOKEN, 3)
-
-        vocab_size = len(self.char2idx)
+        vocab_size = len(self.codec)
 
         # build model
         encoder = Encoder(vocab_size, emb_dim, hid_dim)
@@ -149,56 +261,318 @@ class LoadedTranslitModel:
         self.model = Seq2Seq(encoder, decoder, device).to(device)
 
         # load weights
-        state = torch.load(model_path, map_location=device)
-        self.model.load_state_dict(state)
+        self.checksum = file_checksum(model_path)
+        if mmap and device.type == "cpu":
+            # parameters become views of the read-only file mapping, so
+            # every worker serving this checkpoint shares its page cache
+            # pages instead of holding a private copy
+            state = torch.load(
+                model_path, map_location=device, mmap=True, weights_only=True
+            )
+            self.model.load_state_dict(state, assign=True)
+        else:
+            state = torch.load(model_path, map_location=device)
+            self.model.load_state_dict(state)
+        self.mmap = mmap and device.type == "cpu"
         self.model.eval()
 
-    def _encode_text(self, text: str) -> torch.Tensor:
-        ids = [self.sos_idx]
-        for ch in text:
-            ids.append(self.char2idx.get(ch, self.unk_idx))
-            if len(ids) >= self.max_len - 1:
-                break
-        ids.append(self.eos_idx)
-        if len(ids) < self.max_len:
-            ids += [self.pad_idx] * (self.max_len - len(ids))
-        ids = ids[: self.max_len]
-        return torch.tensor(ids, dtype=torch.long, device=self.device).unsqueeze(
-            0
-        )  # (1, max_len)
-
-    def _decode_ids(self, ids: List[int]) -> str:
-        chars: List[str] = []
-        for idx in ids:
-            if idx in (self.pad_idx, self.sos_idx):
-                continue
-            if idx == self.eos_idx:
-                break
-            ch = self.idx2char.get(idx, "")
-            if ch:
-                chars.append(ch)
-        return "".join(chars)
+        self.precision = self._apply_precision(precision)
+        # identifies the exact numerics behind a result (weights + precision)
+        self.version = f"{self.checksum}:{self.precision}"
 
-    def transliterate(self, text: str) -> str:
+        self.greedy_search: nn.Module = GreedySearch(
+            self.model.encoder,
+            self.model.decoder,
+            self.sos_idx,
+            self.eos_idx,
+            self.max_len,
+        )
+        self.compiled = False
+        if compiled_path is not None and compiled_path.exists():
+            self._load_compiled(compiled_path)
+
+    def footprint_bytes(self) -> int:
+        """Weight and buffer bytes of this model (a compiled loop shares them)."""
+        return sum(tensor_bytes(value) for value in self.model.state_dict().values())
+
+    def compiled_meta(self) -> Dict[str, Any]:
+        """What a compiled artifact must agree on to replace the eager loop."""
+        return {
+            "checksum": self.checksum,
+            "fixed_length": self.fixed_length,
+            "max_len": self.max_len,
+            "sos_idx": self.sos_idx,
+            "eos_idx": self.eos_idx,
+        }
+
+    def _load_compiled(self, path: Path) -> None:
+        """
+        Swap the eager greedy loop for a TorchScript artifact written by
+        export_torchscript.py. Stale or mismatching artifacts are ignored.
+        """
+        if self.precision != "fp32":
+            print(
+                f"[TranslitModel] {path.name} is fp32, "
+                f"using eager {self.precision} decoding for {self.lang}"
+            )
+            return
+
+        extra_files = {"meta.json": ""}
+        try:
+            scripted = torch.jit.load(
+                str(path), map_location=self.device, _extra_files=extra_files
+            )
+            meta = json.loads(extra_files["meta.json"] or "{}")
+        except Exception as e:
+            print(f"[TranslitModel] Failed to load {path.name}, using eager: {e}")
+            return
+
+        if meta != self.compiled_meta():
+            print(
+                f"[TranslitModel] {path.name} does not match {self.lang} "
+                f"checkpoint (re-export it), using eager decoding"
+            )
+            return
+
+        # beam search keeps using the eager modules, so the artifact's own
+        # copy of the weights is dropped in favour of theirs
+        if not share_weights(scripted, self.greedy_search):
+            print(
+                f"[TranslitModel] {path.name} has different parameters than "
+                f"the {self.lang} model (re-export it), using eager decoding"
+            )
+            return
+
+        scripted.eval()
+        self.greedy_search = scripted
+        self.compiled = True
+
+    def _apply_precision(self, precision: str) -> str:
+        """
+        Convert the loaded fp32 model for serving. Returns the precision
+        actually in use.
+        - int8: dynamic quantization of the LSTMs and fc_out. Attention stays
+          fp32 because its weight is split for the precomputed projection.
+        - bf16: all weights and activations in bfloat16.
+        """
+        precision = precision.lower()
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision {precision!r}, expected one of {PRECISIONS}"
+            )
+
+        if precision == "int8":
+            if self.device.type != "cpu":
+                print(
+                    f"[TranslitModel] int8 dynamic quantization is CPU only, "
+                    f"keeping {self.lang} in fp32"
+                )
+                return "fp32"
+            qconfig = torch.ao.quantization.default_dynamic_qconfig
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model,
+                {
+                    "encoder.rnn": qconfig,
+                    "decoder.rnn": qconfig,
+                    "decoder.fc_out": qconfig,
+                },
+                dtype=torch.qint8,
+            )
+        elif precision == "bf16":
+            self.model = self.model.to(torch.bfloat16)
+
+        return precision
+
+    def _encode_batch(
+        self, texts: List[str]
+    ) -> Tuple[torch.Tensor, Optional[torch.Tensor]]:
+        """
+        Returns (src, src_lengths). src is padded to the longest item in the
+        batch; src_lengths is None in fixed-length mode.
+        """
+        ids, lengths = self.codec.encode_batch(
+            texts, width=self.max_len if self.fixed_length else None
+        )
+        src = torch.from_numpy(ids).to(self.device)  # (batch, width)
+
+        if self.fixed_length:
+            return src, None
+        return src, torch.from_numpy(lengths)
+
+    def _encode_source(self, src: torch.Tensor, src_lengths: Optional[torch.Tensor]):
+        """
+        Run the encoder and everything else that stays constant while
+        decoding: the padding mask and the encoder side of attention.
+        """
+        encoder_outputs, hidden, cell = self.model.encoder(src, src_lengths)
+        mask = None
+        if src_lengths is not None:
+            mask = length_mask(src_lengths.to(self.device), src.size(1))
+        encoder_proj = self.model.decoder.attention.project_encoder(encoder_outputs)
+        return encoder_outputs, hidden, cell, mask, encoder_proj
+
+    def _greedy_decode(
+        self, src: torch.Tensor, src_lengths: Optional[torch.Tensor] = None
+    ) -> List[List[int]]:
+        """
+        Greedy decode a whole batch at once, with the compiled TorchScript
+        artifact when one was loaded, otherwise the eager GreedySearch.
+        src: (batch, src_len) -> one list of output ids per row (without <eos>).
+        """
+        if src_lengths is not None:
+            src_lengths = src_lengths.to(self.device)
+        steps = self.greedy_search(src, src_lengths)  # (batch, steps)
+
+        decoded = steps.tolist()
+        results: List[List[int]] = []
+        for row in decoded:
+            if self.eos_idx in row:
+                row = row[: row.index(self.eos_idx)]
+            results.append(row)
+        return results
+
+    def transliterate_batch(self, words: List[str]) -> List[str]:
+        """
+        Transliterate many words with a single encoder pass and one batched
+        decode loop. Repeated words are only decoded once.
+        """
+        if not words:
+            return []
+
+        unique_words = list(dict.fromkeys(words))
         with torch.no_grad():
-            src = self._encode_text(text)
-            encoder_outputs, hidden, cell = self.model.encoder(src)
+            with request_timing.stage("encode"):
+                src, src_lengths = self._encode_batch(unique_words)
+            # the compiled greedy search fuses the encoder pass into the
+            # decode loop, so network time is all counted as "decode"
+            with request_timing.stage("decode"):
+                decoded_ids = self._greedy_decode(src, src_lengths)
+                texts = self.codec.decode_batch(decoded_ids)
+
+        # +1 for the <eos> step (or the max_len cutoff)
+        metrics.decoder_steps.observe_many(
+            [len(row) + 1 for row in decoded_ids], lang=self.lang
+        )
+        by_word = dict(zip(unique_words, texts))
+        return [by_word[w] for w in words]
 
-            # start decoder with <sos>
-            input_token = torch.tensor([self.sos_idx], device=self.device)
-            decoded_ids: List[int] = []
+    def transliterate(self, text: str) -> str:
+        return self.transliterate_batch([text])[0]
 
-            for _ in range(self.max_len):
-                output, hidden, cell = self.model.decoder(
-                    input_token, hidden, cell, encoder_outputs
-                )
-                next_id = int(output.argmax(dim=-1).item())
-                if next_id == self.eos_idx:
-                    break
-                decoded_ids.append(next_id)
-                input_token = torch.tensor([next_id], device=self.device)
+    def _beam_decode(
+        self,
+        src: torch.Tensor,
+        beam_width: int,
+        src_lengths: Optional[torch.Tensor] = None,
+    ) -> List[List[Tuple[List[int], float]]]:
+        """
+        Beam search over a whole batch at once.
+        src: (batch, src_len) -> per row, `beam_width` (ids, log_prob) pairs
+        sorted best first.
+        The encoder runs once per word; its outputs are shared by all beams
+        of that word, and all batch * beam_width hypotheses are decoded as
+        a single tensor.
+        """
+        batch_size = src.size(0)
+        k = beam_width
+        encoder_outputs, hidden, cell, mask, encoder_proj = self._encode_source(
+            src, src_lengths
+        )
+
+        # (batch, ...) -> (batch * k, ...), beams of a word are contiguous
+        encoder_outputs = encoder_outputs.repeat_interleave(k, dim=0)
+        encoder_proj = encoder_proj.repeat_interleave(k, dim=0)
+        if mask is not None:
+            mask = mask.repeat_interleave(k, dim=0)
+        hidden = hidden.repeat_interleave(k, dim=1)
+        cell = cell.repeat_interleave(k, dim=1)
+
+        # only the first beam is live at the start so beams don't duplicate
+        scores = torch.full((batch_size, k), float("-inf"), device=self.device)
+        scores[:, 0] = 0.0
+        finished = torch.zeros(batch_size, k, dtype=torch.bool, device=self.device)
+        tokens = torch.empty(batch_size, k, 0, dtype=torch.long, device=self.device)
+        input_token = torch.full(
+            (batch_size * k,), self.sos_idx, dtype=torch.long, device=self.device
+        )
+        row_offsets = (torch.arange(batch_size, device=self.device) * k).unsqueeze(1)
+
+        for _ in range(self.max_len):
+            output, hidden, cell = self.model.decoder(
+                input_token, hidden, cell, encoder_outputs, mask, encoder_proj
+            )
+            log_probs = torch.log_softmax(output.float(), dim=-1)
+            vocab_size = log_probs.size(-1)
+            log_probs = log_probs.view(batch_size, k, vocab_size)
+
+            # finished beams can only extend with <eos> at no cost, which
+            # carries them (and their score) forward unchanged
+            eos_only = torch.full_like(log_probs, float("-inf"))
+            eos_only[..., self.eos_idx] = 0.0
+            log_probs = torch.where(finished.unsqueeze(-1), eos_only, log_probs)
+
+            candidates = (scores.unsqueeze(-1) + log_probs).view(batch_size, -1)
+            scores, flat_idx = candidates.topk(k, dim=1)  # (batch, k)
+            beam_idx = torch.div(flat_idx, vocab_size, rounding_mode="floor")
+            token_idx = flat_idx % vocab_size
+
+            tokens = torch.cat(
+                (
+                    tokens.gather(
+                        1, beam_idx.unsqueeze(-1).expand(-1, -1, tokens.size(2))
+                    ),
+                    token_idx.unsqueeze(-1),
+                ),
+                dim=2,
+            )
+            finished = finished.gather(1, beam_idx) | (token_idx == self.eos_idx)
+            if bool(finished.all()):
+                break
 
-        return self._decode_ids(decoded_ids)
+            reorder = (beam_idx + row_offsets).view(-1)
+            hidden = hidden[:, reorder]
+            cell = cell[:, reorder]
+            input_token = token_idx.view(-1)
+
+        results: List[List[Tuple[List[int], float]]] = []
+        for row_tokens, row_scores in zip(tokens.tolist(), scores.tolist()):
+            beams: List[Tuple[List[int], float]] = []
+            for ids, score in zip(row_tokens, row_scores):
+                if self.eos_idx in ids:
+                    ids = ids[: ids.index(self.eos_idx)]
+                beams.append((ids, score))
+            results.append(beams)
+        return results
+
+    def transliterate_beam(
+        self, words: List[str], beam_width: int
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Return up to `beam_width` (spelling, log_prob) candidates per word,
+        best first. Repeated words are only decoded once.
+        """
+        if not words:
+            return []
+
+        unique_words = list(dict.fromkeys(words))
+        with torch.no_grad():
+            with request_timing.stage("encode"):
+                src, src_lengths = self._encode_batch(unique_words)
+            with request_timing.stage("decode"):
+                decoded = self._beam_decode(src, max(1, beam_width), src_lengths)
+
+        by_word: Dict[str, List[Tuple[str, float]]] = {}
+        for word, beams in zip(unique_words, decoded):
+            seen = set()
+            candidates: List[Tuple[str, float]] = []
+            for ids, score in beams:
+                text = self.codec.decode(ids)
+                if text in seen or score == float("-inf"):
+                    continue
+                seen.add(text)
+                candidates.append((text, score))
+            by_word[word] = candidates
+        return [by_word[w] for w in words]
 
 
 class Seq2Seq(nn.Module):
@@ -209,15 +583,108 @@ class Seq2Seq(nn.Module):
         self.device = device
 
 
+class GreedySearch(nn.Module):
+    """
+    Encoder + the whole greedy decode loop as one module, written so that
+    torch.jit.script can compile it (see export_torchscript.py).
+    Rows that emitted <eos> are masked out; the loop stops as soon as
+    every row has finished.
+    """
+
+    def __init__(
+        self,
+        encoder: nn.Module,
+        decoder: nn.Module,
+        sos_idx: int,
+        eos_idx: int,
+        max_len: int,
+    ):
+        super().__init__()
+        self.encoder = encoder
+        self.decoder = decoder
+        self.sos_idx = sos_idx
+        self.eos_idx = eos_idx
+        self.max_len = max_len
+
+    def forward(
+        self, src: torch.Tensor, src_lengths: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        # src: (batch, src_len) -> ids (batch, steps), <eos>-padded per row
+        encoder_outputs, hidden, cell = self.encoder(src, src_lengths)
+        mask: Optional[torch.Tensor] = None
+        if src_lengths is not None:
+            mask = length_mask(src_lengths, src.size(1))
+        encoder_proj = self.decoder.attention.project_encoder(encoder_outputs)
+
+        batch_size = src.size(0)
+        input_token = torch.full(
+            [batch_size], self.sos_idx, dtype=torch.long, device=src.device
+        )
+        finished = torch.zeros([batch_size], dtype=torch.bool, device=src.device)
+        steps: List[torch.Tensor] = []
+
+        for _ in range(self.max_len):
+            output, hidden, cell = self.decoder(
+                input_token, hidden, cell, encoder_outputs, mask, encoder_proj
+            )
+            next_ids = output.argmax(dim=-1)  # (batch,)
+            # finished rows keep emitting <eos> so they stay finished
+            next_ids = next_ids.masked_fill(finished, self.eos_idx)
+            steps.append(next_ids)
+            finished = finished | (next_ids == self.eos_idx)
+            if bool(finished.all()):
+                break
+            input_token = next_ids
+
+        return torch.stack(steps, dim=1)
+
+
 # --- Engine to manage multiple languages -----------------------------------
 
 
+def warmup_words(n: int) -> List[str]:
+    """`n` lowercase ascii words of typical lengths (4-12 chars)."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return [
+        "".join(letters[(i * 7 + j) % 26] for j in range(4 + i % 9)) for i in range(n)
+    ]
+
+
+# either backend exposes transliterate_batch / transliterate_beam / version
+TranslitModel = Union[LoadedTranslitModel, OnnxTranslitModel]
+
+
 class TransliterationEngine:
-    def __init__(self, model_dir: Optional[str] = None):
+    def __init__(self, model_dir: Optional[str] = None, workers: Optional[int] = None):
         base = Path(model_dir) if model_dir is not None else Path(settings.MODEL_DIR)
         self.model_dir = base
+        # > 0: decode in that many worker processes instead of in-process
+        self.workers = settings.INFERENCE_WORKERS if workers is None else workers
+        self._pool: Optional[InferenceWorkerPool] = None
+        self._pool_lock = threading.Lock()
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self._cache: Dict[str, LoadedTranslitModel] = {}
+        # resident models, LRU-evicted beyond MODEL_MEMORY_BUDGET_BYTES
+        self.models = ModelResidency(
+            max_bytes=settings.MODEL_MEMORY_BUDGET_BYTES,
+            pinned=settings.PINNED_LANGS,
+        )
+        # one checkpoint + vocab load per language at a time, with backoff
+        self._loads = SingleFlight(
+            retry_base_s=settings.MODEL_LOAD_RETRY_BASE_S,
+            retry_max_s=settings.MODEL_LOAD_RETRY_MAX_S,
+        )
+        # word-level results, keyed on (lang, model version, word, beam width)
+        self.results = ResultCache(
+            max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+            max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+        )
+        # same keys on disk, shared with other processes (optional)
+        self.persistent: Optional[PersistentResultCache] = None
+        if settings.PERSISTENT_CACHE_PATH:
+            self.persistent = PersistentResultCache(
+                Path(settings.PERSISTENT_CACHE_PATH),
+                max_entries=settings.PERSISTENT_CACHE_MAX_ENTRIES,
+            )
 
     def _get_paths_for_lang(self, lang: str):
         model_path = self.model_dir / f"{lang}_model.pt"
@@ -225,29 +692,279 @@ class TransliterationEngine:
         i2c_path = self.model_dir / f"{lang}_idx2char.json"
         return model_path, c2i_path, i2c_path
 
-    def _load_lang_model(self, lang: str) -> Optional[LoadedTranslitModel]:
-        if lang in self._cache:
-            return self._cache[lang]
+    def get_compiled_path(self, lang: str) -> Path:
+        return self.model_dir / f"{lang}_greedy.ts"
 
+    def _read_model_meta(self, lang: str) -> Dict[str, Any]:
+        """Optional {lang}_meta.json written by the training script."""
+        meta_path = self.model_dir / f"{lang}_meta.json"
+        if not meta_path.exists():
+            return {}
+        with meta_path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def build_lang_model(
+        self,
+        lang: str,
+        precision: Optional[str] = None,
+        backend: Optional[str] = None,
+    ) -> Optional[TranslitModel]:
+        """
+        Load a fresh (uncached) model for `lang`. `precision` and `backend`
+        default to the configured serving settings; the ONNX backend falls
+        back to torch when its exported graphs are missing or stale.
+        """
         model_path, c2i_path, i2c_path = self._get_paths_for_lang(lang)
         if not (model_path.exists() and c2i_path.exists() and i2c_path.exists()):
             return None
-
-        loaded = LoadedTranslitModel(
+        meta = self._read_model_meta(lang)
+        # checkpoints without a meta file were trained on inputs padded
+        # to max_len without attention masks
+        fixed_length = not meta.get("variable_length", False)
+
+        if (backend or settings.INFERENCE_BACKEND).lower() == "onnx":
+            onnx_model = load_onnx_model(
+                self.model_dir,
+                lang,
+                c2i_path,
+                i2c_path,
+                checksum=file_checksum(model_path),
+                fixed_length=fixed_length,
+            )
+            if onnx_model is not None:
+                return onnx_model
+            print(f"[TranslitEngine] No usable ONNX model for {lang}, using torch")
+
+        if precision is None:
+            precision = settings.INFERENCE_PRECISION_BY_LANG.get(
+                lang, settings.INFERENCE_PRECISION
+            )
+
+        return LoadedTranslitModel(
             lang=lang,
             model_path=model_path,
             char2idx_path=c2i_path,
             idx2char_path=i2c_path,
             device=self.device,
+            fixed_length=fixed_length,
+            precision=precision,
+            compiled_path=(
+                self.get_compiled_path(lang) if settings.USE_COMPILED_MODELS else None
+            ),
+            mmap=settings.MODEL_MMAP,
         )
-        self._cache[lang] = loaded
+
+    def _load_lang_model(self, lang: str) -> Optional[TranslitModel]:
+        """
+        Resident model for `lang`, loading it on first use. Concurrent
+        callers for a cold language share one load; a failed load raises
+        (LoadBackoffError while backing off) rather than returning None.
+        """
+        model = self.models.get(lang)
+        if model is not None:
+            return model
+        return self._loads.do(lang, lambda: self._load_and_register(lang))
+
+    def _load_and_register(self, lang: str) -> Optional[TranslitModel]:
+        # a flight that finished just before this one may have loaded it
+        model = self.models.get(lang)
+        if model is not None:
+            return model
+
+        started = time.perf_counter()
+        loaded = self.build_lang_model(lang)
+        if loaded is None:
+            return None
+        elapsed = time.perf_counter() - started
+        metrics.model_load_seconds.observe(elapsed, lang=lang)
+        request_timing.add("model_load", elapsed)
+        if self.persistent is not None:
+            self.persistent.purge_stale(lang, loaded.version)
+        evicted = self.models.put(lang, loaded)
+        if evicted:
+            print(
+                f"[TranslitEngine] Loaded {lang}, evicted {', '.join(evicted)} "
+                f"to stay within the model memory budget"
+            )
         return loaded
 
+    def _with_result_cache(
+        self,
+        model: TranslitModel,
+        words: List[str],
+        beam_width: int,
+        decode: Callable[[List[str]], List[Any]],
+    ) -> List[Any]:
+        """
+        Answer words from the result cache, then the persistent cache, and
+        decode only the remaining misses, as one batch.
+        """
+        by_word: Dict[str, Any] = {}
+        misses: List[str] = []
+        with request_timing.stage("cache_lookup"):
+            for word in dict.fromkeys(words):
+                hit = self.results.get((model.lang, model.version, word, beam_width))
+                if hit is None:
+                    misses.append(word)
+                else:
+                    by_word[word] = hit
+            metrics.cache_lookups.inc(len(by_word), cache="result", result="hit")
+            metrics.cache_lookups.inc(len(misses), cache="result", result="miss")
+
+            if misses and self.persistent is not None:
+                stored = self.persistent.get_many(
+                    model.lang, model.version, misses, beam_width
+                )
+                for word, result in stored.items():
+                    self.results.put(
+                        (model.lang, model.version, word, beam_width), result
+                    )
+                    by_word[word] = result
+                metrics.cache_lookups.inc(len(stored), cache="persistent", result="hit")
+                metrics.cache_lookups.inc(
+                    len(misses) - len(stored), cache="persistent", result="miss"
+                )
+                misses = [w for w in misses if w not in stored]
+
+        if misses:
+            metrics.batch_size.observe(len(misses), source="model")
+            with profiler_capture.capture(model.lang):
+                decoded = dict(zip(misses, decode(misses)))
+            for word, result in decoded.items():
+                self.results.put((model.lang, model.version, word, beam_width), result)
+                by_word[word] = result
+            if self.persistent is not None:
+                self.persistent.put_many(model.lang, model.version, decoded, beam_width)
+
+        return [by_word[w] for w in words]
+
+    def preload(self, lang: str) -> bool:
+        """
+        Load `lang` now (in every worker process, if any) instead of on
+        its first request. False if there are no model files for it.
+        """
+        if self.workers > 0:
+            return all(self._get_pool().broadcast("preload", (lang,)))
+        return self._load_lang_model(lang) is not None
+
+    def warmup(self, lang: str, batch_sizes: List[int]) -> None:
+        """
+        Run throwaway decodes at each batch size so the first real
+        requests don't pay for cold kernels and allocator growth. Decodes
+        the model directly: warmup words must not land in the caches.
+        """
+        if self.workers > 0:
+            self._get_pool().broadcast("warmup", (lang, batch_sizes))
+            return
+        model = self._load_lang_model(lang)
+        if model is None:
+            return
+        # nor in /metrics: they'd skew decoder steps and batch sizes
+        with metrics.muted():
+            for size in batch_sizes:
+                model.transliterate_batch(warmup_words(size))
+
     def transliterate(self, text: str, lang: str) -> Optional[str]:
+        results = self.transliterate_batch([text], lang)
+        if results is None:
+            return None
+        return results[0]
+
+    def _get_pool(self) -> InferenceWorkerPool:
+        # started on first use, never at import (workers re-import this module)
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = InferenceWorkerPool(
+                    size=self.workers,
+                    threads_per_worker=settings.INFERENCE_WORKER_THREADS,
+                    model_dir=str(self.model_dir),
+                )
+            return self._pool
+
+    def arm_profiler(self, count: int, lang: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Profile the next `count` model decodes (of `lang` only, if given).
+        Each worker process counts its own decodes. Returns the status of
+        every process that was armed.
+        """
+        if self.workers > 0:
+            return self._get_pool().broadcast("profile", (count, lang))
+        return [profiler_capture.arm(count, lang)]
+
+    def profiler_status(self) -> List[Dict[str, Any]]:
+        if self.workers > 0:
+            if self._pool is None:
+                return []
+            return self._pool.broadcast("profile_status")
+        return [profiler_capture.status()]
+
+    def worker_metrics(self) -> List[Dict[str, Any]]:
+        """Latest metrics snapshot of each worker (none before the pool starts)."""
+        if self._pool is None:
+            return []
+        return self._pool.metrics_snapshots()
+
+    def worker_health(self) -> Dict[str, Any]:
+        if self.workers <= 0:
+            return {"healthy": True, "size": 0, "workers": []}
+        return self._get_pool().health()
+
+    def transliterate_batch(self, words: List[str], lang: str) -> Optional[List[str]]:
+        if self.workers > 0:
+            return self._get_pool().transliterate_batch(words, lang)
         model = self._load_lang_model(lang)
         if model is None:
             return None
-        return model.transliterate(text)
+        return self._with_result_cache(model, words, 1, model.transliterate_batch)
+
+    def transliterate_beam(
+        self, words: List[str], lang: str, beam_width: int
+    ) -> Optional[List[List[Tuple[str, float]]]]:
+        if self.workers > 0:
+            return self._get_pool().transliterate_beam(words, lang, beam_width)
+        model = self._load_lang_model(lang)
+        if model is None:
+            return None
+        return self._with_result_cache(
+            model,
+            words,
+            beam_width,
+            lambda misses: model.transliterate_beam(misses, beam_width),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Model and cache counters. In worker mode they are per worker
+        (under "workers"), plus result-cache totals across workers; this
+        waits for every worker to finish its current decode.
+        """
+        if self._pool is not None:
+            # models and caches live in the workers
+            workers = self._pool.broadcast("stats")
+            caches = [w["result_cache"] for w in workers]
+            totals: Dict[str, Any] = {
+                key: sum(c[key] for c in caches)
+                for key in ("entries", "bytes", "hits", "misses", "evictions")
+            }
+            lookups = totals["hits"] + totals["misses"]
+            totals["hit_rate"] = totals["hits"] / lookups if lookups else 0.0
+            return {
+                "worker_pool": self._pool.stats(),
+                "process_memory": process_memory(),
+                "result_cache": totals,
+                "model_evictions": sum(w["models"]["total_evictions"] for w in workers),
+                "workers": workers,
+            }
+        return {
+            "loaded_languages": sorted(self.models.languages()),
+            "models": self.models.stats(),
+            "model_loads": self._loads.stats(),
+            "process_memory": process_memory(),
+            "result_cache": self.results.stats(),
+            "persistent_cache": (
+                self.persistent.stats() if self.persistent is not None else None
+            ),
+        }
 
 
 # global singleton engine
@@ -0,0 +1,291 @@
+# backend/src/ml/worker_pool.py
+
+"""
+Pool of inference worker processes for TransliterationEngine.
+
+Each worker is a spawned process with its own in-process engine (models,
+result cache) and its own torch thread count; the API process only
+pickles words and results over a pipe. That keeps CPU-bound decoding off
+the API's GIL and lets decoding use every core of the box.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils import request_timing
+
+WORKER_START_TIMEOUT_S = 120.0
+
+
+class WorkerCrashedError(RuntimeError):
+    """The worker handling a request died or hung before answering it."""
+
+
+def _worker_main(conn, model_dir: Optional[str], num_threads: int) -> None:
+    import torch
+
+    torch.set_num_threads(max(1, num_threads))
+    torch.set_num_interop_threads(1)
+
+    # imported here: the engine module imports this one
+    from ..utils.metrics import metrics
+    from .profiler_capture import profiler_capture
+    from .transliteration_inference import TransliterationEngine
+
+    engine = TransliterationEngine(model_dir, workers=0)
+    conn.send((True, "ready"))
+
+    while True:
+        try:
+            op, args = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if op == "stop":
+            break
+        # stage timings go back with the result, for the caller's request
+        with request_timing.collect() as timings:
+            try:
+                if op == "batch":
+                    result: Any = engine.transliterate_batch(*args)
+                elif op == "beam":
+                    result = engine.transliterate_beam(*args)
+                elif op == "preload":
+                    result = engine.preload(*args)
+                elif op == "warmup":
+                    result = engine.warmup(*args)
+                elif op == "stats":
+                    result = engine.stats()
+                elif op == "profile":
+                    result = profiler_capture.arm(*args)
+                elif op == "profile_status":
+                    result = profiler_capture.status()
+                elif op == "ping":
+                    result = "pong"
+                else:
+                    raise ValueError(f"Unknown op {op!r}")
+            except Exception as e:
+                conn.send((False, e, timings, metrics.snapshot()))
+                continue
+        # metrics ride along too, so /metrics never has to wait for a
+        # busy worker; between ops nothing is recorded
+        conn.send((True, result, timings, metrics.snapshot()))
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, index: int, ctx, model_dir: Optional[str], num_threads: int):
+        self.index = index
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, model_dir, num_threads),
+            name=f"translit-worker-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.requests = 0
+        self.restarts = 0
+        # registry snapshot from the worker's latest reply
+        self.metrics: Optional[Dict[str, Any]] = None
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the worker to finish importing torch and building its engine."""
+        if not self.ready and self.conn.poll(timeout):
+            self.ready = self.conn.recv() == (True, "ready")
+        return self.ready
+
+    def call(self, op: str, args: Tuple = (), timeout: Optional[float] = None) -> Any:
+        if not self.wait_ready(WORKER_START_TIMEOUT_S):
+            raise TimeoutError(f"worker {self.index} did not start")
+        self.conn.send((op, args))
+        if timeout is not None and not self.conn.poll(timeout):
+            raise TimeoutError(f"worker {self.index} did not answer {op!r}")
+        ok, result, timings, self.metrics = self.conn.recv()
+        request_timing.add_all(timings)
+        if not ok:
+            raise result
+        return result
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(("stop", ()))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class InferenceWorkerPool:
+    """
+    Fixed-size pool of worker processes, one request per worker at a time.
+
+    Callers (the scheduler's executor threads) block until a worker is
+    idle, which doubles as backpressure. A worker that dies or stops
+    answering mid-request is replaced and the request fails with
+    WorkerCrashedError.
+    """
+
+    def __init__(
+        self, size: int, threads_per_worker: int, model_dir: Optional[str] = None
+    ) -> None:
+        self.size = size
+        self.threads_per_worker = threads_per_worker
+        self.model_dir = model_dir
+        # spawn: forking a process that already initialised torch is unsafe
+        self._ctx = mp.get_context("spawn")
+        self._workers: List[_Worker] = [
+            _Worker(i, self._ctx, model_dir, threads_per_worker) for i in range(size)
+        ]
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._lock = threading.Lock()
+        # two broadcasts each holding some workers would wait on each other
+        self._broadcast_lock = threading.Lock()
+        self.crashes = 0
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        with self._lock:
+            self.crashes += 1
+            # a hung worker is still running; a crashed one is already gone
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.process.join(timeout=1)
+            worker.conn.close()
+            fresh = _Worker(
+                worker.index, self._ctx, self.model_dir, self.threads_per_worker
+            )
+            fresh.restarts = worker.restarts + 1
+            self._workers[worker.index] = fresh
+            return fresh
+
+    def _dispatch(self, op: str, args: Tuple) -> Any:
+        worker = self._idle.get()
+        try:
+            worker.requests += 1
+            return worker.call(op, args)
+        except (EOFError, OSError, BrokenPipeError, TimeoutError) as e:
+            # after a timeout the pipe may still deliver a stale reply, so
+            # the worker is replaced rather than handed out again
+            worker = self._replace(worker)
+            raise WorkerCrashedError(
+                f"Inference worker {worker.index} failed during {op!r}: {e}"
+            ) from e
+        finally:
+            self._idle.put(worker)
+
+    def broadcast(self, op: str, args: Tuple = ()) -> List[Any]:
+        """
+        Run `op` on every worker, in parallel, once each is idle (e.g. to
+        preload a model everywhere). Results are in worker order.
+        """
+        with self._broadcast_lock:
+            workers = [self._idle.get() for _ in range(self.size)]
+
+        def call(worker: _Worker) -> Any:
+            try:
+                worker.requests += 1
+                return worker.call(op, args)
+            except (EOFError, OSError, BrokenPipeError, TimeoutError) as e:
+                fresh = self._replace(worker)
+                workers[workers.index(worker)] = fresh
+                raise WorkerCrashedError(
+                    f"Inference worker {fresh.index} failed during {op!r}: {e}"
+                ) from e
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(workers)) as ex:
+                return list(ex.map(call, list(workers)))
+        finally:
+            for worker in workers:
+                self._idle.put(worker)
+
+    def metrics_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        Each worker's metrics as of its latest reply. Never waits for a
+        busy worker: it records only while handling an op, and its reply
+        to that op brings the update.
+        """
+        with self._lock:
+            workers = list(self._workers)
+        return [w.metrics for w in workers if w.metrics is not None]
+
+    def transliterate_batch(self, words: List[str], lang: str) -> Optional[List[str]]:
+        return self._dispatch("batch", (words, lang))
+
+    def transliterate_beam(
+        self, words: List[str], lang: str, beam_width: int
+    ) -> Optional[List[List[Tuple[str, float]]]]:
+        return self._dispatch("beam", (words, lang, beam_width))
+
+    def health(self, timeout: float = 2.0) -> Dict[str, Any]:
+        """
+        Ping every idle worker (busy ones are alive by definition), and
+        replace any that are dead or unresponsive.
+        """
+        checked: List[Dict[str, Any]] = []
+        busy = 0
+        for _ in range(self.size):
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                busy += 1
+                continue
+            started = time.perf_counter()
+            status: Dict[str, Any] = {"index": worker.index, "pid": worker.process.pid}
+            if worker.process.is_alive() and not worker.wait_ready(0):
+                status["ok"] = True
+                status["starting"] = True
+                checked.append(status)
+                self._idle.put(worker)
+                continue
+            try:
+                worker.call("ping", timeout=timeout)
+                status["ok"] = True
+                status["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            except Exception as e:
+                status["ok"] = False
+                status["error"] = f"{type(e).__name__}: {e}"
+                worker = self._replace(worker)
+            checked.append(status)
+            self._idle.put(worker)
+
+        return {
+            "healthy": all(s["ok"] for s in checked),
+            "size": self.size,
+            "busy": busy,
+            "workers": checked,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "threads_per_worker": self.threads_per_worker,
+                "idle": self._idle.qsize(),
+                "crashes": self.crashes,
+                "workers": [
+                    {
+                        "index": w.index,
+                        "pid": w.process.pid,
+                        "alive": w.process.is_alive(),
+                        "requests": w.requests,
+                        "restarts": w.restarts,
+                    }
+                    for w in self._workers
+                ],
+            }
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
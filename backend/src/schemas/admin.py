@@ -0,0 +1,24 @@
+# backend/src/schemas/admin.py
+
+from __future__ import annotations
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class ProfileRequest(BaseModel):
+    requests: int = 1  # decodes to profile, per inference process; 0 disarms
+    target_lang: Optional[str] = None  # only decodes for this language
+
+
+class ProfileCaptureStatus(BaseModel):
+    pid: int
+    remaining: int
+    target_lang: Optional[str] = None
+    active: bool
+    out_dir: str
+    traces: List[str]  # most recent Chrome trace files, oldest first
+
+
+class ProfileResponse(BaseModel):
+    processes: List[ProfileCaptureStatus]  # the API process or each worker
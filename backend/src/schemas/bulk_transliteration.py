@@ -0,0 +1,22 @@
+# backend/src/schemas/bulk_transliteration.py
+
+from __future__ import annotations
+
+from typing import Any, Optional
+from pydantic import BaseModel
+
+
+class BulkLineResult(BaseModel):
+    """One NDJSON output line of /transliterate/stream, in input order."""
+
+    line: int  # 1-based input line number
+    id: Optional[Any] = None  # echoed from NDJSON input, if given
+    input: str
+    output: str
+    provider: str
+
+
+class BulkLineError(BaseModel):
+    line: int
+    id: Optional[Any] = None
+    error: str
@@ -11,6 +11,7 @@ class TransliterationRequest(BaseModel):
     source_lang: str
     target_lang: str
     mode: str = "native"  # "native" or "mix"
+    beam_width: int = 1  # > 1 returns n-best candidates from beam search
 
 
 class TransliterationCandidate(BaseModel):
@@ -26,3 +27,15 @@ class TransliterationResponse(BaseModel):
     target_lang: str
     mode: str
     provider: str  # e.g. "ml-local", "stub"
+
+
+class Suggestion(BaseModel):
+    roman: str
+    native: str
+    score: int  # popularity in the lexicon data
+
+
+class SuggestResponse(BaseModel):
+    prefix: str
+    target_lang: str
+    suggestions: List[Suggestion]
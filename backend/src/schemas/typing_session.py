@@ -0,0 +1,32 @@
+# backend/src/schemas/typing_session.py
+
+from __future__ import annotations
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class TypingEdit(BaseModel):
+    # replace text[start:end] (character offsets) with `text`
+    start: int
+    end: int
+    text: str = ""
+
+
+class TypingMessage(BaseModel):
+    seq: int
+    target_lang: str
+    mode: str = "native"  # "native" or "mix"
+    text: Optional[str] = None  # full document (resets the session text)
+    edit: Optional[TypingEdit] = None  # or an incremental edit
+
+
+class TypingDiff(BaseModel):
+    # replace output tokens[start:start+delete] with `tokens`
+    type: str = "diff"
+    seq: int
+    start: int
+    delete: int
+    tokens: List[str]
+    primary: str
+    provider: str
@@ -0,0 +1,175 @@
+# backend/src/services/bulk_transliteration.py
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, List, Optional, Union
+
+from ..config.settings import settings
+from ..ml.bounded_executor import ExecutorOverloaded
+from ..schemas.bulk_transliteration import BulkLineError, BulkLineResult
+from .transliteration_service import transliteration_service
+
+
+@dataclass
+class BulkRecord:
+    line: int
+    id: Optional[Any]
+    text: Optional[str]  # None if the line could not be parsed
+    error: Optional[str] = None
+
+
+BulkOutput = Union[BulkLineResult, BulkLineError]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split an uploaded byte stream into lines as chunks arrive. Only the
+    current partial line is buffered; a line longer than
+    BULK_MAX_LINE_CHARS is cut there (the rest starts a new line).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    limit = settings.BULK_MAX_LINE_CHARS
+    buf = ""
+    async for chunk in chunks:
+        buf += decoder.decode(chunk)
+        *lines, buf = buf.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        while len(buf) > limit:
+            yield buf[:limit]
+            buf = buf[limit:]
+    buf += decoder.decode(b"", final=True)
+    if buf:
+        yield buf.rstrip("\r")
+
+
+def parse_record(line_no: int, line: str, ndjson: bool) -> BulkRecord:
+    """NDJSON lines are {"text": ..., "id": ...} objects or bare strings."""
+    if not ndjson:
+        return BulkRecord(line_no, None, line)
+    if not line.strip():
+        return BulkRecord(line_no, None, "")
+    try:
+        obj = json.loads(line)
+    except ValueError as e:
+        return BulkRecord(line_no, None, None, f"invalid JSON: {e}")
+    if isinstance(obj, str):
+        return BulkRecord(line_no, None, obj)
+    if isinstance(obj, dict) and isinstance(obj.get("text"), str):
+        return BulkRecord(line_no, obj.get("id"), obj["text"])
+    return BulkRecord(
+        line_no,
+        obj.get("id") if isinstance(obj, dict) else None,
+        None,
+        'expected a string or an object with a "text" string',
+    )
+
+
+class BulkTransliterationPipeline:
+    """
+    read -> parse -> batch -> decode -> emit, as a chain of async stages.
+
+    A reader task fills a small bounded queue with batches of lines while
+    the previous batch is being decoded; when the queue is full the reader
+    stops pulling from the upload. So at most a few batches of the document
+    are held in memory, however long it is, and results go out in input
+    order as soon as each batch is done.
+    """
+
+    def __init__(self, target_lang: str, mode: str, ndjson: bool) -> None:
+        self.target_lang = target_lang
+        self.mode = mode
+        self.ndjson = ndjson
+        self.batch_lines = max(1, settings.BULK_BATCH_LINES)
+        self.batch_words = max(1, settings.BULK_BATCH_WORDS)
+
+    async def _read_batches(
+        self,
+        chunks: AsyncIterator[bytes],
+        out: "asyncio.Queue[Optional[List[BulkRecord]]]",
+    ) -> None:
+        batch: List[BulkRecord] = []
+        words = 0
+        line_no = 0
+        cancelled = False
+        try:
+            async for line in iter_lines(chunks):
+                line_no += 1
+                record = parse_record(line_no, line, self.ndjson)
+                batch.append(record)
+                words += len(record.text.split()) if record.text else 0
+                if len(batch) >= self.batch_lines or words >= self.batch_words:
+                    await out.put(batch)
+                    batch, words = [], 0
+            if batch:
+                await out.put(batch)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            # cancelled: the consumer is gone (client disconnected) and a
+            # full queue would block the end marker forever
+            if not cancelled:
+                await out.put(None)
+
+    async def _decode(self, tokens: List[str]):
+        # bulk jobs yield to interactive traffic instead of failing with 503
+        delay = 0.05
+        while True:
+            try:
+                return await transliteration_service.transliterate_tokens_async(
+                    tokens, self.target_lang, self.mode
+                )
+            except ExecutorOverloaded:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+
+    async def _decode_batch(self, batch: List[BulkRecord]) -> List[BulkOutput]:
+        # every line of the batch goes to the engine as one token list
+        per_line = [r.text.split() if r.text else [] for r in batch]
+        flat = [tok for toks in per_line for tok in toks]
+        out_tokens, provider = await self._decode(flat) if flat else ([], "none")
+
+        results: List[BulkOutput] = []
+        pos = 0
+        for record, toks in zip(batch, per_line):
+            if record.text is None:
+                results.append(
+                    BulkLineError(
+                        line=record.line, id=record.id, error=record.error or ""
+                    )
+                )
+                continue
+            results.append(
+                BulkLineResult(
+                    line=record.line,
+                    id=record.id,
+                    input=record.text,
+                    output=" ".join(out_tokens[pos : pos + len(toks)]),
+                    provider=provider if toks else "none",
+                )
+            )
+            pos += len(toks)
+        return results
+
+    async def run(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        """Yield one NDJSON line per input line."""
+        queue: "asyncio.Queue[Optional[List[BulkRecord]]]" = asyncio.Queue(
+            maxsize=settings.BULK_PREFETCH_BATCHES
+        )
+        reader = asyncio.create_task(self._read_batches(chunks, queue))
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                for result in await self._decode_batch(batch):
+                    yield result.model_dump_json(exclude_none=True) + "\n"
+            await reader  # surface upload errors
+        finally:
+            if not reader.done():
+                reader.cancel()
@@ -0,0 +1,95 @@
+# backend/src/services/model_readiness.py
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..config.settings import settings
+from ..ml.transliteration_inference import engine
+
+
+class ModelReadiness:
+    """
+    Preloads and warms up the configured languages at startup and tracks
+    per-language state for the readiness endpoint:
+    pending -> loading -> warming -> ready, or failed (with the error).
+
+    The service is ready once every configured language is ready; with
+    no languages configured it is ready immediately.
+    """
+
+    def __init__(self, langs: List[str], batch_sizes: List[int], threads: int) -> None:
+        self.langs = list(dict.fromkeys(langs))
+        self.batch_sizes = batch_sizes
+        self.threads = max(1, threads)
+        self._lock = threading.Lock()
+        self._states: Dict[str, Dict[str, Any]] = {
+            lang: {"state": "pending"} for lang in self.langs
+        }
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def _update(self, lang: str, **fields: Any) -> None:
+        with self._lock:
+            self._states[lang].update(fields)
+
+    def _preload_one(self, lang: str) -> None:
+        self._update(lang, state="loading")
+        started = time.perf_counter()
+        try:
+            if not engine.preload(lang):
+                self._update(lang, state="failed", error="no model files")
+                return
+            loaded = time.perf_counter()
+            self._update(lang, state="warming", load_ms=(loaded - started) * 1000)
+            engine.warmup(lang, self.batch_sizes)
+            self._update(
+                lang,
+                state="ready",
+                warmup_ms=(time.perf_counter() - loaded) * 1000,
+            )
+        except Exception as e:
+            print(f"[ModelReadiness] Preloading {lang} failed: {e}")
+            self._update(lang, state="failed", error=f"{type(e).__name__}: {e}")
+
+    async def preload(self) -> None:
+        """Load and warm up all languages in parallel threads."""
+        self._started = time.perf_counter()
+        if self.langs:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(
+                max_workers=min(self.threads, len(self.langs)),
+                thread_name_prefix="preload",
+            ) as pool:
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, self._preload_one, lang)
+                        for lang in self.langs
+                    )
+                )
+        self._finished = time.perf_counter()
+        print(f"[ModelReadiness] Preload finished: {self.status()['languages']}")
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            languages = {lang: dict(s) for lang, s in self._states.items()}
+            ready = all(s["state"] == "ready" for s in languages.values())
+        elapsed = None
+        if self._started is not None:
+            end = self._finished if self._finished is not None else time.perf_counter()
+            elapsed = (end - self._started) * 1000
+        return {
+            "ready": ready,
+            "preload_ms": elapsed,
+            "warmup_batch_sizes": self.batch_sizes,
+            "languages": languages,
+        }
+
+
+model_readiness = ModelReadiness(
+    settings.PRELOAD_LANGS, settings.WARMUP_BATCH_SIZES, settings.PRELOAD_THREADS
+)
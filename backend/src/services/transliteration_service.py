@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple, Any
+from typing import Any, List, Optional, Tuple
 
+from ..config.settings import settings
+from ..ml.batch_scheduler import scheduler
+from ..ml.bounded_executor import ExecutorOverloaded
+from ..ml.english_classifier import english_classifier
+from ..ml.lexicon import lexicons
 from ..ml.transliteration_inference import engine
 from ..schemas.transliteration import (
     TransliterationRequest,
     TransliterationResponse,
     TransliterationCandidate,
 )
+from ..utils import metrics, request_timing
+
+# Per-word alternatives, best first: (text, log_prob or None when unscored)
+WordCandidates = List[Tuple[str, Optional[float]]]
 
 # Simple list of English words / proper nouns we usually want to keep as-is
 ENGLISH_KEEP = {
@@ -32,10 +41,14 @@ ENGLISH_KEEP = {
 }
 
 
-def should_keep_english(token: str) -> bool:
+def should_keep_english(token: str, target_lang: Optional[str] = None) -> bool:
     """
     Heuristic for MIX mode:
     Return True if this token should STAY in English (not transliterated).
+
+    Digits, symbols and ENGLISH_KEEP always stay. Other words go to the
+    English classifier when one is built; without it, capitalised words
+    are assumed to be English names.
     """
     if not token:
         return False
@@ -50,6 +63,14 @@ def should_keep_english(token: str) -> bool:
     if any(ch in "@#&/._-" for ch in token):
         return True
 
+    classifier = english_classifier.get()
+    if classifier is not None:
+        lexicon = lexicons.get(target_lang) if target_lang else None
+        romanized_known = lexicon is not None and lexicon.get(low) is not None
+        keep = classifier.is_english(low, romanized_known=romanized_known)
+        english_classifier.record(keep)
+        return keep
+
     if token[0].isupper():
         return True
 
@@ -60,72 +81,240 @@ class TransliterationService:
     """
     High-level service that:
     - Splits sentences into tokens
-    - In MIX mode: keeps some English tokens as-is
-    - Calls the low-level ML engine word-by-word for others
+    - In MIX mode: keeps English tokens as-is (see should_keep_english)
+    - Answers words found in the lexicon directly
+    - Sends all other tokens to the low-level ML engine as one batch
     - Re-joins with spaces so output keeps word boundaries
     """
 
-    def _transliterate_word(self, word: str, target_lang: str) -> Tuple[str, str]:
+    def _transliterate_words(
+        self, words: List[str], target_lang: str, beam_width: int = 1
+    ) -> Tuple[List[WordCandidates], str]:
         """
-        Call the ML engine for a single word.
-        Returns (primary_output, provider_used)
+        Call the ML engine once for all words of a request.
+        Returns (candidates aligned with words, provider_used)
         """
-        if not word.strip():
-            return "", "none"
+        if not words:
+            return [], "none"
+
+        known = self._lexicon_lookup(words, target_lang, beam_width)
+        misses = [w for w, k in zip(words, known) if k is None]
+        if not misses:
+            return self._merge_known(known, []), "lexicon"
 
         try:
-            result: Any = engine.transliterate(word, lang=target_lang)
+            if beam_width > 1:
+                result: Any = engine.transliterate_beam(
+                    misses, lang=target_lang, beam_width=beam_width
+                )
+            else:
+                result = engine.transliterate_batch(misses, lang=target_lang)
         except Exception as e:
-            print(f"[TranslitService] Engine error for '{word}': {e}")
-            return word, "stub"
+            print(f"[TranslitService] Engine error for {misses!r}: {e}")
+            return self._merge_known(known, self._stub_candidates(misses)), "stub"
+
+        cands, provider = self._engine_result(misses, result)
+        return self._merge_known(known, cands), provider
 
+    async def _transliterate_words_async(
+        self, words: List[str], target_lang: str, beam_width: int = 1
+    ) -> Tuple[List[WordCandidates], str]:
+        """
+        Same as _transliterate_words, but goes through the micro-batching
+        scheduler so words from concurrent requests share one decode.
+        """
+        if not words:
+            return [], "none"
+
+        known = self._lexicon_lookup(words, target_lang, beam_width)
+        misses = [w for w, k in zip(words, known) if k is None]
+        if not misses:
+            return self._merge_known(known, []), "lexicon"
+
+        try:
+            if beam_width > 1:
+                result: Any = await scheduler.transliterate_beam(
+                    misses, lang=target_lang, beam_width=beam_width
+                )
+            else:
+                result = await scheduler.transliterate_batch(misses, lang=target_lang)
+        except ExecutorOverloaded:
+            # callers turn this into 503; a stub answer would look like success
+            raise
+        except Exception as e:
+            print(f"[TranslitService] Engine error for {misses!r}: {e}")
+            return self._merge_known(known, self._stub_candidates(misses)), "stub"
+
+        cands, provider = self._engine_result(misses, result)
+        return self._merge_known(known, cands), provider
+
+    @staticmethod
+    def _lexicon_lookup(
+        words: List[str], target_lang: str, beam_width: int
+    ) -> List[Optional[str]]:
+        """
+        Ground-truth spelling per word from the lexicon, None for unknown
+        words. Beam requests want ranked alternatives, which only the
+        model can give, so they skip the lexicon.
+        """
+        if beam_width > 1:
+            return [None] * len(words)
+        with request_timing.stage("cache_lookup"):
+            return lexicons.lookup(words, target_lang)
+
+    @staticmethod
+    def _merge_known(
+        known: List[Optional[str]], model_cands: List[WordCandidates]
+    ) -> List[WordCandidates]:
+        # model_cands is aligned with the None entries of known, in order
+        rest = iter(model_cands)
+        return [[(k, None)] if k is not None else next(rest) for k in known]
+
+    @staticmethod
+    def _stub_candidates(words: List[str]) -> List[WordCandidates]:
+        return [[(w, None)] for w in words]
+
+    def _engine_result(
+        self, words: List[str], result: Any
+    ) -> Tuple[List[WordCandidates], str]:
+        """
+        Normalise greedy (one string per word) and beam (list of
+        (text, log_prob) per word) engine output to WordCandidates.
+        """
         if result is None:
-            return word, "stub"
+            return self._stub_candidates(words), "stub"
+
+        out: List[WordCandidates] = []
+        for word, res in zip(words, result):
+            if isinstance(res, str):
+                out.append([(res, None)])
+            else:
+                out.append(list(res) or [(word, None)])
+        return out, "ml-local"
 
-        if isinstance(result, str):
-            return result, "ml-local"
+    def _tokenize(
+        self, text: str, mode: str, target_lang: str
+    ) -> Tuple[List[str], List[int]]:
+        """
+        Split `text` into tokens. Returns (tokens, indices of the tokens
+        that go through the model; the others stay English).
+        """
+        with request_timing.stage("tokenize"):
+            tokens = text.split()
+            return tokens, self._model_token_indices(tokens, mode, target_lang)
 
-        if isinstance(result, dict):
-            primary = result.get("primary") or result.get("text") or word
-            provider = result.get("provider", "ml-local")
-            return primary, provider
+    @staticmethod
+    def _model_token_indices(
+        tokens: List[str], mode: str, target_lang: str
+    ) -> List[int]:
+        # indices of tokens that go through the model (others stay English)
+        return [
+            i
+            for i, tok in enumerate(tokens)
+            if not (mode == "mix" and should_keep_english(tok, target_lang))
+        ]
 
-        return str(result), "ml-local"
+    @staticmethod
+    def _beam_width(req: TransliterationRequest) -> int:
+        return max(1, min(req.beam_width, settings.MAX_BEAM_WIDTH))
 
     def transliterate(self, req: TransliterationRequest) -> TransliterationResponse:
         text = (req.text or "").strip()
 
         if not text:
-            return TransliterationResponse(
-                input_text="",
-                primary="",
-                candidates=[],
-                source_lang=req.source_lang,
-                target_lang=req.target_lang,
-                mode=req.mode,
-                provider="none",
+            return self._empty_response(req)
+
+        with metrics.transliteration_seconds.time(lang=req.target_lang, mode=req.mode):
+            tokens, todo = self._tokenize(text, req.mode, req.target_lang)
+            words_out, provider = self._transliterate_words(
+                [tokens[i] for i in todo], req.target_lang, self._beam_width(req)
             )
+            with request_timing.stage("serialize"):
+                return self._build_response(
+                    req, text, tokens, todo, words_out, provider
+                )
 
-        tokens = text.split()
+    async def transliterate_async(
+        self, req: TransliterationRequest
+    ) -> TransliterationResponse:
+        text = (req.text or "").strip()
 
-        out_tokens: List[str] = []
-        provider_overall = "ml-local-word"
+        if not text:
+            return self._empty_response(req)
 
-        for tok in tokens:
-            if req.mode == "mix" and should_keep_english(tok):
-                out_tokens.append(tok)
-                continue
+        with metrics.transliteration_seconds.time(lang=req.target_lang, mode=req.mode):
+            tokens, todo = self._tokenize(text, req.mode, req.target_lang)
+            words_out, provider = await self._transliterate_words_async(
+                [tokens[i] for i in todo], req.target_lang, self._beam_width(req)
+            )
+            with request_timing.stage("serialize"):
+                return self._build_response(
+                    req, text, tokens, todo, words_out, provider
+                )
 
-            word_out, provider = self._transliterate_word(tok, req.target_lang)
-            out_tokens.append(word_out)
-            if provider == "stub":
-                provider_overall = "stub"
+    async def transliterate_tokens_async(
+        self, tokens: List[str], target_lang: str, mode: str
+    ) -> Tuple[List[str], str]:
+        """
+        Transliterate already-split tokens (keeping English ones in MIX mode).
+        Returns (output tokens aligned with `tokens`, provider_used)
+        """
+        with request_timing.stage("tokenize"):
+            todo = self._model_token_indices(tokens, mode, target_lang)
+        words_out, provider = await self._transliterate_words_async(
+            [tokens[i] for i in todo], target_lang
+        )
+        out_tokens = list(tokens)
+        for i, word_cands in zip(todo, words_out):
+            out_tokens[i] = word_cands[0][0]
+        return out_tokens, provider
 
-        primary_phrase = " ".join(out_tokens)
+    @staticmethod
+    def _empty_response(req: TransliterationRequest) -> TransliterationResponse:
+        return TransliterationResponse(
+            input_text="",
+            primary="",
+            candidates=[],
+            source_lang=req.source_lang,
+            target_lang=req.target_lang,
+            mode=req.mode,
+            provider="none",
+        )
 
-        candidates = [
-            TransliterationCandidate(text=primary_phrase, score=1.0),
-        ]
+    @staticmethod
+    def _build_response(
+        req: TransliterationRequest,
+        text: str,
+        tokens: List[str],
+        todo: List[int],
+        words_out: List[WordCandidates],
+        provider: str,
+    ) -> TransliterationResponse:
+        """
+        Candidate k replaces every transliterated word with its k-th best
+        spelling (or its best one, if it has fewer alternatives). Its score
+        is the summed log-probability of the chosen spellings.
+        """
+        n_best = max((len(c) for c in words_out), default=1)
+        scored = any(sc is not None for c in words_out for _, sc in c)
+        candidates: List[TransliterationCandidate] = []
+
+        for k in range(n_best):
+            out_tokens = list(tokens)
+            score = 0.0
+            for i, word_cands in zip(todo, words_out):
+                cand_text, cand_score = word_cands[min(k, len(word_cands) - 1)]
+                out_tokens[i] = cand_text
+                score += cand_score or 0.0
+            candidates.append(
+                TransliterationCandidate(
+                    text=" ".join(out_tokens),
+                    score=score if scored else 1.0,
+                )
+            )
+
+        provider_overall = "stub" if provider == "stub" else "ml-local-word"
+        primary_phrase = candidates[0].text
 
         return TransliterationResponse(
             input_text=text,
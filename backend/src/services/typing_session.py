@@ -0,0 +1,96 @@
+# backend/src/services/typing_session.py
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from ..schemas.typing_session import TypingDiff, TypingMessage
+from .transliteration_service import transliteration_service
+
+
+def changed_span(old: List[str], new: List[str]) -> Tuple[int, int, int]:
+    """
+    Smallest span that differs between two token lists.
+    Returns (start, old_end, new_end) so old[start:old_end] -> new[start:new_end].
+    """
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    return start, old_end, new_end
+
+
+class TypingSession:
+    """
+    Per-connection state for incremental transliteration.
+
+    `text` always reflects the latest message, so edits can be applied in
+    order. `tokens`/`outputs` only change when a diff has actually been
+    sent, which keeps them in sync with what the client holds even when
+    superseded work gets cancelled halfway.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.target_lang: Optional[str] = None
+        self.mode: Optional[str] = None
+        self.tokens: List[str] = []
+        self.outputs: List[str] = []
+
+    def apply(self, msg: TypingMessage) -> str:
+        """Update the session text from a message and return it."""
+        if msg.text is not None:
+            self.text = msg.text
+        elif msg.edit is not None:
+            start = max(0, min(msg.edit.start, len(self.text)))
+            end = max(start, min(msg.edit.end, len(self.text)))
+            self.text = self.text[:start] + msg.edit.text + self.text[end:]
+        return self.text
+
+    async def transliterate(self, msg: TypingMessage, text: str) -> TypingDiff:
+        """
+        Re-transliterate only the tokens that changed since the last diff.
+        Cancelling this coroutine leaves the committed state untouched.
+        """
+        new_tokens = text.split()
+
+        # a different language or mode invalidates every output token
+        if msg.target_lang != self.target_lang or msg.mode != self.mode:
+            old_tokens: List[str] = []
+            old_outputs: List[str] = []
+            delete = len(self.outputs)
+        else:
+            old_tokens, old_outputs = self.tokens, self.outputs
+            delete = None
+
+        start, old_end, new_end = changed_span(old_tokens, new_tokens)
+        changed = new_tokens[start:new_end]
+
+        provider = "none"
+        changed_out: List[str] = []
+        if changed:
+            changed_out, provider = (
+                await transliteration_service.transliterate_tokens_async(
+                    changed, msg.target_lang, msg.mode
+                )
+            )
+
+        outputs = old_outputs[:start] + changed_out + old_outputs[old_end:]
+
+        self.target_lang, self.mode = msg.target_lang, msg.mode
+        self.tokens, self.outputs = new_tokens, outputs
+
+        return TypingDiff(
+            seq=msg.seq,
+            start=start,
+            delete=delete if delete is not None else old_end - start,
+            tokens=changed_out,
+            primary=" ".join(outputs),
+            provider=provider if provider in ("stub", "none") else "ml-local-word",
+        )
@@ -0,0 +1,293 @@
+# backend/src/utils/metrics.py
+
+"""
+Minimal in-process Prometheus metrics (text exposition format 0.0.4).
+
+Counters, gauges and histograms with labels, plus the metric families
+the transliteration hot path records into. Inference worker processes
+keep their own registry and send a snapshot back with every reply;
+/metrics merges the latest ones into the API process's, so stage timings
+show up whichever process decoded.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+LOAD_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+STEP_BUCKETS = (2, 4, 6, 8, 10, 12, 16, 20, 30, 40)
+
+# set by muted(): recording calls in this context are no-ops
+_muted: ContextVar[bool] = ContextVar("metrics_muted", default=False)
+
+
+@contextmanager
+def muted() -> Iterator[None]:
+    """Record nothing for the code in this block (e.g. warmup decodes)."""
+    token = _muted.set(True)
+    try:
+        yield
+    finally:
+        _muted.reset(token)
+
+
+LabelValues = Tuple[str, ...]
+# sample suffix ("", "_bucket", ...), label pairs -> value
+Samples = Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]
+# family name -> (type, help, samples); picklable, for worker snapshots
+Snapshot = Dict[str, Tuple[str, str, Samples]]
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _pairs(self, key: LabelValues) -> Tuple[Tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, key))
+
+    def samples(self) -> Samples:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if _muted.get():
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Samples:
+        with self._lock:
+            return {("", self._pairs(k)): v for k, v in self._values.items()}
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        if _muted.get():
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self) -> Samples:
+        with self._lock:
+            return {("", self._pairs(k)): v for k, v in self._values.items()}
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket (last is +Inf)..., sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        if _muted.get():
+            return
+        key = self._key(labels)
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            row[i] += 1
+            row[-1] += value
+
+    def observe_many(self, values: Sequence[float], **labels: object) -> None:
+        for value in values:
+            self.observe(value, **labels)
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> Samples:
+        out: Samples = {}
+        with self._lock:
+            rows = {k: list(v) for k, v in self._values.items()}
+        for key, row in rows.items():
+            pairs = self._pairs(key)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, row):
+                cumulative += count
+                out[("_bucket", pairs + (("le", _fmt(bound)),))] = cumulative
+            cumulative += row[len(self.buckets)]
+            out[("_bucket", pairs + (("le", "+Inf"),))] = cumulative
+            out[("_sum", pairs)] = row[-1]
+            out[("_count", pairs)] = cumulative
+        return out
+
+
+def _fmt(value: float) -> str:
+    if value == int(value):
+        return str(int(value)) if abs(value) >= 1 else repr(float(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))  # type: ignore
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))  # type: ignore
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))  # type: ignore
+
+    def snapshot(self) -> Snapshot:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {m.name: (m.kind, m.help, m.samples()) for m in metrics}
+
+    @staticmethod
+    def merge(into: Snapshot, other: Snapshot) -> None:
+        """Add `other`'s samples to `into` (counts and sums add up)."""
+        for name, (kind, help, samples) in other.items():
+            if name not in into:
+                into[name] = (kind, help, dict(samples))
+                continue
+            merged = into[name][2]
+            for key, value in samples.items():
+                merged[key] = merged.get(key, 0.0) + value
+
+    @staticmethod
+    def render(snapshot: Snapshot) -> str:
+        lines: List[str] = []
+        for name in sorted(snapshot):
+            kind, help, samples = snapshot[name]
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (suffix, pairs), value in samples.items():
+                labels = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+                label_str = f"{{{labels}}}" if labels else ""
+                lines.append(f"{name}{suffix}{label_str} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+# --- Transliteration hot path ------------------------------------------------
+
+http_request_seconds = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route (endpoint name)",
+    ("method", "route", "status"),
+)
+transliteration_seconds = metrics.histogram(
+    "transliteration_request_duration_seconds",
+    "Service-level transliteration latency by target language",
+    ("lang", "mode"),
+)
+stage_seconds = metrics.histogram(
+    "transliteration_stage_duration_seconds",
+    "Time per stage: tokenize, cache_lookup, encode (text -> ids), "
+    "decode (network + ids -> text), serialize",
+    ("stage",),
+)
+decoder_steps = metrics.histogram(
+    "transliteration_decoder_steps",
+    "Greedy decoder steps per word",
+    ("lang",),
+    buckets=STEP_BUCKETS,
+)
+batch_size = metrics.histogram(
+    "transliteration_batch_size",
+    "Words per batch: scheduler flushes and decodes that reach the model",
+    ("source",),
+    buckets=SIZE_BUCKETS,
+)
+queue_depth = metrics.gauge(
+    "inference_queue_depth",
+    "Words waiting for a micro-batch (batching) and inference jobs "
+    "waiting for (queued) or holding (running) an executor thread",
+    ("state",),
+)
+model_load_seconds = metrics.histogram(
+    "model_load_duration_seconds",
+    "Time to load a language's model",
+    ("lang",),
+    buckets=LOAD_BUCKETS,
+)
+cache_lookups = metrics.counter(
+    "transliteration_cache_lookups_total",
+    "Word lookups per cache (result, persistent, lexicon) and result (hit, miss)",
+    ("cache", "result"),
+)
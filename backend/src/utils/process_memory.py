@@ -0,0 +1,44 @@
+# backend/src/utils/process_memory.py
+
+from typing import Dict
+
+_STATUS_FIELDS = ("VmRSS", "RssAnon", "RssFile", "RssShmem")
+
+
+def _read_kb_fields(path: str, fields) -> Dict[str, int]:
+    out: Dict[str, int] = {}
+    try:
+        with open(path, "r", encoding="ascii") as f:
+            for line in f:
+                name, _, rest = line.partition(":")
+                if name in fields:
+                    out[name] = int(rest.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return out
+
+
+def process_memory() -> Dict[str, int]:
+    """
+    Memory of this worker process in bytes (Linux only, {} elsewhere).
+    - rss:      resident set size
+    - rss_anon: private heap pages (what each worker pays on its own)
+    - rss_file: file-backed pages, e.g. memory-mapped checkpoints, which
+                the page cache shares between workers
+    - pss:      proportional set size; shared pages split across the
+                processes mapping them, so summing it over workers is fair
+    """
+    status = _read_kb_fields("/proc/self/status", _STATUS_FIELDS)
+    rollup = _read_kb_fields("/proc/self/smaps_rollup", ("Pss",))
+    out: Dict[str, int] = {}
+    for src, dst in (
+        ("VmRSS", "rss"),
+        ("RssAnon", "rss_anon"),
+        ("RssFile", "rss_file"),
+        ("RssShmem", "rss_shmem"),
+    ):
+        if src in status:
+            out[dst] = status[src]
+    if "Pss" in rollup:
+        out["pss"] = rollup["Pss"]
+    return out
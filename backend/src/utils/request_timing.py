@@ -0,0 +1,72 @@
+# backend/src/utils/request_timing.py
+
+"""
+Per-request stage timings, reported in the Server-Timing response header.
+
+The HTTP middleware opens a collection for each request. Stage timers in
+the service and models add their durations to whichever collection the
+current context belongs to. Contexts don't follow work onto the inference
+executor or into worker processes, so those collect their own timings
+and hand them back with the result (see MicroBatchScheduler and
+InferenceWorkerPool). A batch shared by several requests is reported in
+full to each of them.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from .metrics import stage_seconds
+
+Timings = Dict[str, float]
+
+_current: ContextVar[Optional[Timings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def collect() -> Iterator[Timings]:
+    """Collect stage timings (seconds, by stage) for the code in this block."""
+    timings: Timings = {}
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[Timings]:
+    return _current.get()
+
+
+def add(name: str, seconds: float, into: Optional[Timings] = None) -> None:
+    timings = into if into is not None else _current.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+def add_all(other: Timings, into: Optional[Timings] = None) -> None:
+    for name, seconds in other.items():
+        add(name, seconds, into)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a pipeline stage for both /metrics and the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        stage_seconds.observe(elapsed, stage=name)
+        add(name, elapsed)
+
+
+def server_timing(timings: Timings, total: Optional[float] = None) -> str:
+    """Header value, e.g. "tokenize;dur=0.04, decode;dur=11.80, total;dur=12.31"."""
+    parts = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()]
+    if total is not None:
+        parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
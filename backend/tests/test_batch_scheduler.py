@@ -0,0 +1,43 @@
+# backend/tests/test_batch_scheduler.py
+
+import asyncio
+import threading
+import time
+from typing import List
+
+from src.ml.batch_scheduler import MicroBatchScheduler
+from src.ml.bounded_executor import BoundedExecutor
+
+
+class SlowEngine:
+    """Engine double: upper-cases words, slowly enough for batches to queue."""
+
+    def __init__(self) -> None:
+        self.batches: List[int] = []
+        self._lock = threading.Lock()
+
+    def transliterate_batch(self, words: List[str], lang: str) -> List[str]:
+        time.sleep(0.01)
+        with self._lock:
+            self.batches.append(len(words))
+        return [w.upper() for w in words]
+
+
+def test_large_request_on_idle_server_is_not_rejected():
+    # one request with more batches than threads + queue slots
+    workers, queue, batch_size = 1, 0, 8
+    words = [f"w{i}" for i in range((workers + queue) * batch_size * 4 + 1)]
+    engine = SlowEngine()
+
+    async def run():
+        scheduler = MicroBatchScheduler(
+            engine,
+            window_ms=1,
+            max_batch_size=batch_size,
+            executor=BoundedExecutor(max_workers=workers, max_queue=queue),
+        )
+        return await scheduler.transliterate_batch(words, "hi")
+
+    assert asyncio.run(run()) == [w.upper() for w in words]
+    assert sum(engine.batches) == len(words)
+    assert max(engine.batches) <= batch_size
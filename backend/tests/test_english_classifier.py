@@ -0,0 +1,73 @@
+# backend/tests/test_english_classifier.py
+
+import random
+
+import numpy as np
+import pytest
+
+from src.ml.english_classifier import (
+    EnglishClassifier,
+    train_trigram_table,
+    trigram_buckets,
+    write_english_classifier,
+)
+
+ENGLISH = ["the", "where", "school", "laptop", "meeting", "weather", "through"]
+ROMANIZED = ["namaste", "bharat", "kaise", "ghar", "dost", "accha", "bahut"]
+N_BUCKETS = 1 << 10
+
+
+def random_words(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice("qxzjvk") for _ in range(rng.randint(6, 10)))
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture(scope="module")
+def built(tmp_path_factory):
+    path = tmp_path_factory.mktemp("clf") / "english_classifier.bin"
+    table = train_trigram_table(ENGLISH, ROMANIZED, n_buckets=N_BUCKETS)
+    lexicon = ENGLISH + random_words(2000, seed=1)
+    n = write_english_classifier(lexicon, table, 0.25, path, fp_rate=0.01)
+    assert n == len(set(lexicon))
+    return EnglishClassifier(path), table, lexicon
+
+
+def test_round_trip_header_and_table(built):
+    classifier, table, _ = built
+    assert classifier.n_buckets == N_BUCKETS
+    assert classifier.threshold == 0.25
+    for word in ENGLISH + ROMANIZED:
+        buckets = trigram_buckets(word, N_BUCKETS)
+        expected = float(np.mean([table[b] for b in buckets], dtype=np.float64))
+        assert classifier.score(word) == pytest.approx(expected)
+
+
+def test_bloom_hits_and_misses(built):
+    classifier, _, lexicon = built
+    # a Bloom filter has no false negatives, and keys are lower-cased
+    assert all(classifier.in_lexicon(w) for w in lexicon)
+    assert classifier.in_lexicon("School")
+    assert classifier.in_lexicon("WEATHER")
+    unseen = [w for w in random_words(2000, seed=2) if w not in set(lexicon)]
+    false_positives = sum(classifier.in_lexicon(w) for w in unseen)
+    assert false_positives < 0.05 * len(unseen)
+
+
+def test_is_english(built):
+    classifier, _, _ = built
+    assert classifier.is_english("meeting")
+    # known romanized spellings skip the filter and go by trigram score
+    assert classifier.is_english("meeting", romanized_known=True) == (
+        classifier.score("meeting") > classifier.threshold
+    )
+    assert not classifier.is_english("namaste")
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "bad_classifier.bin"
+    path.write_bytes(b"NOTACLASSIFIER" + bytes(64))
+    with pytest.raises(ValueError):
+        EnglishClassifier(path)
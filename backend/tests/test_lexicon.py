@@ -0,0 +1,52 @@
+# backend/tests/test_lexicon.py
+
+import pytest
+
+from src.ml.lexicon import Lexicon, write_lexicon
+
+ENTRIES = [
+    ("Namaste", "नमस्ते"),
+    (" bharat ", "भारत"),
+    ("ghar", "घर"),
+    ("dost", "दोस्त"),
+    ("kaise", "कैसे"),
+    ("ho", "हो"),
+]
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "hi_lexicon.bin"
+    assert write_lexicon(ENTRIES, path) == len(ENTRIES)
+
+    lexicon = Lexicon(path)
+    assert len(lexicon) == len(ENTRIES)
+    for roman, native in ENTRIES:
+        assert lexicon.get(roman) == native
+    # keys are stripped and lower-cased on both sides
+    assert lexicon.get("namaste") == "नमस्ते"
+    assert lexicon.get("  BHARAT") == "भारत"
+    # misses: prefixes, extensions, and words sorting before/after every key
+    for word in ["", "a", "namast", "namastee", "ghr", "zzz"]:
+        assert lexicon.get(word) is None
+    assert lexicon.lookup(["ghar", "nope", "HO"]) == ["घर", None, "हो"]
+    lexicon.close()
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "empty_lexicon.bin"
+    assert write_lexicon([], path) == 0
+    lexicon = Lexicon(path)
+    assert len(lexicon) == 0
+    assert lexicon.get("ghar") is None
+
+
+def test_duplicate_keys_after_normalisation(tmp_path):
+    with pytest.raises(ValueError):
+        write_lexicon([("Ghar", "घर"), ("ghar ", "घर")], tmp_path / "dup.bin")
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "bad_lexicon.bin"
+    path.write_bytes(b"NOTALEXICON" + bytes(64))
+    with pytest.raises(ValueError):
+        Lexicon(path)
@@ -0,0 +1,90 @@
+# backend/tests/test_prefix_index.py
+
+import random
+from typing import List, Tuple
+
+import pytest
+
+from src.ml.prefix_index import PrefixIndex, write_prefix_index
+
+TOP_K = 5
+SCAN_LIMIT = 16
+
+
+def make_entries(n: int = 3000) -> List[Tuple[str, str, int]]:
+    # a small alphabet gives deep, crowded prefix ranges
+    rng = random.Random(0)
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice("abcd") for _ in range(rng.randint(1, 8))))
+    return [(w, w.upper(), rng.randint(0, 50)) for w in sorted(words)]
+
+
+def brute_force(entries, prefix: str, limit: int) -> List[Tuple[str, str, int]]:
+    matches = [e for e in entries if e[0].startswith(prefix)]
+    matches.sort(key=lambda e: (-e[2], len(e[0]), e[0]))
+    return matches[:limit]
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    path = tmp_path_factory.mktemp("prefix") / "hi_prefix.bin"
+    write_prefix_index(make_entries(), path, top_k=TOP_K, scan_limit=SCAN_LIMIT)
+    return PrefixIndex(path)
+
+
+def test_round_trip_header(index):
+    assert len(index) == 3000
+    assert index.top_k == TOP_K
+    assert index.scan_limit == SCAN_LIMIT
+
+
+def test_complete_matches_brute_force(index):
+    entries = make_entries()
+    prefixes = sorted({w[:n] for w, _, _ in entries for n in range(1, 5)})
+    scanned = hot = 0
+    for prefix in prefixes:
+        size = sum(w.startswith(prefix) for w, _, _ in entries)
+        if size <= SCAN_LIMIT:
+            scanned += 1
+        else:
+            hot += 1
+        for limit in (1, 3, TOP_K):
+            assert index.complete(prefix, limit) == brute_force(
+                entries, prefix, limit
+            ), (prefix, limit)
+    # both the on-the-fly scan and the precomputed top lists were exercised
+    assert scanned and hot
+
+
+def test_scan_path_past_top_k(index):
+    # small ranges are ranked on the fly, so limit isn't capped at top_k
+    entries = make_entries()
+    prefix = next(
+        w
+        for w, _, _ in entries
+        if TOP_K < sum(e[0].startswith(w) for e in entries) <= SCAN_LIMIT
+    )
+    assert index.complete(prefix, SCAN_LIMIT) == brute_force(
+        entries, prefix, SCAN_LIMIT
+    )
+
+
+def test_normalised_and_empty_queries(index):
+    assert index.complete(" ABC ", TOP_K) == index.complete("abc", TOP_K)
+    assert index.complete("", TOP_K) == []
+    assert index.complete("abc", 0) == []
+    assert index.complete("e", TOP_K) == []
+    assert index.complete("aaaaaaaaa", TOP_K) == []
+
+
+def test_duplicate_keys_after_normalisation(tmp_path):
+    with pytest.raises(ValueError):
+        write_prefix_index([("Ghar", "घर", 1), ("ghar", "घर", 2)], tmp_path / "d.bin")
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "bad_prefix.bin"
+    path.write_bytes(b"NOTANINDEX" + bytes(64))
+    with pytest.raises(ValueError):
+        PrefixIndex(path)
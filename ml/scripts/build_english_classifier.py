@@ -0,0 +1,126 @@
+# ml/scripts/build_english_classifier.py
+
+"""
+Build data/models/english_classifier.bin for MIX mode
+(see backend/src/ml/english_classifier.py):
+
+- Bloom filter over an English word list (--english, one word per line;
+  extra TAB-separated columns such as counts are ignored)
+- character-trigram log-odds table, English vs the roman side of the
+  processed Aksharantar JSONL for all languages
+- decision threshold picked on a held-out slice of both word sets
+
+Usage (from the project root, after preprocess_aksharantar.py):
+    python ml/scripts/build_english_classifier.py --english data/raw/english_words.txt
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from pathlib import Path
+from typing import List, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+
+from src.ml.english_classifier import (  # noqa: E402
+    DEFAULT_BUCKETS,
+    DEFAULT_FP_RATE,
+    best_threshold,
+    train_trigram_table,
+    trigram_buckets,
+    write_english_classifier,
+)
+
+PRO_DIR = "data/processed"
+MODEL_DIR = "data/models"
+
+LANGS = ["hi", "te", "ta", "kn", "ml", "mr", "bn", "gu", "pa"]
+
+
+def load_english(path: str) -> Set[str]:
+    words = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            word = line.split("\t")[0].strip().lower()
+            if word.isascii() and word.isalpha():
+                words.add(word)
+    return words
+
+
+def load_romanized(langs: List[str], splits: List[str]) -> Set[str]:
+    words = set()
+    for lang in langs:
+        for split in splits:
+            path = os.path.join(PRO_DIR, f"aksharantar_{lang}_{split}.jsonl")
+            if not os.path.exists(path):
+                print(f"   ⚠ Missing {path}")
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        word = json.loads(line).get("en", "").strip().lower()
+                        if word:
+                            words.add(word)
+    return words
+
+
+def mean_score(table, word: str) -> float:
+    buckets = trigram_buckets(word, len(table))
+    return float(table[buckets].mean())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the MIX-mode English classifier"
+    )
+    parser.add_argument("--english", required=True, help="English word list")
+    parser.add_argument("--langs", nargs="+", default=LANGS)
+    parser.add_argument("--splits", nargs="+", default=["train", "val"])
+    parser.add_argument("--out-dir", default=MODEL_DIR)
+    parser.add_argument("--buckets", type=int, default=DEFAULT_BUCKETS)
+    parser.add_argument("--fp-rate", type=float, default=DEFAULT_FP_RATE)
+    parser.add_argument("--holdout", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("🚀 Building English classifier...")
+    english = load_english(args.english)
+    romanized = load_romanized(args.langs, args.splits)
+    print(f"   English words: {len(english)}, romanized words: {len(romanized)}")
+    if not english or not romanized:
+        print("❌ Need both word sets, aborting.")
+        return
+
+    # words in both sets are ambiguous; they teach the n-gram model nothing
+    shared = english & romanized
+    en_only = sorted(english - shared)
+    ro_only = sorted(romanized - shared)
+    rng = random.Random(args.seed)
+    rng.shuffle(en_only)
+    rng.shuffle(ro_only)
+    n_en = int(len(en_only) * args.holdout)
+    n_ro = int(len(ro_only) * args.holdout)
+
+    table = train_trigram_table(en_only[n_en:], ro_only[n_ro:], args.buckets)
+    held_out = [(mean_score(table, w), True) for w in en_only[:n_en]]
+    held_out += [(mean_score(table, w), False) for w in ro_only[:n_ro]]
+    threshold = best_threshold(held_out)
+    if held_out:
+        correct = sum((score > threshold) == is_en for score, is_en in held_out)
+        print(
+            f"   Threshold {threshold:.3f}: held-out accuracy "
+            f"{correct / len(held_out):.2%} ({len(held_out)} words, "
+            f"{len(shared)} ambiguous skipped)"
+        )
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    out_path = Path(args.out_dir) / "english_classifier.bin"
+    n = write_english_classifier(english, table, threshold, out_path, args.fp_rate)
+    size_mb = out_path.stat().st_size / 1e6
+    print(f"✅ Saved {out_path} ({n} English words, {size_mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
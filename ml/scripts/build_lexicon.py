@@ -0,0 +1,121 @@
+# ml/scripts/build_lexicon.py
+
+"""
+Compile Aksharantar (english, native) pairs into per-language lookup files:
+- data/models/<lang>_lexicon.bin: exact-match lexicon (backend/src/ml/lexicon.py)
+- data/models/<lang>_prefix.bin: autocomplete index (backend/src/ml/prefix_index.py)
+
+- Keys are lowercased roman words; when a key has several native
+  spellings, the most frequent one is kept (ties: first seen)
+- Autocomplete ranks words by how often their roman key occurs
+- By default reads the processed train + val JSONL, so the test split
+  still measures the model; --raw reads the full raw TSV instead
+
+Usage (from the project root, after preprocess_aksharantar.py):
+    python ml/scripts/build_lexicon.py
+    python ml/scripts/build_lexicon.py --langs hi te --raw
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+
+from src.ml.lexicon import normalize_key, write_lexicon  # noqa: E402
+from src.ml.prefix_index import (  # noqa: E402
+    DEFAULT_TOP_K,
+    write_prefix_index,
+)
+
+RAW_DIR = "data/raw"
+PRO_DIR = "data/processed"
+MODEL_DIR = "data/models"
+
+LANGS = ["hi", "te", "ta", "kn", "ml", "mr", "bn", "gu", "pa"]
+
+
+def iter_pairs(lang: str, raw: bool, splits: List[str]) -> Iterator[Tuple[str, str]]:
+    if raw:
+        paths = [os.path.join(RAW_DIR, f"aksharantar_{lang}.tsv")]
+    else:
+        paths = [
+            os.path.join(PRO_DIR, f"aksharantar_{lang}_{split}.jsonl")
+            for split in splits
+        ]
+
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"   ⚠ Missing {path}")
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if raw:
+                    parts = line.split("\t")
+                    if len(parts) != 2:
+                        continue
+                    en, native = parts
+                else:
+                    item = json.loads(line)
+                    en, native = item.get("en", ""), item.get("native", "")
+                en, native = normalize_key(en), native.strip()
+                if en and native:
+                    yield en, native
+
+
+def most_frequent(pairs: Iterator[Tuple[str, str]]) -> Dict[str, Tuple[str, int]]:
+    """
+    (most frequent native form, total occurrences) per key; Counter keeps
+    first-seen order on ties.
+    """
+    counts: Dict[str, Counter] = defaultdict(Counter)
+    for en, native in pairs:
+        counts[en][native] += 1
+    return {en: (c.most_common(1)[0][0], sum(c.values())) for en, c in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build lexicons and prefix indexes")
+    parser.add_argument("--langs", nargs="+", default=LANGS)
+    parser.add_argument(
+        "--raw", action="store_true", help="Read data/raw TSVs (includes test pairs)"
+    )
+    parser.add_argument("--splits", nargs="+", default=["train", "val"])
+    parser.add_argument("--out-dir", default=MODEL_DIR)
+    parser.add_argument(
+        "--top-k", type=int, default=DEFAULT_TOP_K, help="Suggestions kept per prefix"
+    )
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    print("🚀 Building lexicons and prefix indexes...")
+
+    for lang in args.langs:
+        print(f"\n📂 Language: {lang}")
+        lexicon = most_frequent(iter_pairs(lang, args.raw, args.splits))
+        if not lexicon:
+            print(f"   ⚠ No pairs for {lang}, skipping.")
+            continue
+        out_path = Path(args.out_dir) / f"{lang}_lexicon.bin"
+        n = write_lexicon(((en, nat) for en, (nat, _) in lexicon.items()), out_path)
+        size_mb = out_path.stat().st_size / 1e6
+        print(f"   ✅ Saved {out_path} ({n} entries, {size_mb:.1f} MB)")
+
+        out_path = Path(args.out_dir) / f"{lang}_prefix.bin"
+        entries = ((en, nat, count) for en, (nat, count) in lexicon.items())
+        write_prefix_index(entries, out_path, top_k=args.top_k)
+        size_mb = out_path.stat().st_size / 1e6
+        print(f"   ✅ Saved {out_path} ({size_mb:.1f} MB)")
+
+    print("\n🎉 Lexicons and prefix indexes built!")
+
+
+if __name__ == "__main__":
+    main()
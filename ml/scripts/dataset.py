@@ -1,13 +1,19 @@
 import json
+import sys
+from pathlib import Path
+
 import torch
 from torch.utils.data import Dataset
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+from src.ml.char_codec import CharCodec  # noqa: E402
+
 
 class TransliterationDataset(Dataset):
     def __init__(self, jsonl_path: str, src_vocab, trg_vocab, max_len=40):
         self.samples = []
-        self.src_vocab = src_vocab
-        self.trg_vocab = trg_vocab
+        self.src_codec = CharCodec(src_vocab, max_len=max_len)
+        self.trg_codec = CharCodec(trg_vocab, max_len=max_len)
         self.max_len = max_len
 
         with open(jsonl_path, "r", encoding="utf-8") as f:
@@ -17,19 +23,27 @@ class TransliterationDataset(Dataset):
                 trg = obj["trg"]
                 self.samples.append((src, trg))
 
-    def encode_text(self, text, vocab):
-        ids = [vocab["<sos>"]]
-        for ch in text[: self.max_len - 2]:
-            ids.append(vocab.get(ch, vocab["<unk>"]))
-        ids.append(vocab["<eos>"])
-        return ids
-
     def __len__(self):
         return len(self.samples)
 
     def __getitem__(self, idx):
-        src, trg = self.samples[idx]
-        src_ids = self.encode_text(src, self.src_vocab)
-        trg_ids = self.encode_text(trg, self.trg_vocab)
+        # raw text; encoding happens once per batch in collate()
+        return self.samples[idx]
+
+    @staticmethod
+    def _encode(codec, texts):
+        lengths = codec.lengths(texts)
+        ids = torch.empty((len(texts), int(lengths.max())), dtype=torch.long)
+        codec.encode_batch(texts, width=ids.size(1), out=ids.numpy())
+        return ids, torch.from_numpy(lengths)
 
-        return torch.tensor(src_ids), torch.tensor(trg_ids)
+    def collate(self, batch):
+        """
+        collate_fn for DataLoader: encodes the whole batch with one
+        encode_batch call per side, padded to its longest item.
+        Returns (srcs, src_lengths, trgs).
+        """
+        srcs, trgs = zip(*batch)
+        srcs, src_lengths = self._encode(self.src_codec, srcs)
+        trgs, _ = self._encode(self.trg_codec, trgs)
+        return srcs, src_lengths, trgs
@@ -1,5 +1,8 @@
+from typing import Optional
+
 import torch
 import torch.nn as nn
+from torch.nn.utils.rnn import pack_padded_sequence, pad_packed_sequence
 
 
 class Encoder(nn.Module):
@@ -13,16 +16,26 @@ class Encoder(nn.Module):
             bidirectional=True,
         )
 
-    def forward(self, src: torch.Tensor):
+    def forward(self, src: torch.Tensor, src_lengths: Optional[torch.Tensor] = None):
         """
         src: (batch, src_len)
+        src_lengths: (batch,) real lengths; when given, padding is packed away
         returns:
           encoder_outputs: (batch, src_len, hid_dim * 2)
           hidden: (1, batch, hid_dim)
           cell:   (1, batch, hid_dim)
         """
         embedded = self.embedding(src)  # (batch, src_len, emb_dim)
-        outputs, (hidden, cell) = self.rnn(embedded)
+        if src_lengths is None:
+            outputs, (hidden, cell) = self.rnn(embedded)
+        else:
+            packed = pack_padded_sequence(
+                embedded, src_lengths.cpu(), batch_first=True, enforce_sorted=False
+            )
+            packed_outputs, (hidden, cell) = self.rnn(packed)
+            outputs, _ = pad_packed_sequence(
+                packed_outputs, batch_first=True, total_length=src.size(1)
+            )
         # hidden, cell: (2, batch, hid_dim) -> fw + bw
         hidden = hidden[0] + hidden[1]  # (batch, hid_dim)
         cell = cell[0] + cell[1]  # (batch, hid_dim)
@@ -41,10 +54,16 @@ class Attention(nn.Module):
         self.attn = nn.Linear(hid_dim * 3, hid_dim)
         self.v = nn.Linear(hid_dim, 1, bias=False)
 
-    def forward(self, hidden: torch.Tensor, encoder_outputs: torch.Tensor):
+    def forward(
+        self,
+        hidden: torch.Tensor,
+        encoder_outputs: torch.Tensor,
+        mask: Optional[torch.Tensor] = None,
+    ):
         """
         hidden: (1, batch, hid_dim)
         encoder_outputs: (batch, src_len, hid_dim*2)
+        mask: (batch, src_len), True for real (non-pad) positions
         returns:
           attn_weights: (batch, src_len)
         """
@@ -64,6 +83,10 @@ class Attention(nn.Module):
         # project to scalar
         attention = self.v(energy).squeeze(2)  # (batch, src_len)
 
+        # padded positions get no attention weight
+        if mask is not None:
+            attention = attention.masked_fill(~mask, -1e10)
+
         return torch.softmax(attention, dim=1)
 
 
@@ -87,18 +110,20 @@ class Decoder(nn.Module):
         hidden: torch.Tensor,
         cell: torch.Tensor,
         encoder_outputs: torch.Tensor,
+        mask: Optional[torch.Tensor] = None,
     ):
         """
         input: (batch,)
         hidden: (1, batch, hid_dim)
         cell:   (1, batch, hid_dim)
         encoder_outputs: (batch, src_len, hid_dim*2)
+        mask: (batch, src_len), True for real (non-pad) positions
         """
         # input -> (batch, 1)
         input = input.unsqueeze(1)
         embedded = self.embedding(input)  # (batch, 1, emb_dim)
 
-        attn_weights = self.attention(hidden, encoder_outputs)  # (batch, src_len)
+        attn_weights = self.attention(hidden, encoder_outputs, mask)  # (batch, src_len)
         attn_weights = attn_weights.unsqueeze(1)  # (batch, 1, src_len)
 
         context = torch.bmm(attn_weights, encoder_outputs)  # (batch, 1, hid_dim*2)
@@ -128,14 +153,24 @@ class Seq2Seq(nn.Module):
         self.decoder = decoder
         self.device = device
 
-    def forward(self, src: torch.Tensor, trg: torch.Tensor):
+    def forward(
+        self,
+        src: torch.Tensor,
+        trg: torch.Tensor,
+        src_lengths: Optional[torch.Tensor] = None,
+    ):
         """
         src: (batch, src_len)
         trg: (batch, trg_len)
+        src_lengths: (batch,) real source lengths, enables packing + masking
         returns:
           outputs: (batch, trg_len-1, vocab_size)
         """
-        encoder_outputs, hidden, cell = self.encoder(src)
+        encoder_outputs, hidden, cell = self.encoder(src, src_lengths)
+        mask = None
+        if src_lengths is not None:
+            positions = torch.arange(src.size(1), device=src.device)
+            mask = positions.unsqueeze(0) < src_lengths.to(src.device).unsqueeze(1)
 
         batch_size = src.size(0)
         trg_len = trg.size(1)
@@ -147,7 +182,9 @@ class Seq2Seq(nn.Module):
         input = trg[:, 0]  # (batch,)
 
         for t in range(1, trg_len):
-            output, hidden, cell = self.decoder(input, hidden, cell, encoder_outputs)
+            output, hidden, cell = self.decoder(
+                input, hidden, cell, encoder_outputs, mask
+            )
             outputs[:, t - 1, :] = output
             # teacher forcing: next input = next token in target
             input = trg[:, t]
@@ -1,5 +1,8 @@
 import os
+import sys
 import json
+from pathlib import Path
+
 import torch
 import torch.nn as nn
 from torch.utils.data import Dataset, DataLoader
@@ -7,6 +10,17 @@ from tqdm import tqdm
 
 from model import Encoder, Attention, Decoder, Seq2Seq
 
+# the char codec is shared with the backend so training and serving encode
+# text identically
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+from src.ml.char_codec import (  # noqa: E402
+    CharCodec,
+    PAD_TOKEN,
+    SOS_TOKEN,
+    EOS_TOKEN,
+    UNK_TOKEN,
+)
+
 # -----------------------
 # CONFIG
 # -----------------------
@@ -23,11 +37,6 @@ HID_DIM = 256
 DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 print("Using device:", DEVICE)
 
-PAD_TOKEN = "<pad>"
-SOS_TOKEN = "<sos>"
-EOS_TOKEN = "<eos>"
-UNK_TOKEN = "<unk>"
-
 
 # -----------------------
 # LOADING PAIRS
@@ -74,47 +83,47 @@ def build_char_vocab(pairs):
     return char2idx, idx2char
 
 
-def encode_text(text, char2idx, max_len=40):
-    """
-    Turn text into [<sos>, chars..., <eos>] ids, truncated to max_len.
-    """
-    ids = [char2idx[SOS_TOKEN]]
-    for ch in text:
-        ids.append(char2idx.get(ch, char2idx[UNK_TOKEN]))
-        if len(ids) >= max_len - 1:
-            break
-    ids.append(char2idx[EOS_TOKEN])
-    if len(ids) < max_len:
-        ids += [char2idx[PAD_TOKEN]] * (max_len - len(ids))
-    return ids[:max_len]
-
-
 # -----------------------
 # DATASET
 # -----------------------
 class TransliterationDataset(Dataset):
-    def __init__(self, pairs, char2idx, max_len=40):
+    """
+    Raw (src, trg) strings; encoding happens a whole batch at a time in
+    BatchCollator.
+    """
+
+    def __init__(self, pairs):
         self.pairs = pairs
-        self.char2idx = char2idx
-        self.max_len = max_len
 
     def __len__(self):
         return len(self.pairs)
 
     def __getitem__(self, idx):
         item = self.pairs[idx]
-        src_ids = encode_text(item["src"], self.char2idx, self.max_len)
-        trg_ids = encode_text(item["trg"], self.char2idx, self.max_len)
-        return torch.tensor(src_ids, dtype=torch.long), torch.tensor(
-            trg_ids, dtype=torch.long
-        )
+        return item["src"], item["trg"]
+
+
+class BatchCollator:
+    """
+    Encode a batch with the shared CharCodec straight into preallocated
+    tensors, padded to the longest item in the batch (not MAX_LEN).
+    Returns (srcs, src_lengths, trgs).
+    """
+
+    def __init__(self, codec: CharCodec):
+        self.codec = codec
 
+    def _encode(self, texts):
+        lengths = self.codec.lengths(texts)
+        ids = torch.empty((len(texts), int(lengths.max())), dtype=torch.long)
+        self.codec.encode_batch(texts, width=ids.size(1), out=ids.numpy())
+        return ids, torch.from_numpy(lengths)
 
-def collate_batch(batch):
-    srcs, trgs = zip(*batch)
-    srcs = torch.stack(srcs, dim=0)
-    trgs = torch.stack(trgs, dim=0)
-    return srcs, trgs
+    def __call__(self, batch):
+        srcs, trgs = zip(*batch)
+        srcs, src_lengths = self._encode(srcs)
+        trgs, _ = self._encode(trgs)
+        return srcs, src_lengths, trgs
 
 
 # -----------------------
@@ -144,8 +153,9 @@ def train():
         json.dump(idx2char, f, ensure_ascii=False)
 
     # 3) Datasets + loaders
-    train_ds = TransliterationDataset(train_pairs, char2idx, MAX_LEN)
-    val_ds = TransliterationDataset(val_pairs, char2idx, MAX_LEN)
+    train_ds = TransliterationDataset(train_pairs)
+    val_ds = TransliterationDataset(val_pairs)
+    collate_batch = BatchCollator(CharCodec(char2idx, idx2char, MAX_LEN))
 
     train_loader = DataLoader(
         train_ds,
@@ -175,12 +185,12 @@ def train():
         total_loss = 0.0
 
         print(f"\nEpoch {epoch}/{EPOCHS}")
-        for src, trg in tqdm(train_loader):
+        for src, src_lengths, trg in tqdm(train_loader):
             src = src.to(DEVICE)
             trg = trg.to(DEVICE)
 
             optimizer.zero_grad()
-            outputs = model(src, trg)  # (batch, trg_len-1, vocab_size)
+            outputs = model(src, trg, src_lengths)  # (batch, trg_len-1, vocab_size)
 
             # Flatten
             logits = outputs.reshape(-1, vocab_size)
@@ -200,6 +210,16 @@ def train():
     torch.save(model.state_dict(), save_path)
     print(f"\n✅ Saved model to: {save_path}")
 
+    # tells the backend this checkpoint expects packed inputs + masked attention
+    meta = {
+        "variable_length": True,
+        "max_len": MAX_LEN,
+        "emb_dim": EMB_DIM,
+        "hid_dim": HID_DIM,
+    }
+    with open(f"data/models/{LANG}_meta.json", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
 
 if __name__ == "__main__":
     train()
@@ -0,0 +1,292 @@
+# ml/scripts/transliterate_corpus.py
+
+"""
+Offline, multi-core transliteration of large corpora (no HTTP).
+
+- Input: plain text (every whitespace token), TSV (one column) or JSONL
+  (one field); the format is taken from the file extension unless
+  --format is given
+- The input is cut into shards of --shard-lines lines, which a process
+  pool decodes in parallel with LoadedTranslitModel directly
+- Inside a shard, unique words are sorted by length and decoded in large
+  batches, so each batch needs very little padding
+- Every finished shard is written to <output>.parts/ atomically; rerunning
+  the same command skips finished shards, so a crash only costs the
+  shards that were in flight (the parts are removed once merged)
+- Progress shows words/sec over all workers
+
+Usage (from the project root, like the other scripts):
+    python ml/scripts/transliterate_corpus.py corpus.txt out.txt --lang hi
+    python ml/scripts/transliterate_corpus.py words.tsv out.tsv --lang te --column 0
+    python ml/scripts/transliterate_corpus.py data.jsonl out.jsonl --lang hi \\
+        --field en --out-field pred --workers 8
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tqdm import tqdm
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+
+FORMATS = ("text", "tsv", "jsonl")
+
+# per-process state, set by init_worker
+_model = None
+_args = None
+
+
+# -----------------------
+# SHARDING
+# -----------------------
+def shard_offsets(path: Path, shard_lines: int) -> List[Tuple[int, int]]:
+    """
+    (byte offset, line count) of every shard, from one pass over the file.
+    Workers seek straight to their shard, so nothing is loaded up front.
+    """
+    shards = []
+    start, count, pos = 0, 0, 0
+    with path.open("rb") as f:
+        for line in f:
+            pos += len(line)
+            count += 1
+            if count == shard_lines:
+                shards.append((start, count))
+                start, count = pos, 0
+    if count:
+        shards.append((start, count))
+    return shards
+
+
+def read_shard(path: Path, offset: int, n_lines: int) -> List[str]:
+    with path.open("rb") as f:
+        f.seek(offset)
+        return [
+            f.readline().decode("utf-8", errors="replace").rstrip("\r\n")
+            for _ in range(n_lines)
+        ]
+
+
+def part_path(parts_dir: Path, index: int) -> Path:
+    return parts_dir / f"shard_{index:06d}.part"
+
+
+# -----------------------
+# PER-FORMAT TEXT ACCESS
+# -----------------------
+def line_text(line: str, args) -> Optional[str]:
+    """The text to transliterate in one input line (None: pass through)."""
+    if args.format == "text":
+        return line
+    if args.format == "tsv":
+        cols = line.split("\t")
+        return cols[args.column] if args.column < len(cols) else None
+    if not line.strip():
+        return None
+    try:
+        value = json.loads(line).get(args.field)
+    except (ValueError, AttributeError):
+        return None
+    return value if isinstance(value, str) else None
+
+
+def output_line(line: str, text: Optional[str], converted: Optional[str], args) -> str:
+    if args.format == "text":
+        return converted if converted is not None else line
+    if args.format == "tsv":
+        return f"{line}\t{converted if converted is not None else ''}"
+    if text is None:
+        return line
+    obj = json.loads(line)
+    obj[args.out_field] = converted
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# -----------------------
+# WORKERS
+# -----------------------
+def load_model(args):
+    from src.ml.transliteration_inference import TransliterationEngine
+
+    engine = TransliterationEngine(args.model_dir, workers=0)
+    model = engine.build_lang_model(
+        args.lang, precision=args.precision, backend=args.backend
+    )
+    if model is None:
+        raise SystemExit(f"❌ No model files for '{args.lang}' in {engine.model_dir}")
+    return model
+
+
+def init_worker(args) -> None:
+    global _model, _args
+    import torch
+
+    torch.set_num_threads(max(1, args.threads))
+    _model = load_model(args)
+    _args = args
+
+
+def transliterate_words(words: List[str]) -> Dict[str, str]:
+    """Decode unique words shortest-first in --batch-size batches."""
+    ordered = sorted(set(words), key=len)
+    out: Dict[str, str] = {}
+    for i in range(0, len(ordered), _args.batch_size):
+        batch = ordered[i : i + _args.batch_size]
+        out.update(zip(batch, _model.transliterate_batch(batch)))
+    return out
+
+
+def run_shard(index: int, offset: int, n_lines: int, parts_dir: str) -> Tuple[int, int]:
+    """Transliterate one shard into its part file; returns (index, n_words)."""
+    lines = read_shard(Path(_args.input), offset, n_lines)
+    texts = [line_text(line, _args) for line in lines]
+    tokens = [t.split() if t is not None else [] for t in texts]
+    mapping = transliterate_words([w for toks in tokens for w in toks])
+
+    target = part_path(Path(parts_dir), index)
+    tmp = target.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        for line, text, toks in zip(lines, texts, tokens):
+            converted = " ".join(mapping[w] for w in toks) if text is not None else None
+            f.write(output_line(line, text, converted, _args) + "\n")
+    os.replace(tmp, target)  # a part file only exists once it is complete
+    return index, sum(len(t) for t in tokens)
+
+
+# -----------------------
+# MAIN
+# -----------------------
+def detect_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix == ".tsv":
+        return "tsv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return "text"
+
+
+def check_manifest(parts_dir: Path, args, model) -> None:
+    """
+    Parts from an earlier run are only reused for the same input, model
+    and settings; anything else would splice unrelated shards together.
+    `model.version` is the checkpoint checksum plus the precision or
+    backend it actually runs with (ONNX can fall back to torch).
+    """
+    stat = args.input.stat()
+    manifest = {
+        "input": str(args.input.resolve()),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "lang": args.lang,
+        "model_dir": str(Path(args.model_dir).resolve()),
+        "precision": args.precision,
+        "backend": args.backend,
+        "model_version": model.version,
+        "format": args.format,
+        "column": args.column,
+        "field": args.field,
+        "out_field": args.out_field,
+        "shard_lines": args.shard_lines,
+    }
+    path = parts_dir / "manifest.json"
+    if path.exists():
+        with path.open("r", encoding="utf-8") as f:
+            previous = json.load(f)
+        if previous != manifest:
+            raise SystemExit(
+                f"❌ {parts_dir} belongs to a different run; delete it to start over"
+            )
+    else:
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+
+def merge_parts(parts_dir: Path, n_shards: int, output: Path) -> None:
+    tmp = output.with_name(output.name + ".tmp")
+    with tmp.open("wb") as out:
+        for i in range(n_shards):
+            with part_path(parts_dir, i).open("rb") as part:
+                while True:
+                    chunk = part.read(1 << 20)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+    os.replace(tmp, output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transliterate a corpus offline")
+    parser.add_argument("input", type=Path)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--lang", required=True)
+    parser.add_argument("--format", choices=FORMATS, default=None)
+    parser.add_argument("--column", type=int, default=0, help="TSV column")
+    parser.add_argument("--field", default="en", help="JSONL input field")
+    parser.add_argument("--out-field", default="translit", help="JSONL output field")
+    parser.add_argument("--model-dir", default="data/models")
+    parser.add_argument("--precision", default="fp32")
+    parser.add_argument("--backend", default="torch", choices=("torch", "onnx"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=1, help="torch threads/worker")
+    parser.add_argument("--shard-lines", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=512)
+    args = parser.parse_args()
+    args.format = args.format or detect_format(args.input)
+
+    model = load_model(args)  # fails fast on missing files; pins the checksum
+    parts_dir = args.output.with_name(args.output.name + ".parts")
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    check_manifest(parts_dir, args, model)
+    del model
+
+    shards = shard_offsets(args.input, args.shard_lines)
+    todo = [
+        (i, off, n)
+        for i, (off, n) in enumerate(shards)
+        if not part_path(parts_dir, i).exists()
+    ]
+    print(
+        f"📄 {args.input} ({args.format}): {len(shards)} shards, "
+        f"{len(shards) - len(todo)} already done"
+    )
+
+    words = 0
+    started = time.perf_counter()
+    if todo:
+        ctx = mp.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(args.workers, len(todo))),
+            mp_context=ctx,
+            initializer=init_worker,
+            initargs=(args,),
+        ) as pool:
+            futures = [
+                pool.submit(run_shard, i, off, n, str(parts_dir)) for i, off, n in todo
+            ]
+            with tqdm(total=len(futures), unit="shard") as bar:
+                for fut in as_completed(futures):
+                    _, n_words = fut.result()
+                    words += n_words
+                    elapsed = time.perf_counter() - started
+                    bar.set_postfix(words=words, words_per_s=f"{words / elapsed:,.0f}")
+                    bar.update(1)
+
+    merge_parts(parts_dir, len(shards), args.output)
+    shutil.rmtree(parts_dir)
+    elapsed = time.perf_counter() - started
+    rate = words / elapsed if elapsed > 0 else 0.0
+    print(
+        f"✅ Wrote {args.output}: {words:,} words in {elapsed:.1f}s ({rate:,.0f} words/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
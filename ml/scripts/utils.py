@@ -1,5 +1,10 @@
 import json
 import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+from src.ml.char_codec import CharCodec  # noqa: E402
 
 
 def build_char_vocab(pairs):
@@ -8,7 +13,7 @@ def build_char_vocab(pairs):
         chars.update(list(p["en"]))
         chars.update(list(p["native"]))
 
-    char2idx = {"<pad>": 0, "<sos>": 1, "<eos>": 2}
+    char2idx = {"<pad>": 0, "<sos>": 1, "<eos>": 2, "<unk>": 3}
     for c in sorted(chars):
         char2idx[c] = len(char2idx)
 
@@ -16,10 +21,22 @@ def build_char_vocab(pairs):
     return char2idx, idx2char
 
 
+# (id(char2idx), max_len) -> (char2idx, codec); the vocab is kept so its
+# id can't be reused by another dict while the entry exists
+_codecs = {}
+
+
+def get_codec(char2idx, max_len=40):
+    """Shared CharCodec for a vocab dict (vocabs are not mutated once built)."""
+    key = (id(char2idx), max_len)
+    entry = _codecs.get(key)
+    if entry is None:
+        entry = _codecs[key] = (char2idx, CharCodec(char2idx, max_len=max_len))
+    return entry[1]
+
+
 def encode_text(text, char2idx, max_len=40):
-    seq = ["<sos>"] + list(text)[: max_len - 2] + ["<eos>"]
-    ids = [char2idx.get(c, 0) for c in seq]
-    return ids
+    return get_codec(char2idx, max_len).encode(text)
 
 
 def pad_seq(seq, max_len):